@@ -8,6 +8,7 @@ from typing import Optional
 from .factory import BinanceMethodFactory
 from .exceptions import BinanceAPIException
 from ...lib import AbstractApiClient
+from ....utils import json_loads
 
 
 class BaseBinanceApiClient(AbstractApiClient, abc.ABC):
@@ -60,4 +61,4 @@ class BaseBinanceApiClient(AbstractApiClient, abc.ABC):
     def handle_response(response: httpx.Response) -> dict:
         if not (200 <= response.status_code < 300):
             raise BinanceAPIException(response)
-        return response.json()
+        return json_loads(response.content)
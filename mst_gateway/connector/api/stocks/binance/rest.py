@@ -432,6 +432,22 @@ class BinanceRestApi(StockRestApi):
             min_volume_buy: float = None,
             min_volume_sell: float = None,
     ):
+        limit = var.BINANCE_MAX_ORDER_BOOK_LIMIT
+        if min_volume_buy is None and min_volume_sell is None:
+            if depth:
+                for _l in [100, 500, 1000]:
+                    if _l >= offset + depth:
+                        limit = _l
+                        break
+        data = self.get_order_book_snapshot(symbol, schema, limit)
+        data = utils.filter_order_book_data(data, min_volume_buy, min_volume_sell)
+        state_data = self.storage.get(f"{StateStorageKey.symbol}.{self.name}.{schema}").get(symbol.lower(), {})
+        return utils.load_order_book_data(data, symbol, side, split, offset, depth, state_data)
+
+    def get_order_book_snapshot(self, symbol: str, schema: str, limit: int = None) -> dict:
+        """
+        Raw depth snapshot with its `lastUpdateId`
+        """
         schema_handlers = {
             OrderSchema.exchange: self._handler.get_order_book,
             OrderSchema.margin_cross: self._handler.get_margin_order_book,
@@ -440,21 +456,11 @@ class BinanceRestApi(StockRestApi):
             OrderSchema.margin_coin: self._handler.get_futures_coin_order_book,
         }
         validate_schema(schema, schema_handlers)
-        limit = var.BINANCE_MAX_ORDER_BOOK_LIMIT
-        if min_volume_buy is None and min_volume_sell is None:
-            if depth:
-                for _l in [100, 500, 1000]:
-                    if _l >= offset + depth:
-                        limit = _l
-                        break
-        data = self._binance_api(
+        return self._binance_api(
             schema_handlers[schema.lower()],
             symbol=symbol.upper(),
-            limit=limit,
+            limit=limit or var.BINANCE_MAX_ORDER_BOOK_LIMIT,
         )
-        data = utils.filter_order_book_data(data, min_volume_buy, min_volume_sell)
-        state_data = self.storage.get(f"{StateStorageKey.symbol}.{self.name}.{schema}").get(symbol.lower(), {})
-        return utils.load_order_book_data(data, symbol, side, split, offset, depth, state_data)
 
     def get_wallet(self, **kwargs) -> dict:
         schema = kwargs.pop('schema', '').lower()
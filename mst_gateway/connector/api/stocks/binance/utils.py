@@ -5,7 +5,7 @@ from mst_gateway.connector import api
 from mst_gateway.calculator import BinanceFinFactory
 from mst_gateway.connector.api.types.order import LeverageType, OrderSchema, PositionSide, PositionMode
 from mst_gateway.utils import delta
-from ...utils import time2timestamp
+from ...utils import load_symbol_state_fragment, parse_iso_datetime, time2timestamp, timestamp2iso
 from .....exceptions import ConnectorError
 from . import var
 from .converter import BinanceOrderTypeConverter
@@ -855,7 +855,7 @@ def to_exchange_asset(asset: str, schema: str):
     return asset
 
 
-def load_trade_ws_data(raw_data: dict, state_data: Optional[dict]) -> dict:
+def load_trade_ws_data(raw_data: dict, state_data: Optional[dict], epoch_ms: bool = False) -> dict:
     """
     {
         "e":"trade",
@@ -872,7 +872,7 @@ def load_trade_ws_data(raw_data: dict, state_data: Optional[dict]) -> dict:
     }
     """
     data = {
-        'tm': to_iso_datetime(raw_data.get('E')),
+        'tm': load_ws_time(raw_data.get('E'), epoch_ms),
         'p': to_float(raw_data.get('p')),
         'vl': to_float(raw_data.get('q')),
         'sd': load_order_side(raw_data.get('m')),
@@ -885,7 +885,21 @@ def load_trade_ws_data(raw_data: dict, state_data: Optional[dict]) -> dict:
     return data
 
 
-def load_quote_bin_ws_data(raw_data: dict, state_data: Optional[dict]) -> dict:
+def load_trade_ws_columns(columns: dict, raw_data: dict, state_data: Optional[dict], epoch_ms: bool = False) -> None:
+    """
+    Appends the fields of `load_trade_ws_data` to the lists of `columns`
+    without building a record, `ss` only if `columns` has it
+    """
+    columns['tm'].append(load_ws_time(raw_data.get('E'), epoch_ms))
+    columns['p'].append(to_float(raw_data.get('p')))
+    columns['vl'].append(to_float(raw_data.get('q')))
+    columns['sd'].append(load_order_side(raw_data.get('m')))
+    columns['s'].append(raw_data.get('s'))
+    if 'ss' in columns:
+        columns['ss'].append(state_data.get('system_symbol') if isinstance(state_data, dict) else None)
+
+
+def load_quote_bin_ws_data(raw_data: dict, state_data: Optional[dict], epoch_ms: bool = False) -> dict:
     """
     {
       "e": "kline",     // Event type
@@ -915,7 +929,7 @@ def load_quote_bin_ws_data(raw_data: dict, state_data: Optional[dict]) -> dict:
     raw_data = raw_data.get('k', {})
     _timestamp = raw_data.get('t')
     data = {
-        'tm': to_iso_datetime(_timestamp),
+        'tm': load_ws_time(_timestamp, epoch_ms),
         'opp': to_float(raw_data.get("o")),
         'clp': to_float(raw_data.get("c")),
         'hip': to_float(raw_data.get("h")),
@@ -930,8 +944,11 @@ def load_quote_bin_ws_data(raw_data: dict, state_data: Optional[dict]) -> dict:
     return data
 
 
-def load_order_book_ws_data(raw_data: dict, order: list, side: int, state_data: Optional[dict]) -> dict:
+def load_order_book_ws_levels(raw_data: dict, state_data: Optional[dict]) -> list:
     """
+    Order book entries of a split depth update, i.e. one header with the
+    level arrays of a single action
+
     {
       "e": "depthUpdate",
       "E": 1594200464954,
@@ -961,23 +978,45 @@ def load_order_book_ws_data(raw_data: dict, order: list, side: int, state_data:
     }
     """
     symbol = raw_data.get('s', '').lower()
-    price = to_float(order[0])
-
-    data = {
-        'id': generate_order_book_id(price, state_data),
-        's': symbol,
-        'p': price,
-        'vl': to_float(order[1]),
-        'sd': side
-    }
-    if isinstance(state_data, dict):
-        data.update({
-            'ss': state_data.get('system_symbol')
-        })
+    extra = {'ss': state_data.get('system_symbol')} if isinstance(state_data, dict) else None
+    data = []
+    for key, side in (('b', api.BUY), ('a', api.SELL)):
+        for order in raw_data.get(key) or ():
+            price = to_float(order[0])
+            level = {
+                'id': generate_order_book_id(price, state_data),
+                's': symbol,
+                'p': price,
+                'vl': to_float(order[1]),
+                'sd': side
+            }
+            if extra:
+                level.update(extra)
+            data.append(level)
     return data
 
 
-def load_symbol_ws_data(schema: str, raw_data: dict, state_data: Optional[dict]) -> dict:
+def load_order_book_ws_columns(columns: dict, raw_data: dict, state_data: Optional[dict]) -> None:
+    """
+    Appends the levels of `load_order_book_ws_levels` to the lists of `columns`
+    without building a record per level, `ss` only if `columns` has it
+    """
+    symbol = raw_data.get('s', '').lower()
+    system_symbol = state_data.get('system_symbol') if isinstance(state_data, dict) else None
+    for key, side in (('b', api.BUY), ('a', api.SELL)):
+        for order in raw_data.get(key) or ():
+            price = to_float(order[0])
+            columns['id'].append(generate_order_book_id(price, state_data))
+            columns['s'].append(symbol)
+            columns['p'].append(price)
+            columns['vl'].append(to_float(order[1]))
+            columns['sd'].append(side)
+            if 'ss' in columns:
+                columns['ss'].append(system_symbol)
+
+
+def load_symbol_ws_data(schema: str, raw_data: dict, state_data: Optional[dict], epoch_ms: bool = False,
+                        fragment: Optional[tuple] = None) -> dict:
     """
     {
       "e": "24hrTicker",  // Event type
@@ -1011,7 +1050,7 @@ def load_symbol_ws_data(schema: str, raw_data: dict, state_data: Optional[dict])
     price_change = to_float(raw_data.get('p'))
     price24 = to_float(price - price_change)
     data = {
-        'tm': to_iso_datetime(raw_data.get('E')),
+        'tm': load_ws_time(raw_data.get('E'), epoch_ms),
         's': symbol,
         'p': price,
         'p24': price24,
@@ -1025,25 +1064,23 @@ def load_symbol_ws_data(schema: str, raw_data: dict, state_data: Optional[dict])
         'fr': None
     }
     if isinstance(state_data, dict):
-        face_price_data = state_data.get('extra', {}).get('face_price_data', {})
-        face_price = BinanceFinFactory.calc_face_price(price, schema=schema, **face_price_data)
-        data.update({
-            'fp': face_price,
-            'exp': state_data.get('expiration'),
-            'expd': state_data.get('expiration_date'),
-            'pa': state_data.get('pair'),
-            'tck': state_data.get('tick'),
-            'vt': state_data.get('volume_tick'),
-            'ss': state_data.get('system_symbol'),
-            'crt': to_iso_datetime(to_date(state_data.get('created'))),
-            'mlvr': state_data.get('max_leverage'),
-            'wa': state_data.get('wallet_asset'),
-        })
+        face_price_data, fields = fragment or load_symbol_ws_fragment(state_data)
+        data['fp'] = BinanceFinFactory.calc_face_price(price, schema=schema, **face_price_data)
+        data.update(fields)
     return data
 
 
-def load_futures_symbol_ws_data(schema: str, raw_data: dict, state_data: Optional[dict]) -> dict:
-    if data := load_symbol_ws_data(schema, raw_data, state_data):
+def load_symbol_ws_fragment(state_data: dict) -> tuple:
+    """
+    `load_symbol_state_fragment` of a Binance state symbol, whose creation
+    time may be epoch milliseconds and goes through `to_date` first
+    """
+    return load_symbol_state_fragment(state_data, crt=to_iso_datetime(to_date(state_data.get('created'))))
+
+
+def load_futures_symbol_ws_data(schema: str, raw_data: dict, state_data: Optional[dict],
+                                epoch_ms: bool = False, fragment: Optional[tuple] = None) -> dict:
+    if data := load_symbol_ws_data(schema, raw_data, state_data, epoch_ms, fragment):
         data.update({
             'mp': to_float(raw_data.get('mp')),
             'fr': load_funding_rate(raw_data.get('fr'))
@@ -1063,7 +1100,7 @@ def to_date(token: Union[datetime, int, str]) -> Optional[datetime]:
         return token
     try:
         if isinstance(token, str):
-            return datetime.strptime(token.split('Z')[0], api.DATETIME_FORMAT)
+            return parse_iso_datetime(token)
         elif isinstance(token, int):
             return datetime.fromtimestamp(token / 1000, tz=timezone.utc)
     except (ValueError, TypeError, IndexError):
@@ -1077,13 +1114,19 @@ def to_iso_datetime(token: Union[datetime, int, str]) -> Optional[str]:
         if isinstance(token, datetime):
             return token.strftime(api.DATETIME_FORMAT)
         elif isinstance(token, int):
-            return datetime.fromtimestamp(token / 1000, tz=timezone.utc).strftime(api.DATETIME_FORMAT)
+            return timestamp2iso(token)
         elif isinstance(token, str):
-            return datetime.strptime(token.split('Z')[0], api.DATETIME_FORMAT).strftime(api.DATETIME_FORMAT)
+            return parse_iso_datetime(token).strftime(api.DATETIME_FORMAT)
     except (ValueError, TypeError, IndexError):
         return None
 
 
+def load_ws_time(token: Optional[int], epoch_ms: bool = False) -> Union[int, str, None]:
+    if epoch_ms:
+        return token
+    return to_iso_datetime(token)
+
+
 def to_float(token: Union[int, float, str, None]) -> float:
     try:
         return float(token)
@@ -1108,7 +1151,7 @@ def load_ws_order_side(order_side: Optional[str]) -> Optional[int]:
         return None
 
 
-def load_order_ws_data(schema: str, raw_data: dict, state_data: Optional[dict]) -> dict:
+def load_order_ws_data(schema: str, raw_data: dict, state_data: Optional[dict], epoch_ms: bool = False) -> dict:
     position_side = raw_data.get('ps') or PositionSide.both
     data = {
         'oid': raw_data.get('c'),
@@ -1123,10 +1166,10 @@ def load_order_ws_data(schema: str, raw_data: dict, state_data: Optional[dict])
         'lv': calculate_ws_order_leaves_volume(raw_data),
         'fv': to_float(raw_data.get('z')),
         'ap': calculate_ws_order_avg_price(raw_data),
-        'tm': to_iso_datetime(raw_data.get('E')),
+        'tm': load_ws_time(raw_data.get('E'), epoch_ms),
         's': raw_data.get('s'),
         'stp': to_float(raw_data['P']) if raw_data.get('P') else to_float(raw_data.get('sp')),
-        'crt': to_iso_datetime(raw_data['O']) if raw_data.get('O') else to_iso_datetime(raw_data.get('T')),
+        'crt': load_ws_time(raw_data.get('O') or raw_data.get('T'), epoch_ms),
         't': BinanceOrderTypeConverter.load_order_type(schema, raw_data.get('o'))
     }
     if isinstance(state_data, dict):
@@ -1216,9 +1259,10 @@ def load_ws_futures_position_leverage_type(margin_type: Optional[str]) -> Option
     return None
 
 
-def load_futures_position_ws_data(raw_data: dict, position_state_data: dict, state_data: Optional[dict]) -> dict:
+def load_futures_position_ws_data(raw_data: dict, position_state_data: dict, state_data: Optional[dict],
+                                  epoch_ms: bool = False) -> dict:
     data = {
-        'tm': to_iso_datetime(raw_data.get('E')),
+        'tm': load_ws_time(raw_data.get('E'), epoch_ms),
         's': position_state_data['symbol'].lower(),
         'sd': position_state_data['side'],
         'ps': position_state_data['position_side'].lower(),
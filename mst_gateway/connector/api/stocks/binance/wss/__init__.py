@@ -1,14 +1,17 @@
 import asyncio
 from logging import Logger
-from typing import Optional, Union
+from typing import Hashable, Optional, Union
 from mst_gateway.exceptions import ConnectorError
 from websockets import client
 from . import subscribers as subscr_class
+from .order_book import BinanceLocalOrderBooks
+from .scheduler import BinanceCommandScheduler
+from .shards import BinanceShardPool
 from .router import BinanceWssRouter, BinanceMarginCrossWssRouter, BinanceMarginWssRouter, BinanceMarginCoinWssRouter
 from .utils import is_auth_ok, make_cmd
 from .. import rest
 from ....wss import StockWssApi, ThrottleWss
-from ..utils import to_float, remap_futures_coin_position_request_data
+from ..utils import to_float, remap_futures_coin_position_request_data, load_symbol_ws_fragment
 from .... import OrderSchema, ExchangeDrivers, PositionSide
 from .. import var
 
@@ -18,6 +21,7 @@ class BinanceWssApi(StockWssApi):
     BASE_URL = 'wss://stream.binance.com:9443/ws'
     TEST_URL = 'wss://testnet.binance.vision/ws'
     name = 'binance'
+    symbol_key = 's'
     subscribers = {
         'order_book': subscr_class.BinanceOrderBookSubscriber(),
         'trade': subscr_class.BinanceTradeSubscriber(),
@@ -34,6 +38,15 @@ class BinanceWssApi(StockWssApi):
 
     router_class = BinanceWssRouter
     refresh_key_time = 1800
+    max_streams = 900
+    shard_streams = 1024
+    command_rate = 5
+    command_chunk_size = 200
+    # the listenKey url streams user data to every connection opened with it,
+    # a standby would buffer events already delivered by the current connection
+    standby_auth = False
+    # worker copies of the api neither open shard connections nor sync local books
+    worker_excluded_options = ('sharding', 'local_order_book')
     throttle = ThrottleWss(ws_limit=var.BINANCE_THROTTLE_LIMITS.get('ws'))
 
     def __init__(self,
@@ -52,6 +65,19 @@ class BinanceWssApi(StockWssApi):
                          schema, state_storage, ratelimit, register_state)
 
         self.listen_key = None
+        self.command_scheduler = BinanceCommandScheduler(self)
+        self.shard_pool: Optional[BinanceShardPool] = None
+        if self.options.get('sharding'):
+            self.shard_pool = BinanceShardPool(
+                self,
+                max_streams=self.options.get('shard_streams', self.shard_streams),
+                max_shards=self.options.get('max_shards')
+            )
+        self.order_books: Optional[BinanceLocalOrderBooks] = None
+        if self.options.get('local_order_book'):
+            self.order_books = BinanceLocalOrderBooks(self)
+        # records carry raw epoch milliseconds in `tm`/`crt` instead of iso strings
+        self.epoch_ms = bool(self.options.get('epoch_ms'))
 
     async def _refresh_key(self):
         while True:
@@ -104,6 +130,63 @@ class BinanceWssApi(StockWssApi):
                           f"test: {self.test} - connected successful.")
         return _ws
 
+    @property
+    def command_queue_depth(self) -> int:
+        depth = self.command_scheduler.depth
+        if self.shard_pool is not None:
+            depth += sum(shard.scheduler.depth for shard in self.shard_pool.shards)
+        return depth
+
+    def get_order_book(self, symbol: str, depth: int = None, side: int = None, split: bool = False,
+                       offset: int = 0, min_volume_buy: float = None,
+                       min_volume_sell: float = None) -> Optional[Union[list, dict]]:
+        """
+        Order book of a depth subscribed symbol from the local book, same as
+        `BinanceRestApi.get_order_book`. None while the book is not synced.
+        """
+        if self.order_books is None or (book := self.order_books.get(symbol)) is None:
+            return None
+        return book.get(symbol, depth, side, split, offset, min_volume_buy, min_volume_sell,
+                        self.get_state_data(symbol))
+
+    def get_order_book_grouped(self, symbol: str, group: int, side: int = None,
+                               depth: int = None) -> Optional[list]:
+        """
+        Local order book of a symbol grouped by `group` ticks, one of `order_book_groups` option
+        """
+        if (grouped := self._order_book_grouped(symbol)) is None or group not in grouped.groups:
+            return None
+        return grouped.get(group, side, depth)
+
+    def get_order_book_group_changes(self, symbol: str, group: int, consumer: Hashable = None) -> Optional[list]:
+        """
+        Grouped buckets of a symbol changed since the previous call of `consumer`
+        """
+        if (grouped := self._order_book_grouped(symbol)) is None or group not in grouped.groups:
+            return None
+        return grouped.changes(group, consumer)
+
+    def _order_book_grouped(self, symbol: str):
+        if self.order_books is None or (book := self.order_books.get(symbol)) is None:
+            return None
+        return book.grouped
+
+    def _load_state_fragment(self, state_data: dict) -> Optional[tuple]:
+        return load_symbol_ws_fragment(state_data)
+
+    def _event_time(self, message: dict) -> Optional[float]:
+        if (data := message.get('data')) and isinstance(data[0], dict) and isinstance(event_time := data[0].get('E'), int):
+            return event_time / 1000
+        return None
+
+    async def close(self):
+        self.command_scheduler.clear()
+        if self.order_books is not None:
+            self.order_books.close()
+        if self.shard_pool is not None:
+            await self.shard_pool.close()
+        await super().close()
+
     async def authenticate(self, auth: dict = None) -> bool:
         return self.auth_connect
 
@@ -141,27 +224,34 @@ class BinanceWssApi(StockWssApi):
         return super(BinanceWssApi, self)._split_message(method(message=message))
 
     def split_order_book(self, message):
+        """
+        Split depth updates by action. Every message item keeps its header
+        with the bid and ask level arrays of one action, levels are not copied.
+        """
         message.pop('action', None)
         _messages = []
-        _data_delete = []
-        _data_update = []
         for item in message.pop('data', []):
-            bids = item.pop('b', [])
-            asks = item.pop('a', [])
-            for bid in bids:
-                if to_float(bid[1]):
-                    _data_update.append({'b': bid, **item})
-                else:
-                    _data_delete.append({'b': bid, **item})
-            for ask in asks:
-                if to_float(ask[1]):
-                    _data_update.append({'a': ask, **item})
-                else:
-                    _data_delete.append({'a': ask, **item})
-            _messages.append(dict(**message, action='delete', data=_data_delete))
-            _messages.append(dict(**message, action='update', data=_data_update))
+            if self.order_books is not None:
+                self.order_books.update(item)
+            bids_delete, bids_update = self._split_levels(item.pop('b', None))
+            asks_delete, asks_update = self._split_levels(item.pop('a', None))
+            if bids_delete or asks_delete:
+                _messages.append(dict(**message, action='delete', data=[dict(item, b=bids_delete, a=asks_delete)]))
+            if bids_update or asks_update:
+                _messages.append(dict(**message, action='update', data=[dict(item, b=bids_update, a=asks_update)]))
         return _messages
 
+    @staticmethod
+    def _split_levels(levels: Optional[list]) -> tuple:
+        deleted = []
+        updated = []
+        for level in levels or ():
+            if to_float(level[1]):
+                updated.append(level)
+            else:
+                deleted.append(level)
+        return deleted, updated
+
     def split_order(self, message):
         message.pop('action', None)
         _messages = []
@@ -193,6 +283,8 @@ class BinanceMarginCrossWssApi(BinanceWssApi):
 class BinanceMarginWssApi(BinanceWssApi):
     BASE_URL = 'wss://fstream.binance.com/ws'
     TEST_URL = 'wss://stream.binancefuture.com/ws'
+    shard_streams = 200
+    command_rate = 10
 
     subscribers = {
         'order_book': subscr_class.BinanceOrderBookSubscriber(),
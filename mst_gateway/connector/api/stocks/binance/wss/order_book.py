@@ -0,0 +1,202 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, Optional, Union
+from mst_gateway.exceptions import GatewayError
+from .. import rest
+from ..utils import to_float, filter_order_book_data, load_order_book_data
+from .... import BUY, SELL
+from ....utils.order_book import GroupedOrderBook
+
+if TYPE_CHECKING:
+    from . import BinanceWssApi
+
+
+class BinanceOrderBook:
+    """
+    Local L2 order book of one symbol kept from depth update events.
+
+    Events received before the book is synced with a REST snapshot are buffered.
+    Spot events must cover the next update id (`U` <= last id + 1 <= `u`),
+    futures events point to the previous one with `pu`. A gap unsyncs the book
+    until a newer snapshot is loaded.
+    Price bucket aggregates in `grouped` follow every level change.
+    """
+    max_buffer = 1000
+    sides = {'bids': BUY, 'asks': SELL}
+
+    def __init__(self, symbol: str, grouped: Optional[GroupedOrderBook] = None):
+        self.symbol = symbol
+        self.grouped = grouped
+        self.last_update_id: Optional[int] = None
+        self.synced = False
+        self.gaps = 0
+        self._continuous = False
+        self._sides: Dict[str, Dict[float, list]] = {'bids': {}, 'asks': {}}
+        self._sorted: Dict[str, Optional[list]] = {'bids': None, 'asks': None}
+        self._buffer: Deque[dict] = deque(maxlen=self.max_buffer)
+
+    def __len__(self):
+        return len(self._sides['bids']) + len(self._sides['asks'])
+
+    def load_snapshot(self, snapshot: dict) -> bool:
+        """
+        Reset levels to a REST depth snapshot and replay buffered events on top of it
+        """
+        self.last_update_id = snapshot['lastUpdateId']
+        if self.grouped is not None:
+            self.grouped.clear()
+        for key in ('bids', 'asks'):
+            self._sides[key] = {}
+            self._sorted[key] = None
+            self._update_side(key, snapshot.get(key))
+        self.synced = True
+        self._continuous = False
+        buffer = list(self._buffer)
+        self._buffer.clear()
+        for index, event in enumerate(buffer):
+            if not self.apply(event):
+                self._buffer.extend(buffer[index + 1:])
+                break
+        return self.synced
+
+    def apply(self, event: dict) -> bool:
+        """
+        Apply a depth update event, returns False if the book needs a snapshot
+        """
+        if not self.synced:
+            # callers may take level arrays out of the event afterwards
+            self._buffer.append(dict(event))
+            return False
+        first, last = event['U'], event['u']
+        if 'pu' in event:
+            if last < self.last_update_id:
+                return True
+            if self._continuous:
+                valid = event['pu'] == self.last_update_id
+            else:
+                valid = first <= self.last_update_id <= last
+        else:
+            if last <= self.last_update_id:
+                return True
+            valid = first <= self.last_update_id + 1 <= last
+        if not valid:
+            self.synced = False
+            self.gaps += 1
+            self._buffer.clear()
+            self._buffer.append(dict(event))
+            return False
+        self._update_side('bids', event.get('b'))
+        self._update_side('asks', event.get('a'))
+        self.last_update_id = last
+        self._continuous = True
+        return True
+
+    def _update_side(self, key: str, levels: Optional[list]):
+        if not levels:
+            return
+        side = self._sides[key]
+        for level in levels:
+            price, volume = to_float(level[0]), to_float(level[1])
+            if volume:
+                side[price] = level
+            else:
+                side.pop(price, None)
+            if self.grouped is not None:
+                self.grouped.update(price, volume, self.sides[key])
+        self._sorted[key] = None
+
+    def levels(self, key: str) -> list:
+        """
+        Levels of a side (`bids` or `asks`) from the best price, like in a REST snapshot
+        """
+        if self._sorted[key] is None:
+            side = self._sides[key]
+            self._sorted[key] = [side[price] for price in sorted(side, reverse=key == 'bids')]
+        return self._sorted[key]
+
+    def get(self, symbol: str, depth: int = None, side: int = None, split: bool = False, offset: int = 0,
+            min_volume_buy: float = None, min_volume_sell: float = None,
+            state_data: Optional[dict] = None) -> Union[list, dict]:
+        data = filter_order_book_data(
+            {'bids': self.levels('bids'), 'asks': self.levels('asks')}, min_volume_buy, min_volume_sell
+        )
+        return load_order_book_data(data, symbol, side, split, offset, depth, state_data)
+
+
+class BinanceLocalOrderBooks:
+    """
+    Local order books of depth subscribed symbols of a wss api.
+
+    Books are created on the first depth event of a symbol and synced
+    in background with REST snapshots, again after every sequence gap.
+    """
+    resync_delay = 1.0
+
+    def __init__(self, api: BinanceWssApi):
+        self._api = api
+        self._books: Dict[str, BinanceOrderBook] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def update(self, event: dict):
+        symbol = event.get('s', '').lower()
+        if (book := self._books.get(symbol)) is None:
+            book = self._books[symbol] = BinanceOrderBook(symbol, self._grouped(symbol))
+        if not book.apply(event):
+            self._sync(symbol)
+
+    def get(self, symbol: str) -> Optional[BinanceOrderBook]:
+        book = self._books.get(symbol.lower())
+        if book is None or not book.synced:
+            return None
+        return book
+
+    def discard(self, symbol: str = None):
+        symbols = list(self._books) if symbol is None else [symbol.lower()]
+        for _symbol in symbols:
+            self._books.pop(_symbol, None)
+            if (task := self._tasks.pop(_symbol, None)) is not None:
+                task.cancel()
+
+    def close(self):
+        self.discard()
+
+    def stats(self) -> Dict[str, dict]:
+        return {
+            symbol: {
+                'synced': book.synced,
+                'last_update_id': book.last_update_id,
+                'levels': len(book),
+                'gaps': book.gaps,
+            }
+            for symbol, book in self._books.items()
+        }
+
+    def _grouped(self, symbol: str) -> Optional[GroupedOrderBook]:
+        if not (groups := self._api.options.get('order_book_groups')):
+            return None
+        if not (state_data := self._api.get_state_data(symbol)) or not state_data.get('tick'):
+            return None
+        return GroupedOrderBook(state_data['tick'], groups)
+
+    def _sync(self, symbol: str):
+        task = self._tasks.get(symbol)
+        if task is None or task.done():
+            self._tasks[symbol] = asyncio.create_task(self._resync(symbol))
+
+    async def _resync(self, symbol: str):
+        loop = asyncio.get_running_loop()
+        while (book := self._books.get(symbol)) is not None and not book.synced:
+            try:
+                snapshot = await loop.run_in_executor(None, self._fetch_snapshot, symbol)
+            except GatewayError as e:
+                self._api.logger.warning(f"{self.__class__.__name__} - {symbol} snapshot - {e}")
+            else:
+                if self._books.get(symbol) is book and book.load_snapshot(snapshot):
+                    break
+            await asyncio.sleep(self.resync_delay)
+
+    def _fetch_snapshot(self, symbol: str) -> dict:
+        api = self._api
+        with rest.BinanceRestApi(auth=api.auth, test=api.test, ratelimit=api.ratelimit) as client:
+            return client.get_order_book_snapshot(symbol, api.schema)
@@ -1,7 +1,5 @@
 from __future__ import annotations
-from typing import Dict, Optional
 from ....wss.router import Router
-from ....wss.serializer import Serializer
 from . import serializers
 
 
@@ -14,6 +12,7 @@ class BinanceWssRouter(Router):
         'outboundAccountPosition': ['wallet', 'wallet_extra'],
         'executionReport': 'order'
     }
+    stateless_subscriptions = ('trade', 'quote_bin', 'symbol')
 
     serializer_classes = {
         'trade': serializers.BinanceTradeSerializer,
@@ -26,36 +25,6 @@ class BinanceWssRouter(Router):
         'position': serializers.BinancePositionSerializer,
     }
 
-    def _get_serializers(self, message: dict) -> Dict[str, Serializer]:
-        self._routed_data = {}
-        _serializers = {}
-        table = message['table']
-        if table not in self.table_route_map:
-            return _serializers
-        subscriptions = self.table_route_map[table]
-        if not isinstance(subscriptions, list):
-            subscriptions = [subscriptions]
-        for subscr_name in subscriptions:
-            serializer = self._lookup_serializer(subscr_name, message)
-            if serializer:
-                _serializers[subscr_name] = serializer
-        return _serializers
-
-    def _lookup_serializer(self, subscr_name, data: dict) -> Optional[Serializer]:
-        if subscr_name not in self._wss_api.subscriptions:
-            return None
-        serializer = self._subscr_serializer(subscr_name)
-        serializer.prefetch(data)
-        self._routed_data[subscr_name] = {
-            'table': data['table'],
-            'action': data['action'],
-            'schema': self._wss_api.schema,
-            'data': data['data']
-        }
-        if self._routed_data[subscr_name]['data']:
-            return serializer
-        return None
-
 
 class BinanceMarginCrossWssRouter(BinanceWssRouter):
     serializer_classes = {
@@ -82,6 +51,7 @@ class BinanceMarginWssRouter(BinanceWssRouter):
         'markPriceUpdate': ['position', 'symbol'],
         'ACCOUNT_CONFIG_UPDATE': 'position',
     }
+    stateless_subscriptions = ('trade', 'quote_bin')
 
     serializer_classes = {
         'trade': serializers.BinanceTradeSerializer,
@@ -107,6 +77,7 @@ class BinanceMarginCoinWssRouter(BinanceWssRouter):
         'markPriceUpdate': ['position', 'symbol'],
         'position': 'position'
     }
+    stateless_subscriptions = ('trade', 'quote_bin')
 
     serializer_classes = {
         'symbol': serializers.BinanceMarginSymbolSerializer,
@@ -0,0 +1,103 @@
+from __future__ import annotations
+import asyncio
+from asyncio import CancelledError
+from typing import TYPE_CHECKING, Dict, Optional
+from websockets.exceptions import ConnectionClosed
+from ....wss.throttle import TokenBucket
+from .utils import make_params, make_params_cmd
+
+if TYPE_CHECKING:
+    from . import BinanceWssApi
+
+SUBSCRIBE = 'SUBSCRIBE'
+UNSUBSCRIBE = 'UNSUBSCRIBE'
+
+
+class BinanceCommandScheduler:
+    """
+    Outbound SUBSCRIBE/UNSUBSCRIBE queue of one websocket connection.
+
+    Pending stream changes are coalesced (the latest request for a stream wins)
+    and sent as few commands as possible, paced by a token bucket matching
+    the exchange limit of incoming messages per connection.
+    """
+
+    def __init__(self, api: BinanceWssApi, connection=None, rate: Optional[float] = None,
+                 chunk_size: Optional[int] = None):
+        self._api = api
+        self._connection = api if connection is None else connection
+        self._bucket = TokenBucket(rate or api.command_rate)
+        self.chunk_size = chunk_size or api.command_chunk_size
+        self._pending: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.sent = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> dict:
+        return {
+            'depth': len(self._pending),
+            'sent': self.sent,
+            'tokens': self._bucket.tokens,
+        }
+
+    def subscribe(self, subscription: str, symbols=None) -> bool:
+        return self._schedule(SUBSCRIBE, make_params(subscription, symbols))
+
+    def unsubscribe(self, subscription: str, symbols=None) -> bool:
+        return self._schedule(UNSUBSCRIBE, make_params(subscription, symbols))
+
+    async def wait(self) -> None:
+        await self._idle.wait()
+
+    def clear(self) -> None:
+        self._pending.clear()
+
+    def _schedule(self, method: str, params: list) -> bool:
+        if self._closed:
+            return False
+        for param in params:
+            self._pending.pop(param, None)
+            self._pending[param] = method
+        if self._task is None or self._task.done():
+            self._idle.clear()
+            self._task = asyncio.create_task(self._send())
+            self._api.tasks.append(self._task)
+        return True
+
+    @property
+    def _closed(self) -> bool:
+        handler = self._connection.handler
+        return not handler or handler.closed
+
+    async def _send(self):
+        try:
+            while self._pending:
+                await self._bucket.acquire()
+                if self._closed:
+                    self._pending.clear()
+                    break
+                method, params = self._next_command()
+                await self._connection.handler.send(make_params_cmd(method, params))
+                self.sent += 1
+        except (CancelledError, ConnectionClosed) as e:
+            self._api.logger.warning(f"{self.__class__.__name__} - {e}")
+            self._pending.clear()
+        finally:
+            self._idle.set()
+
+    def _next_command(self) -> tuple:
+        method = next(iter(self._pending.values()))
+        params = []
+        for param, _method in self._pending.items():
+            if _method == method:
+                params.append(param)
+                if len(params) >= self.chunk_size:
+                    break
+        for param in params:
+            del self._pending[param]
+        return method, params
@@ -7,6 +7,8 @@ from .....wss.serializer import Serializer
 class BinanceSerializer(Serializer):
     __metaclass__ = ABCMeta
     subscription = "binance"
+    # record fields of serializers with a column loader, see `_load_columns`
+    column_fields: Optional[tuple] = None
 
     @classmethod
     def _get_data_action(cls, message) -> str:
@@ -28,7 +30,12 @@ class BinanceSerializer(Serializer):
     def is_item_valid(self, message: dict, item: dict) -> bool:
         return bool(item)
 
-    async def _get_data(self, message: dict) -> Tuple[str, list]:
+    def _load_columns(self, columns: dict, message: dict, item: dict, state_data: Optional[dict]) -> None:
+        raise NotImplementedError
+
+    async def _get_data(self, message: dict) -> Tuple[str, Union[list, dict]]:
+        if self.column_fields is not None and self._wss_api.columnar_loader(self.subscription):
+            return self._get_data_action(message), self._get_columns(message)
         data = []
         for item in message['data']:
             await self._append_item(data, message, item)
@@ -40,3 +47,22 @@ class BinanceSerializer(Serializer):
             return None
         self._update_state(valid_item['s'], valid_item)
         self._update_data(data, valid_item)
+
+    def _get_columns(self, message: dict) -> Optional[dict]:
+        """
+        Fields of the valid items as columns filled by `_load_columns`, no
+        record per item is built and the serializer state is not kept
+        """
+        columns = {field: [] for field in self.column_fields}
+        if register_state := self._wss_api.register_state:
+            columns['ss'] = []
+        for item in message['data']:
+            if not self.is_item_valid(message, item):
+                continue
+            state_data = None
+            if register_state and (state_data := self._wss_api.get_state_data(item.get('s'))) is None:
+                continue
+            self._load_columns(columns, message, item, state_data)
+        if not columns[self.column_fields[0]]:
+            return None
+        return columns
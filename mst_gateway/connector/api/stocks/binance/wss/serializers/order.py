@@ -19,4 +19,4 @@ class BinanceOrderSerializer(BinanceSerializer):
             if (state_data := self._wss_api.get_state_data(item.get('s'))) is None:
                 return None
         item = BinanceOrderTypeConverter.prefetch_message_data(self._wss_api.schema, item)
-        return utils.load_order_ws_data(self._wss_api.schema, item, state_data)
+        return utils.load_order_ws_data(self._wss_api.schema, item, state_data, self._wss_api.epoch_ms)
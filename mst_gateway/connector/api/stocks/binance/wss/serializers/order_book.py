@@ -1,9 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Set, Optional
-from mst_gateway.connector import api
 from .base import BinanceSerializer
-from ...utils import load_order_book_ws_data
+from ...utils import load_order_book_ws_columns, load_order_book_ws_levels
 
 if TYPE_CHECKING:
     from ... import BinanceWssApi
@@ -11,6 +10,7 @@ if TYPE_CHECKING:
 
 class BinanceOrderBookSerializer(BinanceSerializer):
     subscription = "order_book"
+    column_fields = ('id', 's', 'p', 'vl', 'sd')
 
     def __init__(self, wss_api: BinanceWssApi):
         self._symbols: Set = set()
@@ -19,17 +19,21 @@ class BinanceOrderBookSerializer(BinanceSerializer):
     def is_item_valid(self, message: dict, item: dict) -> bool:
         return 's' in item
 
-    async def _load_data(self, message: dict, item: dict) -> Optional[dict]:
+    async def _load_data(self, message: dict, item: dict) -> Optional[list]:
         if not self.is_item_valid(message, item):
             return None
         state_data = None
         if self._wss_api.register_state:
             if (state_data := self._wss_api.get_state_data(item.get('s'))) is None:
                 return None
-        if 'b' in item:
-            order, side = item['b'], api.BUY
-        elif 'a' in item:
-            order, side = item['a'], api.SELL
-        else:
+        return load_order_book_ws_levels(item, state_data)
+
+    async def _append_item(self, data: list, message: dict, item: dict):
+        levels = await self._load_data(message, item)
+        if not levels:
             return None
-        return load_order_book_ws_data(item, order, side, state_data)
+        self._update_state(levels[-1]['s'], levels[-1])
+        self._update_data(data, levels)
+
+    def _load_columns(self, columns: dict, message: dict, item: dict, state_data: Optional[dict]) -> None:
+        load_order_book_ws_columns(columns, item, state_data)
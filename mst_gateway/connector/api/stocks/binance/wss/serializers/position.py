@@ -177,7 +177,7 @@ class BinanceMarginPositionSerializer(BinancePositionSerializer):
         current_position['unrealised_pnl'] = BinanceFinFactory.calc_unrealised_pnl_by_side(
             entry_price, mark_price, volume, side, schema=schema, contract_size=contract_size
         )
-        return utils.load_futures_position_ws_data(item, current_position, state_data)
+        return utils.load_futures_position_ws_data(item, current_position, state_data, self._wss_api.epoch_ms)
 
     def is_position_exists(self, symbol: str, position_side: str) -> bool:
         try:
@@ -265,5 +265,5 @@ class BinanceMarginCoinPositionSerializer(BinanceMarginPositionSerializer):
                 if (state_data := self._wss_api.get_state_data(symbol)) is None:
                     return None
             current_position, _, _ = utils.split_positions_state(self.position_state, symbol, position_side)
-            return utils.load_futures_position_ws_data(item, current_position, state_data)
+            return utils.load_futures_position_ws_data(item, current_position, state_data, self._wss_api.epoch_ms)
         return await super()._load_data(message, item)
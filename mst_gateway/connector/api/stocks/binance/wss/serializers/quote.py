@@ -17,4 +17,4 @@ class BinanceQuoteBinSerializer(BinanceSerializer):
         if self._wss_api.register_state:
             if (state_data := self._wss_api.get_state_data(item.get('s'))) is None:
                 return None
-        return load_quote_bin_ws_data(item, state_data)
+        return load_quote_bin_ws_data(item, state_data, self._wss_api.epoch_ms)
@@ -15,10 +15,14 @@ class BinanceSymbolSerializer(BinanceSerializer):
         if not self.is_item_valid(message, item):
             return None
         state_data = None
+        fragment = None
         if self._wss_api.register_state:
             if (state_data := self._wss_api.get_state_data(item.get('s'))) is None:
                 return None
-        return utils.load_symbol_ws_data(self._wss_api.schema, item, state_data)
+            fragment = self._wss_api.get_state_fragment(item.get('s'))
+        return utils.load_symbol_ws_data(
+            self._wss_api.schema, item, state_data, self._wss_api.epoch_ms, fragment
+        )
 
 
 class BinanceMarginSymbolSerializer(BinanceSymbolSerializer):
@@ -44,8 +48,12 @@ class BinanceMarginSymbolSerializer(BinanceSymbolSerializer):
             return None
         _symbol = item.get('s', '').lower()
         state_data = None
+        fragment = None
         if self._wss_api.register_state:
             if (state_data := self._wss_api.get_state_data(_symbol)) is None:
                 return None
+            fragment = self._wss_api.get_state_fragment(_symbol)
         item.update(dict(**self._book_ticker.get(_symbol, {}), **self._mark_prices.get(_symbol, {})))
-        return utils.load_futures_symbol_ws_data(self._wss_api.schema, item, state_data)
+        return utils.load_futures_symbol_ws_data(
+            self._wss_api.schema, item, state_data, self._wss_api.epoch_ms, fragment
+        )
@@ -1,11 +1,12 @@
 from __future__ import annotations
 from typing import Optional
 from .base import BinanceSerializer
-from ...utils import load_trade_ws_data
+from ...utils import load_trade_ws_columns, load_trade_ws_data
 
 
 class BinanceTradeSerializer(BinanceSerializer):
     subscription = "trade"
+    column_fields = ('tm', 'p', 'vl', 'sd', 's')
 
     @classmethod
     def _get_data_action(cls, message) -> str:
@@ -21,4 +22,7 @@ class BinanceTradeSerializer(BinanceSerializer):
         if self._wss_api.register_state:
             if (state_data := self._wss_api.get_state_data(item.get('s'))) is None:
                 return None
-        return load_trade_ws_data(item, state_data)
+        return load_trade_ws_data(item, state_data, self._wss_api.epoch_ms)
+
+    def _load_columns(self, columns: dict, message: dict, item: dict, state_data: Optional[dict]) -> None:
+        load_trade_ws_columns(columns, item, state_data, self._wss_api.epoch_ms)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional
+from websockets.exceptions import ConnectionClosed
+from .scheduler import BinanceCommandScheduler
+from ....wss.reconnect import CONNECT_ERRORS, ReconnectBackoff
+from .utils import stock2symbol
+
+if TYPE_CHECKING:
+    from . import BinanceWssApi
+
+
+class BinanceShard:
+    """
+    One market data websocket connection of a shard pool with its streams
+    """
+
+    def __init__(self, api: BinanceWssApi, index: int):
+        self.index = index
+        self.handler = None
+        self.streams: Dict[str, set] = {}
+        self.task: Optional[asyncio.Task] = None
+        self.scheduler = BinanceCommandScheduler(api, self)
+        self.backoff = ReconnectBackoff()
+
+    def __len__(self):
+        return sum(len(symbols) for symbols in self.streams.values())
+
+    @property
+    def closed(self) -> bool:
+        return not self.handler or self.handler.closed
+
+
+class BinanceShardPool:
+    """
+    Spread per-symbol streams across several websocket connections,
+    keeping at most `max_streams` streams on each of them.
+    Frames of every shard are passed to the api consume pipeline,
+    so subscribers get a single `on_message` stream.
+    """
+
+    def __init__(self, api: BinanceWssApi, max_streams: int, max_shards: Optional[int] = None):
+        self._api = api
+        self.max_streams = max_streams
+        self.max_shards = max_shards
+        self._shards: List[BinanceShard] = []
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @property
+    def shards(self) -> List[BinanceShard]:
+        return self._shards
+
+    def symbols(self, subscription: str) -> set:
+        symbols = set()
+        for shard in self._shards:
+            symbols.update(shard.streams.get(subscription, ()))
+        return symbols
+
+    def stats(self) -> List[dict]:
+        return [
+            {
+                'index': shard.index,
+                'connected': not shard.closed,
+                'streams': {s: len(symbols) for s, symbols in shard.streams.items()},
+                'commands': shard.scheduler.stats(),
+            }
+            for shard in self._shards
+        ]
+
+    async def subscribe(self, subscription: str, symbols: list) -> bool:
+        async with self._lock(subscription):
+            return await self._subscribe(subscription, symbols)
+
+    async def unsubscribe(self, subscription: str, symbols: Optional[list] = None) -> bool:
+        async with self._lock(subscription):
+            return await self._unsubscribe(subscription, symbols)
+
+    async def rebalance(self, subscription: str, symbols: list) -> bool:
+        """
+        Bring shards in line with a new symbol list: streams of removed symbols
+        are released and new ones are placed on the least loaded shards
+        """
+        async with self._lock(subscription):
+            symbols = {stock2symbol(s) for s in symbols}
+            current = self.symbols(subscription)
+            await self._unsubscribe(subscription, list(current.difference(symbols)))
+            return await self._subscribe(subscription, sorted(symbols.difference(current)))
+
+    async def wait(self):
+        await asyncio.gather(*[shard.scheduler.wait() for shard in self._shards])
+
+    async def close(self):
+        for shard in self._shards:
+            if shard.task:
+                shard.task.cancel()
+            if shard.handler:
+                await shard.handler.close()
+        self._shards.clear()
+
+    def _lock(self, subscription: str) -> asyncio.Lock:
+        if subscription not in self._locks:
+            self._locks[subscription] = asyncio.Lock()
+        return self._locks[subscription]
+
+    async def _subscribe(self, subscription: str, symbols: list) -> bool:
+        assigned = self._assign(subscription, [stock2symbol(s) for s in symbols])
+        results = await asyncio.gather(*[
+            self._send(shard, True, subscription, _symbols)
+            for shard, _symbols in assigned.items()
+        ])
+        return all(results)
+
+    async def _unsubscribe(self, subscription: str, symbols: Optional[list] = None) -> bool:
+        requests = []
+        for shard in self._shards:
+            subscribed = shard.streams.get(subscription, set())
+            _symbols = subscribed if symbols is None else subscribed.intersection(stock2symbol(s) for s in symbols)
+            if not _symbols:
+                continue
+            subscribed.difference_update(_symbols)
+            requests.append(self._send(shard, False, subscription, sorted(_symbols)))
+        return all(await asyncio.gather(*requests))
+
+    def _assign(self, subscription: str, symbols: list) -> Dict[BinanceShard, list]:
+        assigned = {}
+        subscribed = self.symbols(subscription)
+        for symbol in symbols:
+            if symbol in subscribed:
+                continue
+            if (shard := self._free_shard()) is None:
+                self._api.logger.warning(f"{self.__class__.__name__} - no free shard for {subscription} streams, "
+                                         f"max shards: {self.max_shards}")
+                break
+            shard.streams.setdefault(subscription, set()).add(symbol)
+            assigned.setdefault(shard, []).append(symbol)
+            subscribed.add(symbol)
+        return assigned
+
+    def _free_shard(self) -> Optional[BinanceShard]:
+        shards = [shard for shard in self._shards if len(shard) < self.max_streams]
+        if shards:
+            return min(shards, key=len)
+        if self.max_shards is not None and len(self._shards) >= self.max_shards:
+            return None
+        shard = BinanceShard(self._api, len(self._shards))
+        self._shards.append(shard)
+        return shard
+
+    async def _send(self, shard: BinanceShard, subscribe: bool, subscription: str, symbols: list) -> bool:
+        if not subscribe:
+            return shard.scheduler.unsubscribe(subscription, symbols)
+        if shard.closed:
+            try:
+                await self._connect(shard)
+            except CONNECT_ERRORS as e:
+                self._api.logger.warning(f"{self.__class__.__name__} - shard {shard.index} - {e!r}")
+                return False
+        return shard.scheduler.subscribe(subscription, symbols)
+
+    async def _connect(self, shard: BinanceShard):
+        shard.handler = await self._api._connect_throttled()
+        if shard.task is None or shard.task.done():
+            shard.task = asyncio.create_task(self._consume(shard))
+            self._api.tasks.append(shard.task)
+
+    async def _consume(self, shard: BinanceShard):
+        while True:
+            try:
+                message = await shard.handler.recv()
+            except ConnectionClosed:
+                await shard.backoff.wait()
+                await self._restore(shard)
+                continue
+            try:
+                await self._api.dispatch_frame(message)
+            except Exception as e:
+                self._api.logger.error(f"{self.__class__.__name__} - shard {shard.index} - {e!r}")
+
+    async def _restore(self, shard: BinanceShard):
+        try:
+            shard.handler = await self._api._connect_throttled()
+        except CONNECT_ERRORS as e:
+            self._api.logger.warning(f"{self.__class__.__name__} - shard {shard.index} - {e!r}")
+            return
+        shard.backoff.reset()
+        shard.scheduler.clear()
+        for subscription, symbols in shard.streams.items():
+            shard.scheduler.subscribe(subscription, sorted(symbols))
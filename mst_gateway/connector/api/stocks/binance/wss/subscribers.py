@@ -1,6 +1,5 @@
 from __future__ import annotations
 import asyncio
-import json
 from asyncio import CancelledError
 from typing import TYPE_CHECKING, Optional
 from websockets.exceptions import ConnectionClosedError
@@ -8,9 +7,10 @@ from mst_gateway.connector.api.types import OrderSchema
 from mst_gateway.connector.api.stocks.binance.lib.exceptions import BinanceAPIException
 from mst_gateway.exceptions import QueryError, GatewayError
 from .. import utils
+from ....wss.listener import StateListener
 from ....wss.subscriber import Subscriber
 from ......storage.var import StateStorageKey
-from .utils import cmd_subscribe, cmd_unsubscribe, cmd_request
+from .utils import cmd_request
 from .. import rest
 
 if TYPE_CHECKING:
@@ -27,28 +27,22 @@ class BinanceSubscriber(Subscriber):
     async def _subscribe(self, api: BinanceWssApi, symbol=None):
         for subscription in self.subscriptions:
             if symbol in ('*', None) and not self.general_subscribe_available:
-                # TODO: support limit symbol count by exchange
-                symbols = api.state_symbol_list[:900]
+                symbols = self._limit_symbols(api, api.state_symbol_list)
                 # run task watcher for new symbols
                 self._subscribed_symbols = set(symbols)
                 self._task_watcher = asyncio.create_task(self.subscribe_watcher(api))
-                asyncio.create_task(
-                    self.send_command(cmd_subscribe, api, subscription, symbols)
-                )
+                if api.shard_pool is not None:
+                    asyncio.create_task(api.shard_pool.subscribe(subscription, symbols))
+                else:
+                    api.command_scheduler.subscribe(subscription, symbols)
             elif symbol not in ('*', None) and not self.detail_subscribe_available:
-                try:
-                    await api.handler.send(cmd_subscribe(subscription))
-                except (CancelledError, ConnectionClosedError) as e:
-                    api.logger.warning(f"{self.__class__.__name__} - {e}")
+                if not api.command_scheduler.subscribe(subscription):
                     return False
-            else:
-                if not api.handler or api.handler.closed:
-                    return False
-                try:
-                    await api.handler.send(cmd_subscribe(subscription, symbol))
-                except (CancelledError, ConnectionClosedError) as e:
-                    api.logger.warning(f"{self.__class__.__name__} - {e}")
+            elif symbol not in ('*', None) and api.shard_pool is not None:
+                if not await api.shard_pool.subscribe(subscription, [symbol]):
                     return False
+            elif not api.command_scheduler.subscribe(subscription, symbol):
+                return False
         return True
 
     async def _unsubscribe(self, api: BinanceWssApi, symbol=None):
@@ -59,35 +53,31 @@ class BinanceSubscriber(Subscriber):
                 # stop task watcher for new symbols
                 if self._task_watcher is not None:
                     self._task_watcher.cancel()
-                asyncio.create_task(
-                    self.send_command(cmd_unsubscribe, api, subscription, list(self._subscribed_symbols))
-                )
+                if api.shard_pool is not None:
+                    asyncio.create_task(api.shard_pool.unsubscribe(subscription))
+                else:
+                    api.command_scheduler.unsubscribe(subscription, list(self._subscribed_symbols))
             elif symbol not in ('*', None) and not self.detail_subscribe_available:
-                if not api.handler or api.handler.closed:
-                    return True
-                try:
-                    await api.handler.send(cmd_unsubscribe(subscription))
-                except (CancelledError, ConnectionClosedError) as e:
-                    api.logger.warning(f"{self.__class__.__name__} - {e}")
+                api.command_scheduler.unsubscribe(subscription)
+            elif symbol not in ('*', None) and api.shard_pool is not None:
+                await api.shard_pool.unsubscribe(subscription, [symbol])
             else:
-                if not api.handler or api.handler.closed:
-                    return True
-                try:
-                    await api.handler.send(cmd_unsubscribe(subscription, symbol))
-                except (CancelledError, ConnectionClosedError) as e:
-                    api.logger.warning(f"{self.__class__.__name__} - {e}")
+                api.command_scheduler.unsubscribe(subscription, symbol)
         return True
 
-    async def send_command(self, command: callable, api: BinanceWssApi, subscription: str, symbols: list):
-        symbols_count = len(symbols)
-        try:
-            for i in range(0, symbols_count, 200):
-                await asyncio.sleep(1)
-                if not api.handler or api.handler.closed:
-                    return
-                await api.handler.send(command(subscription, symbols[i:i+200]))
-        except (CancelledError, ConnectionClosedError) as e:
-            api.logger.warning(f"{self.__class__.__name__} - {e}")
+    @staticmethod
+    def _limit_symbols(api: BinanceWssApi, symbols: list) -> list:
+        """
+        Sharded connections take any symbol count, a single connection
+        is limited by `max_streams` per subscription
+        """
+        if api.shard_pool is not None:
+            return list(symbols)
+        symbols = list(symbols)
+        if len(symbols) > api.max_streams:
+            api.logger.warning(f"{api} - more than {api.max_streams} streams, not subscribed: "
+                               f"{', '.join(symbols[api.max_streams:])}")
+        return symbols[:api.max_streams]
 
     async def send_request(self, command: callable, api: BinanceWssApi, channel_name: str):
         try:
@@ -101,26 +91,23 @@ class BinanceSubscriber(Subscriber):
         """
         watcher for new symbol when `general_subscribe_available` is False
         """
-        redis = api.storage.get_client()
-        pubsub = redis.pubsub()
-        pubsub.subscribe(f"{StateStorageKey.symbol}.{api.name}.{api.schema}")
-        while True:
+        if (listener := StateListener.shared(api.storage, api.logger)) is None:
+            return
+        async for state_data in listener.listen(f"{StateStorageKey.symbol}.{api.name}.{api.schema}"):
             if api.handler and api.handler.closed:
                 break
-            message = pubsub.get_message()
-            if message and message['type'] == 'message':
-                # TODO: support limit symbol count by exchange
-                symbols = set(list(json.loads(message['data']).keys())[:900])
+            symbols = set(self._limit_symbols(api, list(state_data.keys())))
+            if api.shard_pool is not None:
+                for subscription in self.subscriptions:
+                    await api.shard_pool.rebalance(subscription, list(symbols))
+            else:
                 unsubscribe_symbols = self._subscribed_symbols.difference(symbols)
                 subscribe_symbols = symbols.difference(self._subscribed_symbols)
                 for symbol in unsubscribe_symbols:
-                    await asyncio.sleep(1)
                     await self._unsubscribe(api, symbol)
                 for symbol in subscribe_symbols:
-                    await asyncio.sleep(1)
                     await self._subscribe(api, symbol)
-                self._subscribed_symbols = symbols
-            await asyncio.sleep(0.5)
+            self._subscribed_symbols = symbols
 
 
 class BinanceOrderBookSubscriber(BinanceSubscriber):
@@ -129,6 +116,11 @@ class BinanceOrderBookSubscriber(BinanceSubscriber):
     general_subscribe_available = False
     is_close_connection = False
 
+    async def _unsubscribe(self, api: BinanceWssApi, symbol=None):
+        if api.order_books is not None:
+            api.order_books.discard(None if symbol in ('*', None) else symbol)
+        return await super()._unsubscribe(api, symbol)
+
 
 class BinanceTradeSubscriber(BinanceSubscriber):
     subscription = "trade"
@@ -1,15 +1,21 @@
-import json
 from mst_gateway.connector.api.stocks.binance.utils import stock2symbol
+from ....utils import JSON_CODEC, json_loads, json_dumps
 
 
 def make_cmd(cmd, args, symbol=None):
+    return make_params_cmd(cmd, make_params(args, symbol))
+
+
+def make_params(args, symbol=None) -> list:
     if isinstance(symbol, list) and symbol not in ('*', None):
-        params = [f'{stock2symbol(s)}@{convert_args(args)}' for s in symbol]
+        return [f'{stock2symbol(s)}@{convert_args(args)}' for s in symbol]
     elif symbol not in ('*', None):
-        params = [f'{stock2symbol(symbol)}@{convert_args(args)}']
-    else:
-        params = [args]
-    return json.dumps({
+        return [f'{stock2symbol(symbol)}@{convert_args(args)}']
+    return [args]
+
+
+def make_params_cmd(cmd, params: list):
+    return json_dumps({
         'method': cmd,
         'params': params,
         'id': 1
@@ -40,15 +46,15 @@ def cmd_request(listen_key, channel_name):
 
 def is_ok(response: str) -> bool:
     try:
-        data = json.loads(response)
-    except json.JSONDecodeError:
+        data = json_loads(response)
+    except JSON_CODEC.decode_errors:
         return False
     return data.get('result', True) is None
 
 
 def is_auth_ok(response: str) -> bool:
     try:
-        data = json.loads(response)
-    except json.JSONDecodeError:
+        data = json_loads(response)
+    except JSON_CODEC.decode_errors:
         return False
     return not bool(data.get('error'))
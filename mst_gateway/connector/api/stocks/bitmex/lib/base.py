@@ -9,6 +9,7 @@ from typing import Optional, Union
 from .exceptions import BitmexAPIException
 from .factory import BitmexMethodFactory
 from ...lib import AbstractApiClient
+from ....utils import json_loads
 
 
 class BaseBitmexApiClient(AbstractApiClient, abc.ABC):
@@ -59,4 +60,4 @@ class BaseBitmexApiClient(AbstractApiClient, abc.ABC):
     def handle_response(response: httpx.Response) -> dict:
         if not (200 <= response.status_code < 300):
             raise BitmexAPIException(response)
-        return response.json()
+        return json_loads(response.content)
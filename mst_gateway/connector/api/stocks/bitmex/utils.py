@@ -11,6 +11,8 @@ from .converter import BitmexOrderTypeConverter
 from ...types.asset import to_system_asset
 from ...types.binsize import BinSize
 from ...utils.order_book import generate_order_book_id
+from ...utils.time import parse_iso_datetime
+from ...utils.utils import load_symbol_state_fragment
 
 
 def load_symbol_data(raw_data: dict, state_data: Optional[dict]) -> dict:
@@ -52,7 +54,8 @@ def load_symbol_data(raw_data: dict, state_data: Optional[dict]) -> dict:
     return data
 
 
-def load_symbol_ws_data(raw_data: dict, state_data: Optional[dict], use_state: bool = False) -> dict:
+def load_symbol_ws_data(raw_data: dict, state_data: Optional[dict], use_state: bool = False,
+                        fragment: Optional[tuple] = None) -> dict:
     symbol = raw_data.get('symbol')
     symbol_time = to_iso_datetime(raw_data.get('timestamp'))
     price = to_float(raw_data.get('lastPrice'))
@@ -75,23 +78,20 @@ def load_symbol_ws_data(raw_data: dict, state_data: Optional[dict], use_state: b
         'fr': funding_rate
     }
     if isinstance(state_data, dict):
-        face_price_data = state_data.get('extra', {}).get('face_price_data', {})
-        face_price = BitmexFinFactory.calc_face_price(price, **face_price_data)
-        data.update({
-            'fp': face_price,
-            'exp': state_data.get('expiration'),
-            'expd': state_data.get('expiration_date'),
-            'pa': state_data.get('pair'),
-            'tck': state_data.get('tick'),
-            'vt': state_data.get('volume_tick'),
-            'ss': state_data.get('system_symbol'),
-            'crt': to_iso_datetime(state_data.get('created')),
-            'mlvr': state_data.get('max_leverage'),
-            'wa': state_data.get('wallet_asset'),
-        })
+        face_price_data, fields = fragment or load_symbol_ws_fragment(state_data)
+        data['fp'] = BitmexFinFactory.calc_face_price(price, **face_price_data)
+        data.update(fields)
     return data
 
 
+def load_symbol_ws_fragment(state_data: dict) -> tuple:
+    """
+    `load_symbol_state_fragment` of a BitMEX state symbol, whose creation
+    time is a datetime or an ISO string
+    """
+    return load_symbol_state_fragment(state_data, crt=to_iso_datetime(state_data.get('created')))
+
+
 def load_funding_rate(value: float) -> float:
     return value * 100 if value else value
 
@@ -438,10 +438,8 @@ def load_order_book_data(raw_data: dict, state_data: Optional[dict]) -> dict:
     return data
 
 
-def load_ws_order_book_data(raw_data: dict, state_data: Optional[dict], price_by_id: dict) -> dict:
-    _id = raw_data.get('id')
-    symbol = raw_data.get('symbol')
-    price = to_float(raw_data.get('price') or to_float(price_by_id[symbol].get(_id)))
+def load_ws_order_book_data(raw_data: dict, state_data: Optional[dict], price: Optional[float]) -> dict:
+    price = to_float(raw_data.get('price') or price)
     _id = generate_order_book_id(price, state_data)
     data = {
         'id': _id,
@@ -576,7 +574,7 @@ def to_date(token: Union[datetime, str]) -> Optional[datetime]:
     if isinstance(token, datetime):
         return token
     try:
-        return datetime.strptime(token.split('Z')[0], api.DATETIME_FORMAT)
+        return parse_iso_datetime(token)
     except (ValueError, TypeError, IndexError):
         return None
 
@@ -588,7 +586,7 @@ def to_iso_datetime(token: Union[datetime, str]) -> Optional[str]:
         if isinstance(token, datetime):
             return token.strftime(api.DATETIME_FORMAT)
         elif isinstance(token, str):
-            return datetime.strptime(token.split('Z')[0], api.DATETIME_FORMAT).strftime(api.DATETIME_FORMAT)
+            return parse_iso_datetime(token).strftime(api.DATETIME_FORMAT)
     except (ValueError, TypeError, IndexError):
         return None
 
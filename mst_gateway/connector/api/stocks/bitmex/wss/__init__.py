@@ -6,6 +6,8 @@ from . import subscribers as subscr_class
 from .router import BitmexWssRouter
 from .utils import is_auth_ok, make_cmd
 from .. import var
+from ..utils import load_symbol_ws_fragment, to_date
+from ....utils.time import time2epoch
 from ....wss import StockWssApi, ThrottleWss
 from ....types import ExchangeDrivers
 
@@ -33,6 +35,8 @@ class BitmexWssApi(StockWssApi):
     }
 
     router_class = BitmexWssRouter
+    # tables whose inserted rows carry the time of the event in `timestamp`
+    event_time_tables = ('trade', 'quote')
     throttle = ThrottleWss(ws_limit=var.BITMEX_THROTTLE_LIMITS.get('ws'))
 
     async def _connect(self, **kwargs):
@@ -62,6 +66,21 @@ class BitmexWssApi(StockWssApi):
             return message
         return None
 
+    def _load_state_fragment(self, state_data: dict) -> Optional[tuple]:
+        return load_symbol_ws_fragment(state_data)
+
+    def _event_time(self, message: dict) -> Optional[float]:
+        """
+        Time of the last event of a message, only for new rows of `event_time_tables`,
+        `timestamp` of other tables or of partials is the time of the row state
+        """
+        if message.get('table') not in self.event_time_tables or message.get('action') not in ('update', 'insert'):
+            return None
+        if (data := message.get('data')) and isinstance(data[-1], dict):
+            if event_time := to_date(data[-1].get('timestamp')):
+                return time2epoch(event_time)
+        return None
+
     def __split_message_map(self, key: str) -> Optional[callable]:
         _map = {
             'execution': self.split_order,
@@ -0,0 +1,110 @@
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+from ..utils import to_float
+
+ID_BLOCK = 100000000
+ID_TICKS = tuple(m * 10 ** -k for k in range(9) for m in (1, 5, 25))
+
+
+class BitmexOrderBook:
+    """
+    L2 book of one instrument kept from `orderBookL2` or `orderBookL2_25` messages.
+
+    Level ids encode prices as `id = ID_BLOCK * instrument index - price / tick`,
+    so prices are derived from ids once the base and tick are known from a level
+    with a price. Levels which do not fit that encoding keep their price aside.
+    Every side holds level keys and sizes in arrays sorted towards the best price
+    at the end (the key is the id of a Sell level and the negated id of a Buy one),
+    so inserting or removing a level moves only the levels between it and the best price.
+    """
+
+    def __init__(self, symbol: str, tick: Optional[float] = None):
+        self.symbol = symbol
+        self.base: Optional[int] = None
+        self.tick: Optional[float] = None
+        self._ticks = ID_TICKS if tick is None else (tick, *ID_TICKS)
+        self._prices: Dict[int, float] = {}
+        self._keys = {'Buy': array('q'), 'Sell': array('q')}
+        self._sizes = {'Buy': array('d'), 'Sell': array('d')}
+
+    def __len__(self):
+        return len(self._keys['Buy']) + len(self._keys['Sell'])
+
+    def price(self, level_id: int) -> Optional[float]:
+        if (price := self._prices.get(level_id)) is not None:
+            return price
+        if self.base is None:
+            return None
+        return round((self.base - level_id) * self.tick, 8)
+
+    def apply(self, action: str, item: dict) -> Optional[float]:
+        """
+        Apply a level of a table message, returns the level price.
+        A `partial` message should `clear` the book first.
+        """
+        level_id = item.get('id')
+        if level_id is None:
+            return None
+        price = self.price(level_id)
+        if action in ('partial', 'insert') and (_price := item.get('price')) is not None:
+            price = self._set_price(level_id, to_float(_price), price)
+        if action == 'delete':
+            self._remove(item.get('side'), level_id)
+            self._prices.pop(level_id, None)
+        elif item.get('size') is not None:
+            self._set_size(item.get('side'), level_id, item['size'])
+        return price
+
+    def clear(self):
+        self._prices.clear()
+        for side in ('Buy', 'Sell'):
+            del self._keys[side][:]
+            del self._sizes[side][:]
+
+    def levels(self, side: str, depth: int = None) -> List[Tuple[float, float]]:
+        """
+        Price and size of `side` levels from the best price
+        """
+        keys, sizes = self._keys.get(side, ()), self._sizes.get(side, ())
+        sign = -1 if side == 'Buy' else 1
+        indexes = range(len(keys) - 1, -1, -1)
+        if depth is not None:
+            indexes = indexes[:depth]
+        return [(self.price(sign * keys[i]), sizes[i]) for i in indexes]
+
+    def _set_price(self, level_id: int, price: float, derived: Optional[float]) -> float:
+        if derived is None and self.base is None:
+            self._calibrate(level_id, price)
+            derived = self.price(level_id)
+        if derived != price:
+            self._prices[level_id] = price
+        return price
+
+    def _calibrate(self, level_id: int, price: float):
+        for tick in self._ticks:
+            index = level_id + price / tick
+            base = round(index)
+            if abs(index - base) < 1e-3 and base and base % ID_BLOCK == 0:
+                self.base, self.tick = base, tick
+                return
+
+    def _set_size(self, side: str, level_id: int, size: float):
+        if (keys := self._keys.get(side)) is None:
+            return
+        key = -level_id if side == 'Buy' else level_id
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            self._sizes[side][index] = size
+        else:
+            keys.insert(index, key)
+            self._sizes[side].insert(index, size)
+
+    def _remove(self, side: str, level_id: int):
+        if (keys := self._keys.get(side)) is None:
+            return
+        key = -level_id if side == 'Buy' else level_id
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            del keys[index]
+            del self._sizes[side][index]
@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from .base import BitmexSerializer
+from ..order_book import BitmexOrderBook
 from ...utils import load_ws_order_book_data
 from mst_gateway.connector.api.wss import StockWssApi
 
@@ -10,33 +11,37 @@ class BitmexOrderBookSerializer(BitmexSerializer):
 
     def __init__(self, wss_api: StockWssApi):
         super().__init__(wss_api)
-        self._order_book_ids = {}
+        self._books: Dict[str, BitmexOrderBook] = {}
 
     def is_item_valid(self, message: dict, item: dict) -> bool:
         return True
 
+    def book(self, symbol: str) -> Optional[BitmexOrderBook]:
+        return self._books.get(symbol)
+
+    async def _get_data(self, message: dict) -> Tuple[str, list]:
+        if message.get('action') == 'partial':
+            for symbol in {item.get('symbol') for item in message['data']}:
+                self._get_book(symbol).clear()
+        return await super()._get_data(message)
+
     async def _load_data(self, message: dict, item: dict) -> Optional[dict]:
         if not self.is_item_valid(message, item):
             return None
         symbol = item.get('symbol')
-        action = message.get('action')
-        self._order_book_ids.setdefault(symbol, {})
-        self._add_to_order_book_ids(action, symbol, item)
+        price = self._get_book(symbol).apply(message.get('action'), item)
         state_data = None
         if self._wss_api.register_state:
             if (state_data := self._wss_api.get_state_data(symbol)) is None:
                 return None
-        data = load_ws_order_book_data(item, state_data, self._order_book_ids)
-        self._del_from_order_book_ids(action, symbol, item)
-        return data
-
-    def _add_to_order_book_ids(self, action, symbol, item):
-        if action in ('partial', 'insert'):
-            self._order_book_ids[symbol][item.get('id')] = item.get('price')
-
-    def _del_from_order_book_ids(self, action, symbol, item):
-        if action == 'delete':
-            self._order_book_ids.get(symbol, {}).pop(item.get('id'))
+        return load_ws_order_book_data(item, state_data, price)
+
+    def _get_book(self, symbol: str) -> BitmexOrderBook:
+        if (book := self._books.get(symbol)) is None:
+            state_data = self._wss_api.get_state_data(symbol)
+            tick = state_data.get('tick') if isinstance(state_data, dict) else None
+            book = self._books[symbol] = BitmexOrderBook(symbol, tick)
+        return book
 
     def state(self, symbol: str = None) -> Optional[dict]:
         return None
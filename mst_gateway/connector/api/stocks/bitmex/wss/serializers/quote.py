@@ -1,8 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 from datetime import datetime, timedelta
-from mst_gateway.connector import api
 from mst_gateway.connector.api.stocks.bitmex import utils
+from mst_gateway.connector.api.utils.time import time2minute
 from .base import BitmexSerializer
 
 if TYPE_CHECKING:
@@ -15,6 +15,7 @@ class BitmexQuoteBinSerializer(BitmexSerializer):
     def __init__(self, wss_api: BitmexWssApi):
         super().__init__(wss_api)
         self._bins = {}
+        self._bin_times = {}
         self._initialized = None
 
     def prefetch(self, message: dict) -> None:
@@ -25,6 +26,11 @@ class BitmexQuoteBinSerializer(BitmexSerializer):
                     item['timestamp'] = (time - timedelta(minutes=1)).replace(second=59, microsecond=999999)
                 data += [item, self.create_open_data(item)]
             message['data'] = data
+            return
+        # timestamps are parsed once here, the shared trade serializer formats the datetime as well
+        for item in message.get('data') or ():
+            if time := utils.to_date(item.get('timestamp')):
+                item['timestamp'] = time
 
     @staticmethod
     def create_open_data(item: dict) -> dict:
@@ -32,7 +38,7 @@ class BitmexQuoteBinSerializer(BitmexSerializer):
             bin_time = (bin_time + timedelta(minutes=1)).replace(second=0, microsecond=000000)
         close = item.get('close')
         return {
-            'timestamp': utils.to_iso_datetime(bin_time),
+            'timestamp': bin_time,
             'symbol': item.get('symbol'),
             'open': close,
             'close': close,
@@ -81,7 +87,8 @@ class BitmexQuoteBinSerializer(BitmexSerializer):
             self._bins[symbol] = utils.update_quote_bin(quote_bin, quote)
         else:
             self._bins[symbol] = utils.quote2bin(quote)
-        return self._bins[symbol]
+        self._set_bin_time(symbol, item['timestamp'])
+        return dict(self._bins[symbol])
 
     def _reset_quote_bin(self, item: dict, state_data: dict) -> dict:
         symbol = item['symbol'].lower()
@@ -94,16 +101,17 @@ class BitmexQuoteBinSerializer(BitmexSerializer):
             'lop': min(new_bin['lop'], prev_bin_cl),
         })
         self._bins[symbol] = new_bin
-        return self._bins[symbol]
+        self._set_bin_time(symbol, item['timestamp'])
+        return dict(new_bin)
+
+    def _set_bin_time(self, symbol: str, time: datetime) -> None:
+        if isinstance(time, datetime):
+            self._bin_times[symbol] = (time2minute(time), time)
 
     def _minute_updated(self, item: dict) -> Optional[bool]:
-        if old := self._bins.get(item['symbol'].lower()):
-            try:
-                ts_old = datetime.strptime(old['tm'].split('Z')[0], api.DATETIME_FORMAT)
-                ts_new = datetime.strptime(item['timestamp'].split('Z')[0], api.DATETIME_FORMAT)
-            except (ValueError, TypeError, IndexError):
-                return None
-            if ts_new < ts_old:
+        if old := self._bin_times.get(item['symbol'].lower()):
+            time = item['timestamp']
+            if not isinstance(time, datetime) or time < old[1]:
                 return None
-            return ts_new.minute > ts_old.minute
+            return time2minute(time) > old[0]
         return False
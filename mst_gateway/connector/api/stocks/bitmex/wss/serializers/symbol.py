@@ -20,6 +20,7 @@ class BitmexSymbolSerializer(BitmexSerializer):
             for item in message.get('data', []):
                 symbol = stock2symbol(item['symbol'])
                 if state := self._get_state(symbol):
+                    state = [dict(state[0])]
                     if item.get('lastPrice'):
                         state[0]['p'] = item['lastPrice']
                     if item.get('volume24h'):
@@ -72,9 +73,11 @@ class BitmexSymbolSerializer(BitmexSerializer):
             return None
         symbol = stock2symbol(item['symbol'])
         state_data = None
+        fragment = None
         if self._wss_api.register_state:
             if (state_data := self._wss_api.get_state_data(symbol)) is None:
                 return None
+            fragment = self._wss_api.get_state_fragment(symbol)
         use_state = False
         if state := self._get_state(symbol):
             for k in state[0]:
@@ -83,4 +86,4 @@ class BitmexSymbolSerializer(BitmexSerializer):
                     if _mapped_key in ('fundingRate',):
                         use_state = True
                     item[_mapped_key] = state[0][k]
-        return load_symbol_ws_data(item, state_data, use_state)
+        return load_symbol_ws_data(item, state_data, use_state, fragment)
@@ -12,8 +12,11 @@ if TYPE_CHECKING:
 class BitmexSubscriber(Subscriber):
     subscriptions = ()
 
+    def get_subscriptions(self, api: BitmexWssApi) -> tuple:
+        return self.subscriptions
+
     async def _subscribe(self, api: BitmexWssApi, symbol=None):
-        for subscription in self.subscriptions:
+        for subscription in self.get_subscriptions(api):
             if not api.handler or api.handler.closed:
                 return False
             try:
@@ -24,7 +27,7 @@ class BitmexSubscriber(Subscriber):
         return True
 
     async def _unsubscribe(self, api: BitmexWssApi, symbol=None):
-        for subscription in self.subscriptions:
+        for subscription in self.get_subscriptions(api):
             if not api.handler or api.handler.closed:
                 return True
             try:
@@ -51,6 +54,12 @@ class BitmexOrderBookSubscriber(BitmexSubscriber):
     subscriptions = ("orderBookL2_25",)
     is_close_connection = False
 
+    def get_subscriptions(self, api: BitmexWssApi) -> tuple:
+        # `full_order_book` option subscribes all levels instead of the top 25
+        if api.options.get('full_order_book'):
+            return ("orderBookL2",)
+        return self.subscriptions
+
 
 class BitmexTradeSubscriber(BitmexSubscriber):
     subscription = "trade"
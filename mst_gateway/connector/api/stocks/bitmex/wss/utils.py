@@ -1,12 +1,12 @@
-import json
 from ..utils import symbol2stock
+from ....utils import JSON_CODEC, json_loads, json_dumps
 
 
 def make_cmd(cmd, args, symbol=None):
     if symbol not in ('*', None):
         symbol = symbol2stock(symbol)
         args = f"{args}:{symbol}"
-    return json.dumps({
+    return json_dumps({
         'op': cmd,
         'args': args
     })
@@ -22,15 +22,15 @@ def cmd_unsubscribe(subscr_name, symbol=None):
 
 def is_ok(response: str) -> bool:
     try:
-        data = json.loads(response)
-    except json.JSONDecodeError:
+        data = json_loads(response)
+    except JSON_CODEC.decode_errors:
         return False
     return bool(data.get('success'))
 
 
 def is_auth_ok(response: str) -> bool:
     try:
-        data = json.loads(response)
-    except json.JSONDecodeError:
+        data = json_loads(response)
+    except JSON_CODEC.decode_errors:
         return False
     return not bool(data.get('error'))
@@ -1,4 +1,5 @@
 # flake8: noqa
+from .codec import *
 from .time import *
 from .order_book import *
 from .message import *
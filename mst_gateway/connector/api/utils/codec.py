@@ -0,0 +1,141 @@
+import json
+from datetime import datetime
+from importlib import import_module
+from os import getenv
+from typing import Optional
+from .. import DATETIME_FORMAT
+
+__all__ = [
+    'JSON_CODEC_ENV',
+    'JSON_DECODE_TYPES',
+    'JsonCodec',
+    'OrjsonCodec',
+    'UjsonCodec',
+    'MsgspecCodec',
+    'JSON_CODECS',
+    'MsgpackCodec',
+    'load_json_codec',
+    'JSON_CODEC',
+    'json_loads',
+    'json_dumps',
+]
+
+JSON_CODEC_ENV = 'MST_GATEWAY_JSON_CODEC'
+JSON_DECODE_TYPES = (str, bytes, bytearray, memoryview)
+
+
+class JsonCodec:
+    name = 'json'
+    decode_errors = (json.JSONDecodeError,)
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, data) -> str:
+        return json.dumps(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = 'orjson'
+
+    def __init__(self):
+        self._orjson = import_module('orjson')
+        self._option = self._orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data):
+        if not isinstance(data, JSON_DECODE_TYPES):
+            raise TypeError(f"Unsupported type {type(data).__name__} to decode")
+        return self._orjson.loads(data)
+
+    def dumps(self, data) -> str:
+        return self._orjson.dumps(data, option=self._option).decode()
+
+
+class UjsonCodec(JsonCodec):
+    name = 'ujson'
+    decode_errors = (ValueError,)
+
+    def __init__(self):
+        self._ujson = import_module('ujson')
+
+    def loads(self, data):
+        if isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
+        return self._ujson.loads(data)
+
+    def dumps(self, data) -> str:
+        return self._ujson.dumps(data, ensure_ascii=False)
+
+
+class MsgspecCodec(JsonCodec):
+    name = 'msgspec'
+
+    def __init__(self):
+        msgspec = import_module('msgspec')
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self.decode_errors = (msgspec.DecodeError,)
+
+    def loads(self, data):
+        if not isinstance(data, JSON_DECODE_TYPES):
+            raise TypeError(f"Unsupported type {type(data).__name__} to decode")
+        return self._decoder.decode(data)
+
+    def dumps(self, data) -> str:
+        return self._encoder.encode(data).decode()
+
+
+JSON_CODECS = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    UjsonCodec.name: UjsonCodec,
+    JsonCodec.name: JsonCodec,
+}
+
+
+class MsgpackCodec:
+    """
+    Binary codec of payloads passed to `on_message`, numpy values are packed
+    as lists and numbers, datetimes as `DATETIME_FORMAT` strings like the loaders
+    """
+    name = 'msgpack'
+
+    def __init__(self):
+        self._msgpack = import_module('msgpack')
+        self._packer = self._msgpack.Packer(default=self._default, use_bin_type=True)
+
+    @staticmethod
+    def _default(value):
+        if hasattr(value, 'tolist'):
+            return value.tolist()
+        if isinstance(value, datetime):
+            return value.strftime(DATETIME_FORMAT)
+        raise TypeError(f"Unsupported type {type(value).__name__} to encode")
+
+    def loads(self, data):
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+    def dumps(self, data) -> bytes:
+        return self._packer.pack(data)
+
+
+def load_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Return codec by name, or the fastest installed one if name is empty.
+    Unknown or not installed codec falls back to stdlib json.
+    """
+    if name:
+        names = (name.lower(),)
+    else:
+        names = tuple(JSON_CODECS.keys())
+    for _name in names:
+        try:
+            return JSON_CODECS[_name]()
+        except (KeyError, ImportError):
+            continue
+    return JsonCodec()
+
+
+JSON_CODEC = load_json_codec(getenv(JSON_CODEC_ENV))
+json_loads = JSON_CODEC.loads
+json_dumps = JSON_CODEC.dumps
@@ -1,11 +1,11 @@
-import json
 from typing import Union
+from .codec import JSON_CODEC, json_loads, json_dumps
 
 
 def parse_message(message) -> Union[dict, list, None]:
     try:
-        return json.loads(message)
-    except json.JSONDecodeError:
+        return json_loads(message)
+    except JSON_CODEC.decode_errors:
         return {'raw': message}
     except Exception:
         return None
@@ -13,7 +13,7 @@ def parse_message(message) -> Union[dict, list, None]:
 
 def dump_message(data) -> Union[str, list, None]:
     try:
-        return json.dumps(data)
+        return json_dumps(data)
     except TypeError:
         return str(data)
     except Exception:
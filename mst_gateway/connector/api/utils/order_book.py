@@ -1,32 +1,83 @@
-from typing import Optional
+import math
+from decimal import Decimal
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 from mst_gateway.connector.api import BUY, SELL
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def pad_order_book(data: list, tick_size: float) -> list:
-    mid = _ob_middle_index(data)
+
+def pad_order_book(data: list, tick_size: float,
+                   make_id: Optional[Callable[[float], Optional[int]]] = None) -> list:
+    """
+    Fill missing tick levels of the thinner side of order book items (one side
+    after the other, prices descending, like `load_order_book_data`) with empty
+    levels, up to the price range of the other side. Empty levels get the id
+    `make_id(price)`, the id function of the exchange items, or None without it.
+    Data is returned as is without numpy installed.
+    """
+    if np is None or not data or not tick_size:
+        return data
+    prices = np.fromiter((item['price'] for item in data), np.float64, len(data))
+    mid = _ob_middle_index(np.fromiter((item['side'] for item in data), np.int8, len(data)))
     if not mid:
         return data
-    dim_s = data[0] - data[mid - 1]
-    dim_b = data[mid] - data[-1]
-    if dim_s > dim_b:
-        return _pad_ob_side(data, tick_size, BUY)
-    return _pad_ob_side(data, tick_size, SELL)
+    dim_first = prices[0] - prices[mid - 1]
+    dim_second = prices[mid] - prices[-1]
+    if dim_first > dim_second:
+        return data[:mid] + _pad_ob_side(data[mid:], prices[mid:], tick_size, dim_first, make_id)
+    return _pad_ob_side(data[:mid], prices[:mid], tick_size, dim_second, make_id) + data[mid:]
+
 
+def pad_order_book_levels(prices: 'np.ndarray', volumes: 'np.ndarray', tick_size: float, side: int,
+                          span: float = 0.0) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Prices and volumes of one side (prices descending) with a level for every tick
+    from the best price over `span` at least, missing levels have zero volume
+    """
+    top, depth, ticks = _ob_side_grid(prices, tick_size, side, span)
+    padded = np.zeros(depth + 1, dtype=volumes.dtype)
+    padded[top - ticks] = volumes
+    return _grid_prices(top, depth, tick_size), padded
+
+
+def _pad_ob_side(data: list, prices: 'np.ndarray', tick_size: float, span: float,
+                 make_id: Optional[Callable[[float], Optional[int]]]) -> list:
+    top, depth, ticks = _ob_side_grid(prices, tick_size, data[0]['side'], span)
+    if depth + 1 == len(data):
+        return data
+    padded: list = [None] * (depth + 1)
+    for position, item in zip((top - ticks).tolist(), data):
+        padded[position] = item
+    grid_prices = _grid_prices(top, depth, tick_size).tolist()
+    template = data[0]
+    for position, item in enumerate(padded):
+        if item is None:
+            price = grid_prices[position]
+            padded[position] = {**template, 'id': make_id(price) if make_id else None, 'price': price,
+                                'volume': 0.0}
+    return padded
 
-def _pad_ob_side(data, tick_size, side):
-    # pylint: disable=unused-argument
-    # TODO: fill the order book with gaps
-    return data
 
+def _ob_side_grid(prices: 'np.ndarray', tick_size: float, side: int, span: float) -> tuple:
+    ticks = np.rint(prices / tick_size).astype(np.int64)
+    depth = max(int(round(span / tick_size)), int(ticks[0] - ticks[-1]))
+    top = int(ticks[0]) if side == BUY else int(ticks[-1]) + depth
+    return top, depth, ticks
 
-def _ob_middle_index(data: list) -> Optional[int]:
-    if not data:
+
+def _grid_prices(top: int, depth: int, tick_size: float) -> 'np.ndarray':
+    decimals = max(0, -Decimal(str(tick_size)).as_tuple().exponent)
+    return np.round((top - np.arange(depth + 1, dtype=np.int64)) * tick_size, decimals)
+
+
+def _ob_middle_index(sides: 'np.ndarray') -> Optional[int]:
+    if not len(sides):
         return None
-    side = data[0]['side']
-    for k, in enumerate(data):
-        if data[k]['side'] != side:
-            return k
-    return None
+    index = int(np.argmax(sides != sides[0]))
+    return index or None
 
 
 def generate_order_book_id(price: float, state_data: Optional[dict]) -> Optional[int]:
@@ -36,3 +87,130 @@ def generate_order_book_id(price: float, state_data: Optional[dict]) -> Optional
     except (AttributeError, TypeError):
         return None
 
+
+class GroupedOrderBook:
+    """
+    Order book volumes grouped into price buckets of `group` ticks, kept for
+    several groupings at once. Buckets are updated by volume differences as
+    levels change, bids are grouped down and asks up to the bucket price.
+    Every bucket change is stamped with the next `sequence`, so each consumer
+    of `changes` reads from its own cursor.
+    """
+    precision = 10
+
+    def __init__(self, tick: float, groups: Iterable[int] = (1, 10, 100)):
+        self.tick = tick
+        self.groups = tuple(groups)
+        self.sequence = 0
+        self._levels: Dict[int, Dict[float, float]] = {BUY: {}, SELL: {}}
+        self._buckets: Dict[int, Dict[int, Dict[int, float]]] = {
+            group: {BUY: {}, SELL: {}} for group in self.groups
+        }
+        self._changed: Dict[int, Dict[int, Dict[int, int]]] = {
+            group: {BUY: {}, SELL: {}} for group in self.groups
+        }
+        self._cursors: Dict[tuple, int] = {}
+        self._sorted: Dict[tuple, list] = {}
+
+    def clear(self):
+        """
+        Remove all levels, the buckets they filled are reported as changed
+        """
+        self._levels = {BUY: {}, SELL: {}}
+        self.sequence += 1
+        for group in self.groups:
+            for side, buckets in self._buckets[group].items():
+                self._changed[group][side].update(dict.fromkeys(buckets, self.sequence))
+                buckets.clear()
+        self._sorted = {}
+
+    def load(self, items: Iterable[dict]):
+        """
+        Replace the book by order book items of `load_order_book_data` or
+        of the order book serializers, buckets left empty are reported as
+        changed with zero volume
+        """
+        self.clear()
+        self.apply(items)
+
+    def apply(self, items: Iterable[dict], action: str = 'update'):
+        for item in items:
+            price = item.get('p', item.get('price'))
+            volume = item.get('vl', item.get('volume'))
+            side = item.get('sd', item.get('side'))
+            self.update(price, 0.0 if action == 'delete' else volume, side)
+
+    def update(self, price: float, volume: Optional[float], side: int):
+        levels = self._levels.get(side)
+        if levels is None or price is None:
+            return
+        volume = volume or 0.0
+        diff = volume - levels.get(price, 0.0)
+        if volume:
+            levels[price] = volume
+        else:
+            levels.pop(price, None)
+        if not diff:
+            return
+        self.sequence += 1
+        for group in self.groups:
+            index = self._bucket_index(price, group, side)
+            buckets = self._buckets[group][side]
+            if (bucket := round(buckets.get(index, 0.0) + diff, self.precision)) > 0:
+                buckets[index] = bucket
+            else:
+                buckets.pop(index, None)
+            self._changed[group][side][index] = self.sequence
+            self._sorted.pop((group, side), None)
+
+    def get(self, group: int, side: int = None, depth: int = None) -> List[dict]:
+        """
+        Grouped levels from the best price, like `load_order_book_data`
+        """
+        data = []
+        for _side in (SELL, BUY):
+            if side is not None and side != _side:
+                continue
+            indexes = self._sorted_indexes(group, _side)
+            if depth is not None:
+                indexes = indexes[:depth]
+            if _side == SELL:
+                indexes = reversed(indexes)
+            data.extend(self._bucket_item(group, _side, index) for index in indexes)
+        return data
+
+    def changes(self, group: int, consumer: Hashable = None) -> List[dict]:
+        """
+        Buckets changed since the previous call of `consumer`, with zero volume
+        for emptied ones. Changes read by every consumer are dropped, so a new
+        consumer should start from `get`.
+        """
+        since = self._cursors.get((group, consumer), 0)
+        self._cursors[(group, consumer)] = self.sequence
+        data = []
+        for side in (SELL, BUY):
+            changed = self._changed[group][side]
+            indexes = sorted(index for index, sequence in changed.items() if sequence > since)
+            data.extend(self._bucket_item(group, side, index) for index in indexes)
+        read = min(cursor for (_group, _), cursor in self._cursors.items() if _group == group)
+        for side, changed in self._changed[group].items():
+            self._changed[group][side] = {index: sequence for index, sequence in changed.items() if sequence > read}
+        return data
+
+    def _sorted_indexes(self, group: int, side: int) -> list:
+        if (indexes := self._sorted.get((group, side))) is None:
+            indexes = self._sorted[(group, side)] = sorted(self._buckets[group][side], reverse=side == BUY)
+        return indexes
+
+    def _bucket_index(self, price: float, group: int, side: int) -> int:
+        index = price / (self.tick * group)
+        if side == BUY:
+            return math.floor(round(index, self.precision))
+        return math.ceil(round(index, self.precision))
+
+    def _bucket_item(self, group: int, side: int, index: int) -> dict:
+        return {
+            'price': round(index * self.tick * group, self.precision),
+            'volume': self._buckets[group][side].get(index, 0.0),
+            'side': side,
+        }
@@ -1,14 +1,63 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 from .. import DATETIME_FORMAT
 
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+
+def parse_iso_datetime(token: str) -> datetime:
+    """
+    Naive datetime of a `DATETIME_FORMAT` string with an optional `Z` suffix.
+
+    Millisecond and microsecond fractions go through `datetime.fromisoformat`,
+    anything else falls back to `strptime`, so invalid tokens raise as before.
+    """
+    token = token.split('Z')[0]
+    if len(token) in (23, 26) and token[10] == 'T' and token[19] == '.':
+        try:
+            return datetime.fromisoformat(token)
+        except ValueError:
+            pass
+    return datetime.strptime(token, DATETIME_FORMAT)
+
+
+def time2minute(time: datetime) -> int:
+    """
+    Minutes since the epoch of a naive UTC datetime
+    """
+    return (time.toordinal() - _EPOCH_ORDINAL) * 1440 + time.hour * 60 + time.minute
+
+
+@lru_cache(maxsize=4096)
+def _second_prefix(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def timestamp2iso(timestamp: int) -> str:
+    """
+    `DATETIME_FORMAT` string of an epoch milliseconds timestamp.
+
+    The part up to the second is formatted once per second and cached,
+    milliseconds are appended as digits.
+    """
+    seconds, msec = divmod(timestamp, 1000)
+    return f"{_second_prefix(seconds)}.{msec:03d}000"
+
+
+def time2epoch(time: datetime) -> float:
+    """
+    Seconds since the epoch of a naive UTC datetime
+    """
+    return time2minute(time) * 60 + time.second + time.microsecond / 1e6
+
 
 def time2timestamp(time: any, msec: bool = True) -> Optional[int]:
     try:
         if isinstance(time, datetime):
             timestamp = time.timestamp()
         elif isinstance(time, str):
-            timestamp = datetime.strptime(time.split('Z')[0], DATETIME_FORMAT).timestamp()
+            timestamp = parse_iso_datetime(time).timestamp()
         else:
             timestamp = datetime.now().timestamp()
     except (ValueError, TypeError, IndexError):
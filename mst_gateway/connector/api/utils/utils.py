@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from mst_gateway.connector.api.types import OrderSchema, ExchangeDrivers
 
 
@@ -8,3 +9,21 @@ def to_exchange_asset(driver: str, schema: str, asset: str) -> str:
     if schema != OrderSchema.margin_coin and asset == 'usd':
         return 'usdt'
     return asset
+
+
+def load_symbol_state_fragment(state_data: dict, **fields) -> tuple:
+    """
+    Face price kwargs and the read-only static fields of symbol records of a
+    state symbol, `fields` adds the fields the exchange loads its own way
+    """
+    return state_data.get('extra', {}).get('face_price_data', {}), MappingProxyType({
+        'exp': state_data.get('expiration'),
+        'expd': state_data.get('expiration_date'),
+        'pa': state_data.get('pair'),
+        'tck': state_data.get('tick'),
+        'vt': state_data.get('volume_tick'),
+        'ss': state_data.get('system_symbol'),
+        'mlvr': state_data.get('max_leverage'),
+        'wa': state_data.get('wallet_asset'),
+        **fields,
+    })
@@ -1,14 +1,26 @@
 import asyncio
-import json
+import sys
+import time
 import websockets
 from abc import ABCMeta, abstractmethod
 from logging import Logger
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 from copy import deepcopy
 from mst_gateway.storage import StateStorage, StateStorageKey
+from .capture import FrameCapture
+from .columnar import ColumnarBatcher
+from .conflation import SymbolConflator
+from .deltas import OrderBookDeltas
+from .ingest import IngestQueue, OverflowPolicy
+from .latency import LatencyRecorder
+from .listener import StateListener
+from .output import OUTPUT_ENCODERS
+from .quote_bins import QuoteBinAggregator
+from .reconnect import CONNECT_ERRORS, ReconnectBackoff
 from .router import Router
 from .subscriber import Subscriber
 from .throttle import ThrottleWss
+from .workers import WssWorkerPool
 from .. import errors, OrderSchema
 from ..utils import parse_message
 from ...base import Connector
@@ -23,8 +35,12 @@ class StockWssApi(Connector):
     name = "Base"
     BASE_URL = None
     TEST_URL = None
+    symbol_key = 'symbol'
     throttle = ThrottleWss()
     storage = StateStorage()
+    # a standby of an authenticated connection receives no data until promoted
+    standby_auth = True
+    worker_excluded_options = ()
 
     def __init__(self,
                  name: str = None,
@@ -58,8 +74,27 @@ class StockWssApi(Connector):
         super().__init__(auth, logger)
         self.__partial_state_data = {}
         self.__state_data = {}
+        self.__state_index = {}
+        self.__state_fragments = {}
         self.__init_partial_state_data()
         self.__recv_callback = None
+        self.__recv_batch = False
+        self._ingest_queue: Optional[IngestQueue] = None
+        self._overflow_policies = {}
+        self._overflow = {}
+        self._conflators: Dict[str, SymbolConflator] = {}
+        self._order_book_deltas: Optional[OrderBookDeltas] = None
+        self._quote_bin_aggregator: Optional[QuoteBinAggregator] = None
+        self._columnar: Optional[ColumnarBatcher] = None
+        self._output = None
+        self._latency: Optional[LatencyRecorder] = None
+        self._capture: Optional[FrameCapture] = None
+        self._worker_pool: Optional[WssWorkerPool] = None
+        self._reconnect = ReconnectBackoff()
+        self._standby: Optional[asyncio.Task] = None
+        self._standby_enabled = False
+        self._reconnects = 0
+        self._failovers = 0
 
     def _load_url(self, url):
         if self.test:
@@ -70,6 +105,14 @@ class StockWssApi(Connector):
     def options(self):
         return self._options
 
+    @property
+    def worker_options(self) -> dict:
+        """
+        Options of the api copies in worker processes, without the ones
+        starting connections or tasks, see `worker_excluded_options`
+        """
+        return {k: v for k, v in self._options.items() if k not in self.worker_excluded_options}
+
     @property
     def subscriptions(self):
         return self._subscriptions
@@ -169,6 +212,7 @@ class StockWssApi(Connector):
         symbol = symbol.lower() if isinstance(symbol, str) else '*'
         if subscr_name not in self._subscriptions:
             self._subscriptions[subscr_name] = dict()
+            self._reset_dispatch()
         if '*' in self._subscriptions[subscr_name]:
             self._subscriptions[subscr_name]['*'].add(subscr_channel)
             return True, '*'
@@ -205,6 +249,7 @@ class StockWssApi(Connector):
                 _res = True
             if not self._subscriptions[subscr_name]:
                 del self._subscriptions[subscr_name]
+                self._reset_dispatch()
             return _res, symbol
         return False, symbol
 
@@ -252,29 +297,473 @@ class StockWssApi(Connector):
         )
 
     async def consume(self, recv_callback: callable, **kwargs):
+        batch_size = kwargs.get('batch_size')
+        batch_time = kwargs.get('batch_time')
+        if kwargs.get('queue_size') and kwargs.get('workers'):
+            raise ValueError("queue_size and workers are exclusive consume modes")
+        if kwargs.get('columnar') and not batch_size:
+            raise ValueError("columnar payloads require a batch_size")
+        recv_callback = self._start_output(recv_callback, kwargs.get('output'))
+        self.__recv_callback = recv_callback
+        self.__recv_batch = bool(batch_size)
+        self._start_conflation(recv_callback, kwargs.get('conflate'))
+        self._start_order_book_deltas(recv_callback, kwargs.get('order_book_delta'),
+                                      kwargs.get('order_book_snapshot'))
+        self._start_quote_bin_aggregation(kwargs.get('quote_bin_sizes'))
+        self._start_columnar(kwargs.get('columnar'))
+        self._start_latency(kwargs.get('latency'))
+        self._start_capture(kwargs.get('capture'), kwargs.get('capture_segment_size'))
+        self._start_reconnect(kwargs.get('reconnect_delay'), kwargs.get('countdown'),
+                              kwargs.get('reconnect_jitter'), kwargs.get('standby'))
+        if kwargs.get('queue_size'):
+            return await self._consume_queued(recv_callback, **kwargs)
+        if kwargs.get('workers'):
+            return await self._consume_workers(recv_callback, **kwargs)
         while True:
-            if not self.handler:
-                try:
-                    await self.open()
-                except (OSError, TypeError, ValueError, ConnectionError):
-                    continue
-            if self.handler.closed:
-                await asyncio.sleep(kwargs.get('countdown', 10))
+            if not await self._ensure_handler(**kwargs):
+                continue
+            try:
+                if batch_size:
+                    messages = await self.recv_batch(batch_size, batch_time)
+                else:
+                    message = await self.handler.recv()
+                    if self._capture is not None:
+                        self._capture.append(message)
+            except websockets.ConnectionClosed:
+                continue
+            if batch_size:
+                await self.process_messages(messages, recv_callback)
+            else:
+                await self.process_message(message, recv_callback)
+
+    async def _ensure_handler(self, **kwargs) -> bool:
+        if not self.handler:
+            try:
+                await self.open()
+            except (*CONNECT_ERRORS, TypeError, ValueError) as e:
+                self._logger.warning(f"{self.__class__.__name__} - {e!r}")
+                await self._reconnect.wait()
+                return False
+            self._reconnect.reset()
+        elif self.handler.closed:
+            if not await self._promote_standby():
+                await self._reconnect.wait()
                 try:
                     await self.open(restore=True)
-                except (OSError, ConnectionError):
-                    continue
+                except CONNECT_ERRORS as e:
+                    self._logger.warning(f"{self.__class__.__name__} - {e!r}")
+                    return False
+            self._reconnect.reset()
+            self._reconnects += 1
+        self._keep_standby()
+        return True
+
+    def _start_reconnect(self, delay: Optional[float] = None, max_delay: Optional[float] = None,
+                         jitter: Optional[float] = None, standby: bool = False):
+        """
+        Wait `delay` seconds before the first reconnect attempt, doubling
+        on every failed attempt up to `max_delay`, less a random `jitter` part.
+        With `standby` a second connection is kept open and takes over
+        with restored subscriptions as soon as the current one is closed.
+        """
+        self._reconnect = ReconnectBackoff(
+            base=0.5 if delay is None else delay,
+            cap=10 if max_delay is None else max_delay,
+            jitter=0.5 if jitter is None else jitter
+        )
+        self._standby_enabled = bool(standby)
+
+    def _keep_standby(self):
+        if not self._standby_allowed:
+            return
+        if self._standby is not None and not self._standby.done():
+            return
+        if (handler := self._standby_handler()) is not None and not handler.closed:
+            return
+        self._standby = asyncio.create_task(self._connect_standby())
+        self.tasks.append(self._standby)
+
+    async def _connect_standby(self):
+        backoff = ReconnectBackoff(self._reconnect.base, self._reconnect.cap, jitter=self._reconnect.jitter)
+        while True:
+            try:
+                return await self._connect_throttled()
+            except CONNECT_ERRORS as e:
+                self._logger.warning(f"{self.__class__.__name__} - standby - {e!r}")
+            await backoff.wait()
+
+    async def _connect_throttled(self, **kwargs):
+        """
+        Open an additional connection to the api url within the connection rate limit
+        """
+        if not self.throttle.validate(key=dict(name=self.name, url=self._url), rate=self.throttle.ws_limit):
+            raise ConnectionError(f"{self} connection rate limit exceeded")
+        return await self._connect(**kwargs)
+
+    @property
+    def _standby_allowed(self) -> bool:
+        return self._standby_enabled and (self.standby_auth or not self.auth_connect)
+
+    def _standby_handler(self):
+        standby = self._standby
+        if standby is None or not standby.done() or standby.cancelled() or standby.exception():
+            return None
+        return standby.result()
+
+    async def _promote_standby(self) -> bool:
+        """
+        Replace the closed handler by the standby connection if it is open
+        """
+        handler = self._standby_handler()
+        if handler is None or handler.closed or not self._standby_allowed:
+            return False
+        self._standby = None
+        self._handler = handler
+        self._failovers += 1
+        await self._restore_subscriptions()
+        return True
+
+    @property
+    def reconnect_stats(self) -> dict:
+        return {
+            **self._reconnect.stats(),
+            'reconnects': self._reconnects,
+            'failovers': self._failovers,
+            'standby': (handler := self._standby_handler()) is not None and not handler.closed,
+        }
+
+    async def _consume_queued(self, recv_callback: callable, **kwargs):
+        """
+        Receive frames into a bounded ingest queue processed by separate tasks,
+        so a slow callback does not stall reading from the websocket
+        """
+        self._ingest_queue = IngestQueue(kwargs['queue_size'], self.symbol_key)
+        self._overflow_policies = {}
+        overflow = kwargs.get('overflow') or OverflowPolicy.block
+        if not isinstance(overflow, dict):
+            overflow = {'*': overflow}
+        self._overflow = overflow
+        for _ in range(kwargs.get('processors', 1)):
+            self.tasks.append(asyncio.create_task(
+                self._process_queue(recv_callback, kwargs.get('batch_size'))
+            ))
+        while True:
+            if not await self._ensure_handler(**kwargs):
+                continue
             try:
                 message = await self.handler.recv()
             except websockets.ConnectionClosed:
                 continue
-            await self.process_message(message, recv_callback)
+            if self._capture is not None:
+                self._capture.append(message)
+            if not (message := self._parse_table_message(message)):
+                continue
+            await self._ingest_queue.put(message, self._overflow_policy(message['table'], overflow))
+
+    async def _consume_workers(self, recv_callback: callable, **kwargs):
+        """
+        Ship frames in batches to worker processes which parse them and serialize
+        stateless tables, stateful tables come back parsed and are processed here.
+        Results are emitted in the order frames were received.
+        """
+        self._worker_pool = WssWorkerPool(self, kwargs['workers'])
+        results = asyncio.Queue(maxsize=kwargs.get('max_pending', kwargs['workers'] * 2))
+        self.tasks.append(asyncio.create_task(
+            self._collect_worker_results(results, recv_callback, kwargs.get('batch_size'))
+        ))
+        while True:
+            if not await self._ensure_handler(**kwargs):
+                continue
+            try:
+                messages = await self.recv_batch(kwargs.get('worker_batch_size', 100), kwargs.get('batch_time'))
+            except websockets.ConnectionClosed:
+                continue
+            await results.put(self._worker_pool.submit(messages))
+
+    async def _collect_worker_results(self, results: asyncio.Queue, on_message: callable,
+                                      batch_size: Optional[int] = None):
+        while True:
+            future = await results.get()
+            try:
+                items = await future
+            except Exception as exc:
+                self._error = errors.ERROR_INVALID_DATA
+                self._logger.error("Error processing messages in worker; Details: %s", exc)
+                continue
+            data = []
+            for serialized, item in items:
+                if not serialized:
+                    data.extend(await self._get_table_message_data(item))
+                    continue
+                self._aggregate_quote_bins([item])
+                if self._conflators:
+                    data.extend(self._conflate([item]))
+                else:
+                    data.append(item)
+            self._flush_order_book_deltas(data)
+            if batch_size:
+                if data := self._columnar_batch(data):
+                    await self._notify_data(on_message, data)
+                continue
+            for _data in data:
+                await self._notify_data(on_message, _data)
+
+    async def _process_worker_frames(self, frames: list) -> list:
+        results = []
+        for frame in frames:
+            if not (message := self._parse_table_message(frame)):
+                continue
+            if self._router.is_stateless(message['table']):
+                results.extend((True, data) for data in await self._get_table_message_data(message))
+            else:
+                results.append((False, message))
+        return results
+
+    async def dispatch_frame(self, message):
+        """
+        Pass a frame received on an additional connection to the same
+        pipeline and callback as frames of the main handler
+        """
+        if self._capture is not None:
+            self._capture.append(message)
+        if self._ingest_queue is not None:
+            if message := self._parse_table_message(message):
+                await self._ingest_queue.put(message, self._overflow_policy(message['table'], self._overflow))
+        elif self.__recv_batch:
+            await self.process_messages([message], self.__recv_callback)
+        else:
+            await self.process_message(message, self.__recv_callback)
+
+    async def _process_queue(self, on_message: callable, batch_size: Optional[int] = None):
+        queue = self._ingest_queue
+        while True:
+            message = await queue.get()
+            if not batch_size:
+                await self._process_table_message(message, on_message)
+                continue
+            results = await self._get_table_message_data(message)
+            while len(results) < batch_size and (message := queue.get_nowait()) is not None:
+                results.extend(await self._get_table_message_data(message))
+            self._flush_order_book_deltas(results)
+            if results := self._columnar_batch(results):
+                await self._notify_data(on_message, results)
+
+    def _reset_dispatch(self):
+        """
+        Drop what was compiled for the previous set of subscriptions
+        """
+        self._router.reset_dispatch()
+        self._overflow_policies = {}
+
+    def _overflow_policy(self, table: str, overflow: dict) -> str:
+        if (policy := self._overflow_policies.get(table)) is None:
+            policies = [overflow[s] for s in self._router.table_subscriptions(table)
+                        if s in overflow and s in self._subscriptions]
+            if not policies and '*' in overflow:
+                policies.append(overflow['*'])
+            policy = self._overflow_policies[table] = OverflowPolicy.strictest(policies)
+        return policy
+
+    @property
+    def ingest_stats(self) -> Optional[dict]:
+        if self._ingest_queue is None:
+            return None
+        return self._ingest_queue.stats()
+
+    def _start_conflation(self, on_message: callable, conflate: Optional[dict]):
+        """
+        Hold `update` data of subscriptions from `conflate` ({subscr_name: seconds})
+        and emit the latest item per symbol once per flush interval
+        """
+        self._conflators = {}
+        for subscr_name, interval in (conflate or {}).items():
+            conflator = self._conflators[subscr_name.lower()] = SymbolConflator(subscr_name.lower(), interval)
+            self.tasks.append(asyncio.create_task(self._flush_conflator(conflator, on_message)))
+
+    async def _flush_conflator(self, conflator: SymbolConflator, on_message: callable):
+        while True:
+            await asyncio.sleep(conflator.interval)
+            if data := conflator.flush():
+                await self._notify(on_message, self._columnar_batch([data]) if self.__recv_batch else data)
+
+    def _conflate(self, results: List[dict]) -> List[dict]:
+        conflated = []
+        for data in results:
+            for subscr_name in [s for s in data if s in self._conflators]:
+                conflator = self._conflators[subscr_name]
+                if data[subscr_name].get('act') == 'update':
+                    conflator.add(data.pop(subscr_name))
+                elif flushed := conflator.flush():
+                    conflated.append(flushed)
+            if data:
+                conflated.append(data)
+        return conflated
+
+    @property
+    def conflation_stats(self) -> Dict[str, dict]:
+        return {name: conflator.stats() for name, conflator in self._conflators.items()}
+
+    def _start_quote_bin_aggregation(self, bin_sizes: Optional[list]):
+        """
+        Add quote bins of `bin_sizes` rolled up from the 1m bins to `quote_bin` data
+        """
+        self._quote_bin_aggregator = QuoteBinAggregator(bin_sizes) if bin_sizes else None
+
+    def _aggregate_quote_bins(self, results: List[dict]) -> None:
+        if self._quote_bin_aggregator is None:
+            return
+        for data in results:
+            if (quote_bin := data.get(QuoteBinAggregator.subscription)) is not None:
+                self._quote_bin_aggregator.extend(quote_bin)
+
+    def _start_order_book_deltas(self, on_message: callable, enabled: bool, snapshot_interval: Optional[float]):
+        """
+        Emit `order_book` data as one delta per symbol per processed batch,
+        with full books every `snapshot_interval` seconds
+        """
+        self._order_book_deltas = None
+        if not enabled:
+            return
+        self._order_book_deltas = OrderBookDeltas(snapshot_interval)
+        if snapshot_interval:
+            self.tasks.append(asyncio.create_task(self._send_order_book_snapshots(on_message)))
+
+    async def _send_order_book_snapshots(self, on_message: callable):
+        deltas = self._order_book_deltas
+        while True:
+            await asyncio.sleep(deltas.snapshot_interval)
+            if data := deltas.snapshot():
+                await self._notify(on_message, self._columnar_batch([data]) if self.__recv_batch else data)
+
+    def _collect_order_book_deltas(self, results: List[dict]) -> List[dict]:
+        collected = []
+        for data in results:
+            if (order_book := data.pop(OrderBookDeltas.subscription, None)) is not None:
+                self._order_book_deltas.add(order_book)
+            if data:
+                collected.append(data)
+        return collected
+
+    def _flush_order_book_deltas(self, results: List[dict]) -> None:
+        if self._order_book_deltas is not None and (data := self._order_book_deltas.flush()):
+            results.append(data)
+
+    @property
+    def order_book_delta_stats(self) -> Optional[dict]:
+        if self._order_book_deltas is None:
+            return None
+        return self._order_book_deltas.stats()
+
+    def _start_columnar(self, columnar: Union[bool, str, None]):
+        """
+        Emit batches as struct-of-arrays payloads, with `columnar='numpy'` numeric
+        columns are NumPy arrays
+        """
+        self._columnar = ColumnarBatcher(arrays=columnar == 'numpy') if columnar else None
+
+    def columnar_loader(self, subscr_name: str) -> bool:
+        """
+        Whether the serializer of `subscr_name` may fill columns instead of records,
+        i.e. columnar payloads or an output encoder are on and no conflation or
+        order book deltas take its records
+        """
+        if self._columnar is None and self._output is None or subscr_name in self._conflators:
+            return False
+        return self._order_book_deltas is None or subscr_name != OrderBookDeltas.subscription
+
+    def _columnar_batch(self, results: List[dict]) -> List[dict]:
+        if self._columnar is None:
+            return results
+        return self._columnar.convert(results)
+
+    @property
+    def columnar_stats(self) -> Optional[dict]:
+        if self._columnar is None:
+            return None
+        return self._columnar.stats()
+
+    def _start_output(self, on_message: callable, output: Optional[str]) -> callable:
+        """
+        Pass payloads to `on_message` encoded by the `output` encoder, e.g. 'msgpack'
+        """
+        self._output = None
+        if not output:
+            return on_message
+        if (encoder_class := OUTPUT_ENCODERS.get(output.lower())) is None:
+            raise ValueError(f"Unknown output encoding {output}")
+        output = self._output = encoder_class()
+
+        async def on_encoded(data):
+            await self._notify(on_message, output.encode(data))
+
+        return on_encoded
+
+    @property
+    def output_stats(self) -> Optional[dict]:
+        if self._output is None:
+            return None
+        return self._output.stats()
+
+    def _start_latency(self, enabled: bool):
+        """
+        Record per table histograms of pipeline stage durations, see `latency_snapshot`
+        """
+        self._latency = LatencyRecorder() if enabled else None
+
+    @property
+    def latency(self) -> Optional[LatencyRecorder]:
+        return self._latency
+
+    def latency_snapshot(self, reset: bool = False) -> Optional[dict]:
+        if self._latency is None:
+            return None
+        return self._latency.snapshot(reset)
+
+    def _event_time(self, message: dict) -> Optional[float]:
+        """
+        Exchange event time of a table message in seconds since the epoch
+        """
+        return None
+
+    async def recv_batch(self, limit: int, time_budget: Optional[float] = None) -> list:
+        """
+        Wait for a frame, then drain frames already queued in the websocket
+        without suspending, up to `limit` frames or `time_budget` seconds
+        """
+        handler = self.handler
+        messages = [await handler.recv()]
+        queued = getattr(handler, 'messages', None)
+        if queued is not None:
+            deadline = time.monotonic() + time_budget if time_budget else None
+            while queued and len(messages) < limit:
+                messages.append(await handler.recv())
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+        if self._capture is not None:
+            self._capture.extend(messages)
+        return messages
+
+    def _start_capture(self, path: Optional[str], segment_size: Optional[int] = None):
+        """
+        Append every received raw frame to the capture log in `path`,
+        see `wss.capture.FrameReplay` to feed it back
+        """
+        if self._capture is not None:
+            self._capture.close()
+        self._capture = FrameCapture(path, segment_size) if path else None
+
+    @property
+    def capture_stats(self) -> Optional[dict]:
+        if self._capture is None:
+            return None
+        return self._capture.stats()
 
     async def _restore_subscriptions(self):
         for subscr_name, value in deepcopy(self._subscriptions).items():
             if subscr_name in self.auth_subscribers:
                 if not await self.authenticate():
                     del self._subscriptions[subscr_name]
+                    self._reset_dispatch()
                     continue
             for subscr_symbol in value:
                 await self.subscribe(None, subscr_name, subscr_symbol, force=True)
@@ -288,20 +777,85 @@ class StockWssApi(Connector):
         self.__del_partial_state_data()
         await self.__cleanup_subscribers()
         self.cancel_task()
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+        if self._capture is not None:
+            self._capture.close()
+            self._capture = None
+        if (standby := self._standby_handler()) is not None:
+            await standby.close()
+        self._standby = None
         if not self._handler:
             return
         await self._handler.close()
         self._handler = None
 
     async def process_message(self, message, on_message: Optional[callable] = None):
+        message = self._parse_table_message(message)
+        if not message:
+            return False
+        return await self._process_table_message(message, on_message)
+
+    async def _process_table_message(self, message: dict, on_message: Optional[callable] = None):
         response = False
+        results = await self._get_table_message_data(message)
+        self._flush_order_book_deltas(results)
+        for data in results:
+            if on_message:
+                await self._notify_data(on_message, data, message.get('table'))
+                response = True
+        return response
+
+    async def process_messages(self, messages: list, on_message: Optional[callable] = None):
+        """
+        Process a batch of raw frames and pass all results to `on_message` at once
+        """
+        results = []
+        for message in messages:
+            if message := self._parse_table_message(message):
+                results.extend(await self._get_table_message_data(message))
+        self._flush_order_book_deltas(results)
+        results = self._columnar_batch(results)
+        if not results or not on_message:
+            return False
+        await self._notify_data(on_message, results)
+        return True
+
+    def _parse_table_message(self, message) -> Optional[dict]:
+        started = time.perf_counter() if self._latency is not None else None
         message = parse_message(message)
         if not message:
-            return response
+            return None
         message = self._lookup_table(message)
-        if not message:
-            return response
-        messages = self._split_message(message)
+        if started is not None and message:
+            self._latency.add(message.get('table'), 'parse', time.perf_counter() - started)
+        return message
+
+    @staticmethod
+    async def _notify(on_message: callable, data):
+        if asyncio.iscoroutinefunction(on_message):
+            await on_message(data)
+        else:
+            on_message(data)
+
+    async def _notify_data(self, on_message: callable, data, table: Optional[str] = None):
+        if self._latency is None:
+            return await self._notify(on_message, data)
+        started = time.perf_counter()
+        await self._notify(on_message, data)
+        self._latency.add(table, 'callback', time.perf_counter() - started)
+
+    async def _get_table_message_data(self, message: dict) -> List[dict]:
+        results = []
+        if (latency := self._latency) is not None:
+            table = message.get('table')
+            if (event_time := self._event_time(message)) is not None:
+                latency.add(table, 'lag', time.time() - event_time)
+            started = time.perf_counter()
+            messages = self._split_message(message)
+            latency.add(table, 'split', time.perf_counter() - started)
+        else:
+            messages = self._split_message(message)
         for message in messages:
             try:
                 data = await self.get_data(message)
@@ -309,22 +863,20 @@ class StockWssApi(Connector):
                 self._error = errors.ERROR_INVALID_DATA
                 self._logger.error("Error validating incoming message %s; Details: %s", message, exc)
                 continue
-            if not data:
-                continue
-            if on_message:
-                if asyncio.iscoroutinefunction(on_message):
-                    await on_message(data)
-                else:
-                    on_message(data)
-                response = True
-        return response
+            if data:
+                results.append(data)
+        self._aggregate_quote_bins(results)
+        if self._order_book_deltas is not None:
+            results = self._collect_order_book_deltas(results)
+        if self._conflators:
+            return self._conflate(results)
+        return results
 
     async def send_message(self, data):
         if self.__recv_callback:
-            if asyncio.iscoroutinefunction(self.__recv_callback):
-                await self.__recv_callback(data)
-            else:
-                self.__recv_callback(data)
+            if self.__recv_batch:
+                data = [data]
+            await self._notify(self.__recv_callback, data)
 
     def _get_subscriber(self, subscr_name: str) -> Optional[Subscriber]:
         subscr_name = subscr_name.lower()
@@ -353,19 +905,50 @@ class StockWssApi(Connector):
     def get_state_data(self, symbol):
         if not symbol:
             return None
+        if (state_data := self.__state_index.get(symbol)) is not None:
+            return state_data
         return self.__state_data.get(symbol.lower())
 
+    def get_state_fragment(self, symbol) -> Optional[tuple]:
+        if not symbol:
+            return None
+        if (fragment := self.__state_fragments.get(symbol)) is not None:
+            return fragment
+        return self.__state_fragments.get(symbol.lower())
+
     async def __load_state_data(self):
-        self.__state_data = self.storage.get(f"{StateStorageKey.symbol}.{self.name}.{self.schema}")
-        redis = self.storage.get_client()
-        pubsub = redis.pubsub()
-        pubsub.subscribe(f"{StateStorageKey.symbol}.{self.name}.{self.schema}")
-        while True:
-            message = pubsub.get_message()
-            if message and message['type'] == 'message':
-                self.__state_data = json.loads(message['data'])
-            else:
-                await asyncio.sleep(0.5)
+        channel = f"{StateStorageKey.symbol}.{self.name}.{self.schema}"
+        self._set_state_data(self.storage.get(channel))
+        if (listener := StateListener.shared(self.storage, self._logger)) is None:
+            return
+        async for state_data in listener.listen(channel):
+            self._set_state_data(state_data)
+
+    def _set_state_data(self, state_data: dict):
+        self.__state_data = state_data
+        self._on_state_data_loaded()
+
+    def _on_state_data_loaded(self):
+        """
+        Compiles the loaded or refreshed symbol state into lookups by the lower and
+        upper case symbol, so messages neither lowercase symbols nor rebuild the
+        static part of their records, see `_load_state_fragment`.
+        """
+        index = {}
+        fragments = {}
+        for symbol, state_data in (self.__state_data or {}).items():
+            if not isinstance(symbol, str) or symbol != symbol.lower() or not isinstance(state_data, dict):
+                continue
+            fragment = self._load_state_fragment(state_data)
+            for key in {sys.intern(symbol), sys.intern(symbol.upper())}:
+                index[key] = state_data
+                if fragment is not None:
+                    fragments[key] = fragment
+        self.__state_index = index
+        self.__state_fragments = fragments
+
+    def _load_state_fragment(self, state_data: dict) -> Optional[tuple]:
+        return None
 
     @property
     def state_symbol_list(self) -> list:
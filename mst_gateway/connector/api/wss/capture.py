@@ -0,0 +1,144 @@
+from __future__ import annotations
+import asyncio
+import mmap
+import os
+import struct
+import time
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from . import StockWssApi
+
+# receive time, payload length, payload kind; kind 0 marks the unused tail of a segment
+FRAME_HEADER = struct.Struct('<dIB')
+FRAME_KIND_OFFSET = FRAME_HEADER.size - 1
+FRAME_STR = 1
+FRAME_BYTES = 2
+SEGMENT_SUFFIX = '.frames'
+
+
+class FrameCapture:
+    """
+    Appends raw frames with their receive time to a log of memory-mapped
+    segment files `<index>.frames` in the `path` directory.
+
+    Segments are allocated with `segment_size` bytes and truncated to their
+    data when the next one is started or on close. Frames written to the map
+    survive a crash of the process, a new capture continues after the last segment.
+    """
+    segment_size = 64 * 1024 * 1024
+
+    def __init__(self, path: str, segment_size: int = None):
+        self.path = path
+        if segment_size:
+            self.segment_size = segment_size
+        os.makedirs(path, exist_ok=True)
+        segments = capture_segments(path)
+        self._index = int(os.path.basename(segments[-1])[:-len(SEGMENT_SUFFIX)]) + 1 if segments else 0
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._offset = 0
+        self.frames = 0
+        self.bytes = 0
+
+    def append(self, frame: Union[str, bytes], received: float = None) -> None:
+        if isinstance(frame, str):
+            payload = frame.encode()
+            kind = FRAME_STR
+        else:
+            payload = bytes(frame)
+            kind = FRAME_BYTES
+        size = FRAME_HEADER.size + len(payload)
+        if self._mmap is None or self._offset + size > len(self._mmap):
+            self._next_segment(size)
+        start = self._offset + FRAME_HEADER.size
+        self._mmap[start:start + len(payload)] = payload
+        # the kind goes in last, a frame cut short by a crash reads as the unused tail
+        FRAME_HEADER.pack_into(self._mmap, self._offset, received or time.time(), len(payload), 0)
+        self._mmap[self._offset + FRAME_KIND_OFFSET] = kind
+        self._offset = start + len(payload)
+        self.frames += 1
+        self.bytes += size
+
+    def extend(self, frames: list) -> None:
+        received = time.time()
+        for frame in frames:
+            self.append(frame, received)
+
+    def flush(self) -> None:
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(self._offset)
+        self._file.close()
+        self._mmap = None
+        self._file = None
+
+    def _next_segment(self, size: int) -> None:
+        self.close()
+        self._file = open(os.path.join(self.path, f"{self._index:08d}{SEGMENT_SUFFIX}"), 'w+b')
+        self._file.truncate(max(self.segment_size, size))
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._offset = 0
+        self._index += 1
+
+    def stats(self) -> dict:
+        return {'frames': self.frames, 'bytes': self.bytes, 'segments': self._index}
+
+
+def capture_segments(path: str) -> list:
+    return sorted(
+        os.path.join(path, name) for name in os.listdir(path)
+        if name.endswith(SEGMENT_SUFFIX) and name[:-len(SEGMENT_SUFFIX)].isdigit()
+    )
+
+
+def read_frames(path: str) -> Iterator[Tuple[float, Union[str, bytes]]]:
+    """
+    Frames of a capture log as (receive time, frame) in the order they were appended
+    """
+    for segment in capture_segments(path):
+        with open(segment, 'rb') as segment_file:
+            if not os.fstat(segment_file.fileno()).st_size:
+                continue
+            with mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                offset = 0
+                while offset + FRAME_HEADER.size <= len(data):
+                    received, length, kind = FRAME_HEADER.unpack_from(data, offset)
+                    if not kind:
+                        break
+                    start = offset + FRAME_HEADER.size
+                    payload = data[start:start + length]
+                    yield received, payload.decode() if kind == FRAME_STR else payload
+                    offset = start + length
+
+
+class FrameReplay:
+    """
+    Feeds a capture log into `process_message` of a wss api, keeping the
+    original frame intervals divided by `speed`, or as fast as possible
+    without `speed`.
+    """
+
+    def __init__(self, wss_api: StockWssApi, path: str, speed: Optional[float] = 1.0):
+        self._wss_api = wss_api
+        self.path = path
+        self.speed = speed
+
+    async def run(self, on_message: Optional[callable] = None) -> int:
+        count = 0
+        first = None
+        for received, frame in read_frames(self.path):
+            if self.speed:
+                if first is None:
+                    first = (received, time.monotonic())
+                elif (delay := (received - first[0]) / self.speed - (time.monotonic() - first[1])) > 0:
+                    await asyncio.sleep(delay)
+            await self._wss_api.process_message(frame, on_message)
+            count += 1
+        return count
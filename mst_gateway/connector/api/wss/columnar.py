@@ -0,0 +1,93 @@
+from typing import Dict, List, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ColumnarBatcher:
+    """
+    Turns the results of a batch into struct-of-arrays payloads.
+
+    Consecutive data of a subscription with the same header (`acc`, `tb`, `sch`,
+    `act`) and no other subscription in between is merged into one payload whose `d` maps every record field to a
+    column of the values of all records (None where a record lacks the field)
+    and `n` is the number of records. With `arrays` numeric columns are NumPy arrays.
+
+    Data whose `d` already maps fields to columns, filled by the column loaders
+    of the serializers, is merged the same way when the fields match and is not
+    taken apart into records.
+    """
+
+    def __init__(self, arrays: bool = False):
+        if arrays and np is None:
+            raise ImportError("numpy is required for columnar arrays")
+        self.arrays = arrays
+        self.received = 0
+        self.emitted = 0
+
+    def convert(self, results: List[dict]) -> List[dict]:
+        batch = []
+        payloads = []
+        runs: Dict[str, tuple] = {}
+        for data in results:
+            if any(subscr_name not in data for subscr_name in runs):
+                # data of another subscription in between, keep the order of the stream
+                runs = {subscr_name: run for subscr_name, run in runs.items() if subscr_name in data}
+            converted = {}
+            for subscr_name, _data in data.items():
+                records = _data.get('d')
+                if isinstance(records, dict):
+                    header = (_data.get('acc'), _data.get('tb'), _data.get('sch'), _data.get('act'), tuple(records))
+                elif isinstance(records, list) and all(isinstance(r, dict) for r in records):
+                    header = (_data.get('acc'), _data.get('tb'), _data.get('sch'), _data.get('act'))
+                else:
+                    converted[subscr_name] = _data
+                    runs.pop(subscr_name, None)
+                    continue
+                if (run := runs.get(subscr_name)) is not None and run[0] == header:
+                    self._extend(run[1], records)
+                    continue
+                payload = {k: v for k, v in _data.items() if k != 'd'}
+                self._extend(payload, records)
+                runs[subscr_name] = (header, payload)
+                payloads.append(payload)
+                converted[subscr_name] = payload
+            if converted:
+                batch.append(converted)
+        for payload in payloads:
+            self._to_columns(payload)
+        return batch
+
+    @staticmethod
+    def _extend(payload: dict, records: Union[dict, list]) -> None:
+        if not isinstance(records, dict):
+            payload.setdefault('d', []).extend(records)
+            return
+        columns = payload.setdefault('d', {field: [] for field in records})
+        for field, column in records.items():
+            columns[field].extend(column)
+
+    def _to_columns(self, payload: dict) -> None:
+        records = payload['d']
+        if isinstance(records, dict):
+            payload['n'] = len(next(iter(records.values()), ()))
+            payload['d'] = {field: self._column(column) for field, column in records.items()}
+        else:
+            fields = dict.fromkeys(field for record in records for field in record)
+            payload['n'] = len(records)
+            payload['d'] = {field: self._column([record.get(field) for record in records]) for field in fields}
+        self.received += payload['n']
+        self.emitted += 1
+
+    def _column(self, values: list):
+        if not self.arrays:
+            return values
+        column = np.array(values)
+        if column.dtype.kind in 'biuf':
+            return column
+        return values
+
+    def stats(self) -> dict:
+        return {'records': self.received, 'payloads': self.emitted}
@@ -0,0 +1,50 @@
+from typing import Optional
+
+
+class SymbolConflator:
+    """
+    Keeps the latest `update` item per symbol of a subscription between flushes,
+    so a ticker stream is emitted as one batched update per interval.
+    """
+
+    def __init__(self, subscription: str, interval: float):
+        self.subscription = subscription
+        self.interval = interval
+        self._header = None
+        self._items = {}
+        self.received = 0
+        self.emitted = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, data: dict) -> None:
+        if self._header is None:
+            self._header = {k: v for k, v in data.items() if k != 'd'}
+        for item in data.get('d') or ():
+            symbol = item.get('s') if isinstance(item, dict) else None
+            if symbol is None:
+                symbol = id(item)
+            elif 'bs' in item:
+                # quote bins of several bin sizes per symbol
+                symbol = (symbol, item['bs'])
+            self._items[symbol] = item
+            self.received += 1
+
+    def flush(self) -> Optional[dict]:
+        if not self._items:
+            return None
+        items = list(self._items.values())
+        self._items = {}
+        self.emitted += len(items)
+        return {
+            self.subscription: {**self._header, 'act': 'update', 'd': items}
+        }
+
+    def stats(self) -> dict:
+        return {
+            'interval': self.interval,
+            'pending': len(self._items),
+            'received': self.received,
+            'emitted': self.emitted,
+        }
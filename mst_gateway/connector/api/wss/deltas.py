@@ -0,0 +1,123 @@
+from typing import Dict, Optional
+from ..types import BUY, SELL
+
+
+class OrderBookDeltas:
+    """
+    Coalesces `order_book` output into one delta per symbol per processing batch.
+
+    Levels are kept per symbol to report the best bid and ask. A delta holds
+    levels changed since the previous one (`u`: [id, price, volume, side]),
+    removed levels (`r`: [id, price, side]) and a per symbol sequence number,
+    a `partial` resets the symbol book and flags its delta with `rs`.
+    """
+    subscription = 'order_book'
+
+    def __init__(self, snapshot_interval: Optional[float] = None):
+        self.snapshot_interval = snapshot_interval
+        self._header = None
+        self._books: Dict[str, Dict[int, Dict[float, dict]]] = {}
+        self._best: Dict[str, Dict[int, Optional[float]]] = {}
+        self._system_symbols: Dict[str, Optional[str]] = {}
+        self._seq: Dict[str, int] = {}
+        self._changed: Dict[str, Dict[tuple, tuple]] = {}
+        self._reset = set()
+        self.received = 0
+        self.emitted = 0
+
+    def __len__(self):
+        return len(self._changed)
+
+    def add(self, data: dict) -> None:
+        if self._header is None:
+            self._header = {k: v for k, v in data.items() if k not in ('act', 'd')}
+        action = data.get('act')
+        items = data.get('d') or ()
+        if action == 'partial':
+            for symbol in {item.get('s') for item in items}:
+                self._clear(symbol)
+        for item in items:
+            symbol = item.get('s')
+            if (book := self._books.get(symbol)) is None:
+                book = self._books[symbol] = {BUY: {}, SELL: {}}
+                self._best[symbol] = {BUY: None, SELL: None}
+            self._system_symbols[symbol] = item.get('ss')
+            side, price = item.get('sd'), item.get('p')
+            if side not in book:
+                continue
+            if action == 'delete' or not item.get('vl'):
+                book[side].pop(price, None)
+                if self._best[symbol][side] == price:
+                    self._best[symbol][side] = self._find_best(book[side], side)
+                change = (False, item)
+            else:
+                book[side][price] = item
+                best = self._best[symbol][side]
+                if best is None or (price > best if side == BUY else price < best):
+                    self._best[symbol][side] = price
+                change = (True, item)
+            self._changed.setdefault(symbol, {})[(side, price)] = change
+            self.received += 1
+
+    def flush(self) -> Optional[dict]:
+        if not self._changed:
+            return None
+        items = []
+        for symbol, levels in self._changed.items():
+            delta = self._symbol_header(symbol)
+            delta['u'] = [[i.get('id'), i['p'], i['vl'], i['sd']] for changed, i in levels.values() if changed]
+            delta['r'] = [[i.get('id'), i['p'], i['sd']] for changed, i in levels.values() if not changed]
+            if symbol in self._reset:
+                delta['rs'] = True
+            items.append(delta)
+            self.emitted += 1
+        self._changed = {}
+        self._reset = set()
+        return {self.subscription: {**self._header, 'act': 'delta', 'd': items}}
+
+    def snapshot(self) -> Optional[dict]:
+        """
+        Full books of all symbols, levels are [id, price, volume] from the best price
+        """
+        if not self._books:
+            return None
+        items = []
+        for symbol, book in self._books.items():
+            snapshot = self._symbol_header(symbol, increment=False)
+            snapshot['b'] = [[i.get('id'), i['p'], i['vl']] for _, i in sorted(book[BUY].items(), reverse=True)]
+            snapshot['a'] = [[i.get('id'), i['p'], i['vl']] for _, i in sorted(book[SELL].items())]
+            items.append(snapshot)
+        return {self.subscription: {**self._header, 'act': 'snapshot', 'd': items}}
+
+    def stats(self) -> dict:
+        return {
+            'symbols': len(self._books),
+            'pending': len(self._changed),
+            'received': self.received,
+            'emitted': self.emitted,
+        }
+
+    def _symbol_header(self, symbol: str, increment: bool = True) -> dict:
+        seq = self._seq.get(symbol, 0)
+        if increment:
+            seq = self._seq[symbol] = seq + 1
+        best = self._best.get(symbol) or {}
+        return {
+            's': symbol,
+            'ss': self._system_symbols.get(symbol),
+            'seq': seq,
+            'bb': best.get(BUY),
+            'ba': best.get(SELL),
+        }
+
+    def _clear(self, symbol: str):
+        self._books[symbol] = {BUY: {}, SELL: {}}
+        self._best[symbol] = {BUY: None, SELL: None}
+        self._changed.pop(symbol, None)
+        self._reset.add(symbol)
+
+    @staticmethod
+    def _find_best(levels: Dict[float, dict], side: int) -> Optional[float]:
+        if not levels:
+            return None
+        return max(levels) if side == BUY else min(levels)
@@ -0,0 +1,153 @@
+import asyncio
+from collections import deque
+from typing import Optional
+from mst_gateway.utils import ClassWithAttributes
+
+
+class OverflowPolicy(ClassWithAttributes):
+    block = 'block'
+    drop_oldest = 'drop_oldest'
+    conflate = 'conflate'
+
+    @classmethod
+    def strictest(cls, policies) -> str:
+        for policy in (cls.block, cls.drop_oldest, cls.conflate):
+            if policy in policies:
+                return policy
+        return cls.block
+
+
+class IngestQueue:
+    """
+    Bounded queue of table messages between the websocket receiver and processors.
+
+    `block` makes the receiver wait for free space, `drop_oldest` evicts the oldest
+    entry when full, `conflate` merges data items into a pending entry of the same
+    table and action, keeping only the latest item per symbol, as long as no other
+    message of the table was queued after that entry.
+    """
+
+    def __init__(self, maxsize: int, symbol_key: str = 'symbol'):
+        self.maxsize = maxsize
+        self._symbol_key = symbol_key
+        self._entries = deque()
+        self._conflated = {}
+        self._table_tails = {}
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self.dropped = 0
+        self.conflated = 0
+        self.table_dropped = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def depth(self) -> int:
+        return len(self._entries)
+
+    def full(self) -> bool:
+        return len(self._entries) >= self.maxsize
+
+    def stats(self) -> dict:
+        return {
+            'depth': len(self._entries),
+            'maxsize': self.maxsize,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+            'table_dropped': dict(self.table_dropped),
+        }
+
+    async def put(self, message: dict, policy: str = OverflowPolicy.block) -> None:
+        if policy == OverflowPolicy.conflate and self._merge(message):
+            return None
+        if policy == OverflowPolicy.block:
+            while self.full():
+                self._not_full.clear()
+                await self._not_full.wait()
+        elif self.full():
+            self._drop_oldest()
+        if policy == OverflowPolicy.conflate:
+            entry = self._conflation_entry(message)
+        else:
+            entry = message
+        self._entries.append(entry)
+        self._table_tails[message.get('table')] = entry
+        self._not_empty.set()
+
+    async def get(self) -> dict:
+        while not self._entries:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._pop()
+
+    def get_nowait(self) -> Optional[dict]:
+        if not self._entries:
+            return None
+        return self._pop()
+
+    def _pop(self) -> dict:
+        entry = self._entries.popleft()
+        self._not_full.set()
+        self._forget(entry)
+        if isinstance(entry, _ConflationEntry):
+            return self._release(entry)
+        return entry
+
+    def _drop_oldest(self):
+        entry = self._entries.popleft()
+        table = self._forget(entry)
+        self.dropped += 1
+        self.table_dropped[table] = self.table_dropped.get(table, 0) + 1
+
+    def _forget(self, entry) -> Optional[str]:
+        if isinstance(entry, _ConflationEntry):
+            table = entry.key[0]
+            if self._conflated.get(entry.key) is entry:
+                del self._conflated[entry.key]
+        else:
+            table = entry.get('table')
+        if self._table_tails.get(table) is entry:
+            del self._table_tails[table]
+        return table
+
+    def _merge(self, message: dict) -> bool:
+        table = message.get('table')
+        entry = self._conflated.get((table, message.get('action')))
+        if entry is None or self._table_tails.get(table) is not entry:
+            return False
+        for item in message.get('data') or ():
+            if entry.add(item, self._symbol_key):
+                self.conflated += 1
+        return True
+
+    def _conflation_entry(self, message: dict) -> '_ConflationEntry':
+        entry = _ConflationEntry((message.get('table'), message.get('action')), message)
+        for item in message.get('data') or ():
+            entry.add(item, self._symbol_key)
+        self._conflated[entry.key] = entry
+        return entry
+
+    @staticmethod
+    def _release(entry: '_ConflationEntry') -> dict:
+        message = entry.message
+        message['data'] = list(entry.items.values())
+        return message
+
+
+class _ConflationEntry:
+    __slots__ = ('key', 'message', 'items')
+
+    def __init__(self, key: tuple, message: dict):
+        self.key = key
+        self.message = message
+        self.items = {}
+
+    def add(self, item, symbol_key: str) -> bool:
+        symbol = item.get(symbol_key) if isinstance(item, dict) else None
+        if symbol is None:
+            self.items[id(item)] = item
+            return False
+        replaced = symbol in self.items
+        self.items[symbol] = item
+        return replaced
@@ -0,0 +1,72 @@
+from typing import Dict, Optional
+
+
+class LatencyHistogram:
+    """
+    Log2 histogram of durations in microseconds, bucket `i` holds durations
+    below 2 ** i us. Percentiles are the upper bound of their bucket.
+    """
+    buckets = 40
+
+    def __init__(self):
+        self.counts = [0] * self.buckets
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, seconds: float) -> None:
+        us = seconds * 1e6
+        self.counts[min(int(us).bit_length(), self.buckets - 1) if us > 0 else 0] += 1
+        self.count += 1
+        self.total += us
+        if self.max is None or us > self.max:
+            self.max = us
+        if self.min is None or us < self.min:
+            self.min = us
+
+    def percentile(self, percent: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = self.count * percent / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return float(min(2 ** index, self.max))
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            'count': self.count,
+            'mean_us': self.total / self.count if self.count else None,
+            'min_us': self.min,
+            'p50_us': self.percentile(50),
+            'p99_us': self.percentile(99),
+            'max_us': self.max,
+        }
+
+
+class LatencyRecorder:
+    """
+    Per table histograms of pipeline stages: `lag` (local time minus exchange
+    event time on receive), `parse`, `split`, `route` (Router.get_data including
+    serializers), `serialize.<subscription>` and `callback`. Callbacks of batches
+    spanning several tables are recorded under `*`.
+    """
+
+    def __init__(self):
+        self._histograms: Dict[tuple, LatencyHistogram] = {}
+
+    def add(self, table: Optional[str], stage: str, seconds: float) -> None:
+        if (histogram := self._histograms.get((table, stage))) is None:
+            histogram = self._histograms[(table, stage)] = LatencyHistogram()
+        histogram.add(seconds)
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Dict[str, dict]]:
+        snapshot = {}
+        for (table, stage), histogram in self._histograms.items():
+            snapshot.setdefault(table or '*', {})[stage] = histogram.snapshot()
+        if reset:
+            self._histograms = {}
+        return snapshot
@@ -0,0 +1,133 @@
+import asyncio
+import inspect
+import logging
+from logging import Logger
+from typing import AsyncIterator, Dict, Optional, Set, Tuple
+from ..utils import JSON_CODEC, json_loads
+
+
+class StateListener:
+    """
+    Process wide pubsub listener of state storage channels.
+
+    Keeps one pubsub connection and reader task per storage backend and event loop,
+    and wakes every `listen` iterator of a channel as soon as a message is published.
+    Iterators get the latest decoded message only, older unread ones are replaced.
+    """
+    read_timeout = 1.0
+    _shared: Dict[Tuple[int, int], 'StateListener'] = {}
+
+    def __init__(self, storage, logger: Logger = None):
+        self._storage = storage
+        self._logger = logger or logging.getLogger(__name__)
+        self._failing = False
+        self._pubsub = None
+        self._is_async = False
+        self._channels: Dict[str, Set[asyncio.Queue]] = {}
+        self._subscribed: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def shared(cls, storage, logger: Logger = None) -> Optional['StateListener']:
+        if storage.is_dict:
+            return None
+        key = (id(storage.storage), id(asyncio.get_running_loop()))
+        if (listener := cls._shared.get(key)) is None:
+            listener = cls._shared[key] = cls(storage, logger)
+        return listener
+
+    @property
+    def channels(self) -> Dict[str, int]:
+        return {channel: len(queues) for channel, queues in self._channels.items()}
+
+    async def listen(self, channel: str) -> AsyncIterator[dict]:
+        queue = asyncio.Queue(maxsize=1)
+        self._channels.setdefault(channel, set()).add(queue)
+        try:
+            self._start()
+            while True:
+                yield await queue.get()
+        finally:
+            self._channels.get(channel, set()).discard(queue)
+            if not self._channels.get(channel, True):
+                del self._channels[channel]
+
+    def _start(self):
+        if self._task is not None and not self._task.done():
+            return
+        self._pubsub = None
+        self._task = asyncio.create_task(self._read())
+
+    async def _create_pubsub(self) -> tuple:
+        client = self._storage.get_client()
+        if inspect.isawaitable(client):
+            return (await client).pubsub(), True
+        try:
+            from redis import asyncio as aioredis
+        except ImportError:
+            return client.pubsub(), False
+        pool = aioredis.ConnectionPool(**self._async_pool_kwargs(aioredis, client.connection_pool))
+        return aioredis.Redis(connection_pool=pool).pubsub(), True
+
+    @staticmethod
+    def _async_pool_kwargs(aioredis, pool) -> dict:
+        """
+        Async pool arguments of a sync client pool, keeping its SSL or unix socket connection class
+        """
+        connection_class = getattr(aioredis.connection, pool.connection_class.__name__, None)
+        if connection_class is None:
+            raise TypeError(f"No async connection class for {pool.connection_class.__name__}")
+        return {**pool.connection_kwargs, 'connection_class': connection_class}
+
+    async def _read(self):
+        while True:
+            try:
+                if self._pubsub is None:
+                    self._pubsub, self._is_async = await self._create_pubsub()
+                    self._subscribed = set()
+                await self._sync_subscriptions()
+                if not self._subscribed:
+                    await asyncio.sleep(self.read_timeout)
+                    continue
+                message = await self._call(self._pubsub.get_message, ignore_subscribe_messages=True,
+                                           timeout=self.read_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # connection lost, subscribe channels again on a new one
+                if not self._failing:
+                    self._logger.warning(f"{self.__class__.__name__} - {e.__class__.__name__}: {e}")
+                    self._failing = True
+                self._pubsub = None
+                await asyncio.sleep(self.read_timeout)
+                continue
+            self._failing = False
+            if message and message.get('type') == 'message':
+                self._publish(message['channel'], message['data'])
+
+    async def _sync_subscriptions(self):
+        channels = set(self._channels)
+        if subscribe := channels.difference(self._subscribed):
+            await self._call(self._pubsub.subscribe, *subscribe)
+        if unsubscribe := self._subscribed.difference(channels):
+            await self._call(self._pubsub.unsubscribe, *unsubscribe)
+        self._subscribed = channels
+
+    async def _call(self, method: callable, *args, **kwargs):
+        if self._is_async:
+            return await method(*args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: method(*args, **kwargs))
+
+    def _publish(self, channel, data):
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        if not (queues := self._channels.get(channel)):
+            return
+        try:
+            data = json_loads(data)
+        except (*JSON_CODEC.decode_errors, TypeError):
+            return
+        for queue in queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(data)
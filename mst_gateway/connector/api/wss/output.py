@@ -0,0 +1,75 @@
+from typing import Dict, Union
+from ..utils.codec import MsgpackCodec
+
+
+class MsgpackOutput:
+    """
+    Encodes payloads passed to `on_message` as msgpack.
+
+    Records of a payload are packed as rows of the field table of its subscription:
+    `{'acc', 'tb', 'sch', 'act', 'd': [[value, ...], ...]}`, missing fields of a
+    record are None. The field table `'f': [field, ...]` is sent with the first
+    payload of a subscription and again only when it changes; `decode` restores it
+    on the payloads that follow. Columns filled by the serializer loaders are packed
+    as rows without building records, columnar payloads (with `n`) are packed as they are.
+    """
+    name = 'msgpack'
+
+    def __init__(self):
+        self._codec = MsgpackCodec()
+        self._fields: Dict[str, tuple] = {}
+        self._decoded_fields: Dict[str, list] = {}
+        self.received = 0
+        self.encoded = 0
+
+    def encode(self, data: Union[dict, list]) -> bytes:
+        if isinstance(data, list):
+            data = [self._pack(item) for item in data]
+        else:
+            data = self._pack(data)
+        encoded = self._codec.dumps(data)
+        self.received += 1
+        self.encoded += len(encoded)
+        return encoded
+
+    def decode(self, data: bytes) -> Union[dict, list]:
+        data = self._codec.loads(data)
+        for item in data if isinstance(data, list) else (data,):
+            for subscr_name, payload in item.items():
+                if 'f' in payload:
+                    self._decoded_fields[subscr_name] = payload['f']
+                elif isinstance(payload.get('d'), list) and subscr_name in self._decoded_fields:
+                    payload['f'] = self._decoded_fields[subscr_name]
+        return data
+
+    def _pack(self, data: dict) -> dict:
+        return {subscr_name: self._pack_payload(subscr_name, _data) for subscr_name, _data in data.items()}
+
+    def _pack_payload(self, subscr_name: str, payload: dict) -> dict:
+        records = payload.get('d')
+        if isinstance(records, dict) and 'n' not in payload:
+            fields = tuple(records)
+            rows = [list(row) for row in zip(*records.values())]
+        elif isinstance(records, list) and records and all(isinstance(r, dict) for r in records):
+            fields = self._fields.get(subscr_name, ())
+            if all(tuple(record) == fields for record in records):
+                rows = [list(record.values()) for record in records]
+            else:
+                fields = tuple(dict.fromkeys((*fields, *(field for record in records for field in record))))
+                rows = [[record.get(field) for field in fields] for record in records]
+        else:
+            return payload
+        packed = {k: v for k, v in payload.items() if k != 'd'}
+        if self._fields.get(subscr_name) != fields:
+            self._fields[subscr_name] = fields
+            packed['f'] = fields
+        packed['d'] = rows
+        return packed
+
+    def stats(self) -> dict:
+        return {'payloads': self.received, 'bytes': self.encoded}
+
+
+OUTPUT_ENCODERS = {
+    MsgpackOutput.name: MsgpackOutput,
+}
@@ -0,0 +1,99 @@
+from typing import Dict, Iterable, Optional, Union
+from ..types import BinSize
+from ..utils.time import parse_iso_datetime, time2minute, timestamp2iso
+
+
+class QuoteBinAggregator:
+    """
+    Rolls 1 minute quote bins of the `quote_bin` subscription into larger bin sizes.
+
+    Updates of a running minute replace each other, the first update of a newer
+    minute folds the previous one into the larger bins of the symbol. Every 1m item
+    is followed by the items of the same symbol for each of `bin_sizes`,
+    all items are tagged with their bin size in `bs`.
+    """
+    subscription = 'quote_bin'
+
+    def __init__(self, bin_sizes: Iterable[str]):
+        self.bin_sizes: Dict[str, int] = {}
+        for bin_size in bin_sizes:
+            if (seconds := BinSize(bin_size).to_sec) > 60:
+                self.bin_sizes[bin_size.lower()] = seconds // 60
+        self._minutes: Dict[str, tuple] = {}
+        self._closed: Dict[tuple, dict] = {}
+
+    def extend(self, data: dict) -> None:
+        items = []
+        for item in data.get('d') or ():
+            item['bs'] = BinSize.m1[0]
+            items.append(item)
+            if (minute := epoch_minute(item.get('tm'))) is not None:
+                items.extend(self._update(item, minute))
+        data['d'] = items
+
+    def _update(self, item: dict, minute: int) -> list:
+        symbol = item.get('s')
+        if (current := self._minutes.get(symbol)) is not None:
+            if minute < current[0]:
+                return []
+            if minute > current[0]:
+                self._fold(symbol, *current)
+        self._minutes[symbol] = (minute, item)
+        return [
+            self._merge(self._closed_bin(symbol, bin_size, minute - minute % length), item, bin_size)
+            for bin_size, length in self.bin_sizes.items()
+        ]
+
+    def _fold(self, symbol: str, minute: int, item: dict):
+        for bin_size, length in self.bin_sizes.items():
+            closed = self._closed_bin(symbol, bin_size, minute - minute % length)
+            if closed['opp'] is None:
+                closed.update(opp=item.get('opp'), hip=item.get('hip'), lop=item.get('lop'), vl=item.get('vl') or 0)
+                continue
+            closed['hip'] = max(closed['hip'], item.get('hip'))
+            closed['lop'] = min(closed['lop'], item.get('lop'))
+            closed['vl'] += item.get('vl') or 0
+
+    def _closed_bin(self, symbol: str, bin_size: str, start: int) -> dict:
+        closed = self._closed.get((symbol, bin_size))
+        if closed is None or closed['start'] != start:
+            closed = self._closed[(symbol, bin_size)] = {
+                'start': start,
+                'tm': timestamp2iso(start * 60000),
+                'opp': None,
+                'hip': None,
+                'lop': None,
+                'vl': 0,
+            }
+        return closed
+
+    @staticmethod
+    def _merge(closed: dict, item: dict, bin_size: str) -> dict:
+        data = {
+            'tm': closed['start'] * 60000 if isinstance(item.get('tm'), int) else closed['tm'],
+            's': item.get('s'),
+            'opp': item.get('opp'),
+            'clp': item.get('clp'),
+            'hip': item.get('hip'),
+            'lop': item.get('lop'),
+            'vl': (item.get('vl') or 0) + closed['vl'],
+            'bs': bin_size,
+        }
+        if closed['opp'] is not None:
+            data.update(
+                opp=closed['opp'],
+                hip=max(closed['hip'], data['hip']),
+                lop=min(closed['lop'], data['lop']),
+            )
+        if 'ss' in item:
+            data['ss'] = item['ss']
+        return data
+
+
+def epoch_minute(time: Union[int, str, None]) -> Optional[int]:
+    if isinstance(time, int):
+        return time // 60000
+    try:
+        return time2minute(parse_iso_datetime(time))
+    except (ValueError, TypeError, AttributeError):
+        return None
@@ -0,0 +1,45 @@
+import asyncio
+import random
+import websockets
+
+# errors of a failed connection attempt, worth another one after a delay
+CONNECT_ERRORS = (OSError, asyncio.TimeoutError, websockets.WebSocketException)
+
+
+class ReconnectBackoff:
+    """
+    Delays between reconnect attempts: `base * factor ** attempt` seconds
+    capped at `cap`, of which a random part up to `jitter` is taken off, so
+    connections dropped together do not reconnect in lockstep.
+    `reset` after a successful connect starts again from `base`.
+    """
+
+    def __init__(self, base: float = 0.5, cap: float = 10.0, factor: float = 2.0, jitter: float = 0.5):
+        self.base = base
+        self.cap = cap
+        self.factor = factor
+        self.jitter = jitter
+        self.attempt = 0
+        self.failures = 0
+        self.waited = 0.0
+
+    def delay(self) -> float:
+        delay = self.base * self.factor ** self.attempt
+        if delay < self.cap:
+            self.attempt += 1
+        else:
+            delay = self.cap
+        return delay * (1 - self.jitter * random.random())
+
+    async def wait(self) -> float:
+        delay = self.delay()
+        self.failures += 1
+        self.waited += delay
+        await asyncio.sleep(delay)
+        return delay
+
+    def reset(self) -> None:
+        self.attempt = 0
+
+    def stats(self) -> dict:
+        return {'attempt': self.attempt, 'failures': self.failures, 'waited': self.waited}
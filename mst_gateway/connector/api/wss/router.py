@@ -1,13 +1,11 @@
 from __future__ import annotations
+import time
 from typing import (
     TYPE_CHECKING,
-    Dict,
-    Optional
-)
-from abc import (
-    ABCMeta,
-    abstractmethod
+    Optional,
+    Tuple
 )
+from abc import ABCMeta
 from .serializer import Serializer
 
 
@@ -18,31 +16,82 @@ if TYPE_CHECKING:
 class Router:
     __metaclass__ = ABCMeta
 
+    table_route_map = {}
     serializer_classes = {}
+    stateless_subscriptions = ()
 
     def __init__(self, wss_api: StockWssApi):
         self._wss_api = wss_api
-        self._routed_data = None
         self._serializers = {}
+        self._dispatch = {}
+        self._dispatch_subscriptions = None
 
     async def get_data(self, message: dict) -> dict:
+        if (latency := self._wss_api.latency) is None:
+            return await self._get_data(message)
+        started = time.perf_counter()
+        data = await self._get_data(message)
+        latency.add(message.get('table'), 'route', time.perf_counter() - started)
+        return data
+
+    async def _get_data(self, message: dict) -> dict:
         data = {}
-        serializers = self._get_serializers(message)
-        for subscr_name, subscr_serializer in serializers.items():
-            _data = await subscr_serializer.data(self._routed_data[subscr_name])
+        if not self._is_subscription_message(message):
+            return data
+        serializers = self._table_serializers(message['table'])
+        if not serializers:
+            return data
+        for _, serializer in serializers:
+            serializer.prefetch(message)
+        if not message.get('data'):
+            return data
+        for subscr_name, serializer in serializers:
+            _data = await serializer.data(message)
             if _data:
                 data[subscr_name] = _data
         return data
 
+    def reset_dispatch(self) -> None:
+        self._dispatch = {}
+        self._dispatch_subscriptions = None
+
+    def _table_serializers(self, table: str) -> Tuple[Tuple[str, Serializer], ...]:
+        """
+        Subscribed serializers of the table, compiled once per subscription set
+        """
+        if self._dispatch_subscriptions is not self._wss_api.subscriptions:
+            self._dispatch = {}
+            self._dispatch_subscriptions = self._wss_api.subscriptions
+        if (serializers := self._dispatch.get(table)) is None:
+            serializers = self._dispatch[table] = tuple(
+                (subscr_name, self._subscr_serializer(subscr_name))
+                for subscr_name in self.table_subscriptions(table)
+                if subscr_name in self._wss_api.subscriptions
+            )
+        return serializers
+
+    def _is_subscription_message(self, message: dict) -> bool:
+        return True
+
     def get_state(self, subscr_name: str, symbol: str = None) -> Optional[dict]:
         serializer: Serializer = self._subscr_serializer(subscr_name)
         if not serializer:
             return None
         return serializer.state(symbol)
 
-    @abstractmethod
-    def _get_serializers(self, message: dict) -> Dict[str, Serializer]:
-        raise NotImplementedError
+    def table_subscriptions(self, table: str) -> tuple:
+        subscriptions = self.table_route_map.get(table, ())
+        if not isinstance(subscriptions, (list, tuple)):
+            subscriptions = (subscriptions,)
+        return tuple(subscriptions)
+
+    def is_stateless(self, table: str) -> bool:
+        """
+        Whether every subscribed serializer of the table converts messages
+        without state kept between them, so it can run in a worker process
+        """
+        serializers = self._table_serializers(table)
+        return bool(serializers) and all(s in self.stateless_subscriptions for s, _ in serializers)
 
     def _subscr_serializer(self, subscr_name) -> Serializer:
         if subscr_name not in self._serializers:
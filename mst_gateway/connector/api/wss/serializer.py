@@ -1,4 +1,5 @@
 from __future__ import annotations
+import time
 from typing import (
     Optional,
     TYPE_CHECKING,
@@ -20,6 +21,7 @@ class Serializer:
     def __init__(self, wss_api: StockWssApi):
         self._wss_api = wss_api
         self._state = None
+        self._latency_stage = f"serialize.{self.subscription}"
 
     def prefetch(self, message: dict) -> None:
         pass
@@ -43,7 +45,12 @@ class Serializer:
         self._state[symbol.lower()] = data
 
     async def data(self, message) -> Optional[dict]:
-        (action, data) = await self._get_data(message)
+        if (latency := self._wss_api.latency) is None:
+            (action, data) = await self._get_data(message)
+        else:
+            started = time.perf_counter()
+            (action, data) = await self._get_data(message)
+            latency.add(message.get('table'), self._latency_stage, time.perf_counter() - started)
         if not data:
             return None
         return {
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from datetime import datetime
 from typing import Optional
 from mst_gateway.storage import BaseSyncStorage
@@ -39,3 +41,32 @@ class ThrottleWss(BaseSyncStorage):
             return False
         self.set(key, now)
         return True
+
+
+class TokenBucket:
+    """
+    Outbound rate limiter: `rate` tokens per second, up to `capacity` at once
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        self._refill()
+        while self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+            self._refill()
+        self._tokens -= 1
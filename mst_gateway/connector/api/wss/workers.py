@@ -0,0 +1,103 @@
+from __future__ import annotations
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from . import StockWssApi
+
+_worker_api: Optional[StockWssApi] = None
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_state_barrier: Optional[threading.Barrier] = None
+# seconds a worker waits for the others to take their state update
+STATE_BARRIER_TIMEOUT = 10
+
+
+def init_worker(api_class, api_kwargs: dict, state_data: dict, subscriptions: dict, state_barrier):
+    global _worker_api, _worker_loop, _state_barrier
+    _worker_api = api_class(state_storage={}, **api_kwargs)
+    _worker_api._set_state_data(state_data)
+    _worker_api._subscriptions = subscriptions
+    _worker_loop = asyncio.new_event_loop()
+    _state_barrier = state_barrier
+
+
+def process_frames(frames: list) -> list:
+    return _worker_loop.run_until_complete(_worker_api._process_worker_frames(frames))
+
+
+def update_state(state_data: dict) -> None:
+    """
+    Replace the symbol state of a worker, then wait until every worker took
+    one of the updates submitted together, so none of them gets two
+    """
+    _worker_api._set_state_data(state_data)
+    try:
+        _state_barrier.wait(STATE_BARRIER_TIMEOUT)
+    except threading.BrokenBarrierError:
+        pass
+
+
+class WssWorkerPool:
+    """
+    Process pool running parsing and serializers of stateless tables of a wss api.
+
+    Workers hold a copy of the api with its symbol state and subscriptions. A
+    refreshed symbol state is sent to the running workers ahead of the next frames,
+    the pool is recreated when the subscriptions change, frames already sent keep
+    their workers.
+    """
+
+    def __init__(self, api: StockWssApi, workers: int):
+        self._api = api
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._key = None
+        self._state_data = None
+        self._state_barrier = None
+
+    def submit(self, frames: list) -> asyncio.Future:
+        executor = self._get_executor()
+        if self._api.state_data is not self._state_data:
+            self._update_state(executor)
+        return asyncio.get_running_loop().run_in_executor(executor, process_frames, frames)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._key = None
+
+    def _update_state(self, executor: ProcessPoolExecutor):
+        self._state_data = self._api.state_data
+        if self._state_barrier.broken:
+            self._state_barrier.reset()
+        for _ in range(self.workers):
+            executor.submit(update_state, self._state_data)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        api = self._api
+        key = tuple(sorted(api.subscriptions))
+        if key != self._key:
+            self.shutdown()
+            context = multiprocessing.get_context()
+            self._state_barrier = context.Barrier(self.workers)
+            self._state_data = api.state_data
+            self._executor = ProcessPoolExecutor(
+                self.workers,
+                mp_context=context,
+                initializer=init_worker,
+                initargs=(
+                    api.__class__,
+                    dict(name=api.name, account_name=api.account_name, test=api.test,
+                         schema=api.schema, register_state=api.register_state, options=api.worker_options),
+                    api.state_data,
+                    deepcopy(api.subscriptions),
+                    self._state_barrier
+                )
+            )
+            self._key = key
+        return self._executor
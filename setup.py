@@ -25,7 +25,13 @@ setup(
     ],
     extras_require={
         'mysql': ['mysql-connector-python'],
-        'pgsql': ['psycopg2']
+        'pgsql': ['psycopg2'],
+        'orjson': ['orjson'],
+        'ujson': ['ujson'],
+        'msgspec': ['msgspec'],
+        'msgpack': ['msgpack'],
+        'numpy': ['numpy'],
+        'redis': ['redis>=4.2']
     },
     entry_points={
         'console_scripts': [
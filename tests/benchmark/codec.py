@@ -0,0 +1,48 @@
+"""
+Per-frame decode/encode cost of the available json codecs on recorded exchange frames.
+
+    python -m tests.benchmark.codec [-n NUMBER]
+"""
+import argparse
+import timeit
+from mst_gateway.connector.api.utils.codec import JSON_CODECS, JsonCodec
+from .fixtures import binance_frames, bitmex_frames
+
+
+def available_codecs() -> list:
+    codecs = []
+    for codec_class in JSON_CODECS.values():
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            continue
+    return codecs
+
+
+def bench_codec(codec: JsonCodec, frames: list, number: int) -> tuple:
+    decoded = [codec.loads(frame) for frame in frames]
+    loads_time = timeit.timeit(lambda: [codec.loads(frame) for frame in frames], number=number)
+    dumps_time = timeit.timeit(lambda: [codec.dumps(data) for data in decoded], number=number)
+    count = len(frames) * number
+    return loads_time / count * 1e6, dumps_time / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--number', type=int, default=2000, help="passes over the fixtures")
+    args = parser.parse_args()
+    codecs = available_codecs()
+    print(f"{'exchange':<10}{'table':<15}{'codec':<10}{'loads us':>10}{'dumps us':>10}{'speedup':>10}")
+    for exchange, frames in (('binance', binance_frames()), ('bitmex', bitmex_frames())):
+        for table, table_frames in frames.items():
+            if not table_frames:
+                continue
+            results = {codec.name: bench_codec(codec, table_frames, args.number) for codec in codecs}
+            baseline = results[JsonCodec.name][0]
+            for name, (loads_us, dumps_us) in results.items():
+                print(f"{exchange:<10}{table:<15}{name:<10}{loads_us:>10.2f}{dumps_us:>10.2f}"
+                      f"{baseline / loads_us:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
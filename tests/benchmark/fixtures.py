@@ -0,0 +1,90 @@
+import json
+from mst_gateway.connector.api.types import OrderSchema
+from tests.mst_gateway.connector.api.binance import data as binance_data
+from tests.mst_gateway.connector.api.bitmex import data as bitmex_data
+
+
+BINANCE_MESSAGES = {
+    'order': binance_data.DEFAULT_ORDER_MESSAGE,
+    'order_book': binance_data.DEFAULT_ORDER_BOOK_MESSAGE,
+    'position': binance_data.DEFAULT_POSITION_MESSAGE,
+    'quote_bin': binance_data.DEFAULT_QUOTE_BIN_MESSAGE,
+    'symbol': binance_data.DEFAULT_SYMBOL_MESSAGE,
+    'symbol_detail': binance_data.DEFAULT_SYMBOL_DETAIL_MESSAGE,
+    'trade': binance_data.DEFAULT_TRADE_MESSAGE,
+    'wallet': binance_data.DEFAULT_WALLET_MESSAGE,
+}
+
+BITMEX_MESSAGES = {
+    'order': bitmex_data.DEFAULT_ORDER_DATA,
+    'order_book': bitmex_data.DEFAULT_ORDER_BOOK_DATA,
+    'position': bitmex_data.DEFAULT_POSITION_DATA,
+    'quote_bin': bitmex_data.DEFAULT_QUOTE_BIN_DATA,
+    'symbol': bitmex_data.DEFAULT_SYMBOL_DATA,
+    'trade': bitmex_data.DEFAULT_TRADE_DATA,
+    'wallet': bitmex_data.DEFAULT_WALLET_DATA,
+}
+
+
+def binance_frames(schema: str = None) -> dict:
+    """
+    Raw text frames of recorded binance messages grouped by table
+    """
+    frames = {}
+    for table, messages in BINANCE_MESSAGES.items():
+        for _schema, message in messages.items():
+            if schema is not None and _schema != schema:
+                continue
+            frames.setdefault(table, []).append(json.dumps(message))
+    return frames
+
+
+def bitmex_frames(schema: str = OrderSchema.margin) -> dict:
+    """
+    Raw text frames of recorded bitmex messages grouped by table
+    """
+    return {
+        table: [data['message'] for data in messages.get(schema, [])]
+        for table, messages in BITMEX_MESSAGES.items()
+    }
+
+
+def _binance_rest_order(message: dict) -> tuple:
+    # futures updates nest the order in `o`, spot execution reports are flat
+    order = message['o'] if isinstance(message.get('o'), dict) else message
+    return order['s'], {
+        'symbol': order['s'], 'orderId': order['i'], 'clientOrderId': order['c'], 'price': order['p'],
+        'origQty': order['q'], 'executedQty': order['z'], 'status': order['X'], 'timeInForce': order['f'],
+        'type': order['o'], 'side': order['S'], 'stopPrice': order.get('sp', order.get('P')),
+        'updateTime': order['T'],
+    }
+
+
+def _binance_rest_symbol(message: dict) -> dict:
+    return {
+        'symbol': message['s'], 'lastPrice': message['c'], 'priceChange': message['p'],
+        'bidPrice': message.get('b'), 'askPrice': message.get('a'), 'volume': message['v'],
+        'highPrice': message['h'], 'lowPrice': message['l'], 'closeTime': message['C'],
+    }
+
+
+BINANCE_REST_ITEMS = {
+    'order': lambda message: [_binance_rest_order(message)],
+    'order_book': lambda message: [(message['s'], {'bids': message['b'], 'asks': message['a']})],
+    'quote_bin': lambda message: [(message['s'], [message['k'][key] for key in ('t', 'o', 'h', 'l', 'c', 'v')])],
+    'symbol': lambda messages: [(message['s'], _binance_rest_symbol(message)) for message in messages],
+    'trade': lambda message: [
+        (message['s'], {'price': message['p'], 'qty': message['q'], 'time': message['T'], 'isBuyerMaker': message['m']})
+    ],
+}
+
+
+def binance_rest_items(schema: str) -> dict:
+    """
+    Items of binance REST responses grouped by table as (symbol, item), built from
+    the recorded websocket messages of the same data
+    """
+    return {
+        table: to_rest(BINANCE_MESSAGES[table][schema])
+        for table, to_rest in BINANCE_REST_ITEMS.items() if schema in BINANCE_MESSAGES[table]
+    }
@@ -0,0 +1,64 @@
+"""
+Cost of bitmex trade timestamps in the quote_bin subscription on recorded trade frames.
+
+`strptime us` and `parse us` compare the former strptime path with the shared
+iso parser per timestamp, `quote_bin us` is Router.get_data of the quote_bin
+serializer per trade after a tradeBin1m message initialized it.
+
+    python -m tests.benchmark.quote_bin [-n NUMBER]
+"""
+import argparse
+import asyncio
+import json
+import time
+import timeit
+from copy import deepcopy
+from datetime import datetime
+from mst_gateway.connector.api import DATETIME_FORMAT
+from mst_gateway.connector.api.stocks.bitmex import BitmexWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.utils import parse_iso_datetime
+from tests.mst_gateway.connector.api.bitmex.data import DEFAULT_QUOTE_BIN_DATA, DEFAULT_TRADE_DATA
+
+
+def trade_messages(schema: str = OrderSchema.margin) -> list:
+    return [json.loads(data['message']) for data in DEFAULT_TRADE_DATA[schema]]
+
+
+def bench_parse(timestamps: list, number: int) -> tuple:
+    count = len(timestamps) * number
+    strptime_time = timeit.timeit(
+        lambda: [datetime.strptime(token.split('Z')[0], DATETIME_FORMAT) for token in timestamps], number=number
+    )
+    parse_time = timeit.timeit(lambda: [parse_iso_datetime(token) for token in timestamps], number=number)
+    return strptime_time / count * 1e6, parse_time / count * 1e6
+
+
+async def bench_quote_bin(messages: list, number: int) -> float:
+    api = BitmexWssApi(name='tbitmex', schema=OrderSchema.margin, register_state=False)
+    api._subscriptions = {'quote_bin': {'*': {'1'}}}
+    await api.get_data(json.loads(DEFAULT_QUOTE_BIN_DATA[OrderSchema.margin][0]['message']))
+    # the serializer parses timestamps in place, so every pass gets its own copy
+    passes = [deepcopy(messages) for _ in range(number)]
+    started = time.perf_counter()
+    for _messages in passes:
+        for message in _messages:
+            await api.get_data(message)
+    count = sum(len(message['data']) for message in messages) * number
+    return (time.perf_counter() - started) / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--number', type=int, default=2000, help="passes over the fixtures")
+    args = parser.parse_args()
+    messages = trade_messages()
+    timestamps = [item['timestamp'] for message in messages for item in message['data']]
+    strptime_us, parse_us = bench_parse(timestamps, args.number)
+    quote_bin_us = asyncio.run(bench_quote_bin(messages, args.number))
+    print(f"{'trades':>7}{'strptime us':>13}{'parse us':>10}{'speedup':>10}{'quote_bin us':>14}")
+    print(f"{len(timestamps):>7}{strptime_us:>13.2f}{parse_us:>10.2f}{strptime_us / parse_us:>9.2f}x{quote_bin_us:>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Replay a frame capture log, as written by consume(capture=PATH), through
+process_message of an api with the recorded fixture state, subscribed to every
+table. Reports the replay rate and per table route/serialize latency, so a
+captured incident doubles as a realistic load for profiling the serializers.
+
+    python -m tests.benchmark.replay PATH [--exchange EXCHANGE] [--schema SCHEMA] [--speed SPEED]
+"""
+import argparse
+import asyncio
+import logging
+import time
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.wss.capture import FrameReplay
+from .router import make_api, wss_apis
+
+
+def _discard(data):
+    pass
+
+
+async def run(path: str, exchange: str, schema: str, speed: float):
+    for name, api_class, _schema, storage, _ in wss_apis():
+        if name == exchange and _schema == schema:
+            break
+    else:
+        raise SystemExit(f"no {exchange} api with schema {schema}")
+    api = make_api(api_class, name, schema, storage, 'trade')
+    api._subscriptions = {subscr_name: {'*': {'1'}} for subscr_name in api.router_class.serializer_classes}
+    api._start_latency(True)
+    started = time.perf_counter()
+    count = await FrameReplay(api, path, speed or None).run(_discard)
+    elapsed = time.perf_counter() - started
+    print(f"{count} frames in {elapsed:.3f}s, {count / elapsed if elapsed else 0:.0f} frames/s")
+    print(f"{'table':<26}{'stage':<26}{'count':>8}{'p50 us':>10}{'p99 us':>10}")
+    for table, stages in api.latency_snapshot().items():
+        for stage, histogram in stages.items():
+            if stage == 'lag':
+                continue
+            print(f"{table:<26}{stage:<26}{histogram['count']:>8}{histogram['p50_us']:>10.1f}"
+                  f"{histogram['p99_us']:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help="capture log directory")
+    parser.add_argument('--exchange', default='binance', choices=('binance', 'bitmex'))
+    parser.add_argument('--schema', default=OrderSchema.exchange)
+    parser.add_argument('--speed', type=float, default=0, help="replay speed, 1 is real time, 0 as fast as possible")
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+    asyncio.run(run(args.path, args.exchange, args.schema, args.speed))
+
+
+if __name__ == '__main__':
+    main()
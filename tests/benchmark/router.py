@@ -0,0 +1,98 @@
+"""
+Cost of Router.get_data per routed message on recorded market data frames.
+
+Frames are parsed, looked up and split beforehand, so only routing and
+serialization are measured. `route us` is the same call with serializers
+returning at once, i.e. the routing overhead alone.
+
+    python -m tests.benchmark.router [-n NUMBER]
+"""
+import argparse
+import asyncio
+import time
+from copy import deepcopy
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi, BinanceMarginWssApi, BinanceMarginCoinWssApi
+from mst_gateway.connector.api.stocks.bitmex import BitmexWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.utils import parse_message
+from mst_gateway.connector.api.wss.serializer import Serializer
+from mst_gateway.storage.var import StateStorageKey
+from tests.mst_gateway.connector.api.binance.data import storage as binance_storage
+from tests.mst_gateway.connector.api.bitmex.data import storage as bitmex_storage
+from .fixtures import binance_frames, bitmex_frames
+
+MARKET_TABLES = ('trade', 'order_book', 'quote_bin', 'symbol')
+
+
+def wss_apis() -> list:
+    return [
+        ('binance', BinanceWssApi, OrderSchema.exchange, binance_storage, binance_frames(OrderSchema.exchange)),
+        ('binance', BinanceMarginWssApi, OrderSchema.margin, binance_storage, binance_frames(OrderSchema.margin)),
+        ('binance', BinanceMarginCoinWssApi, OrderSchema.margin_coin, binance_storage,
+         binance_frames(OrderSchema.margin_coin)),
+        ('bitmex', BitmexWssApi, OrderSchema.margin, bitmex_storage, bitmex_frames(OrderSchema.margin)),
+    ]
+
+
+def make_api(api_class, name: str, schema: str, storage, table: str):
+    api = api_class(name=f"t{name}", schema=schema, state_storage=deepcopy(storage.STORAGE_DATA))
+    api._set_state_data(api.storage.get(f"{StateStorageKey.symbol}.{api.name}.{api.schema}"))
+    api._subscriptions = {table: {'*': {'1'}}}
+    return api
+
+
+def routed_messages(api, frames: list) -> list:
+    messages = []
+    for frame in frames:
+        if message := api._lookup_table(parse_message(frame)):
+            messages.extend(api._split_message(message))
+    return messages
+
+
+async def bench_get_data(api, messages: list, number: int) -> float:
+    # serializers may change messages in place, so every pass gets its own copy
+    passes = [deepcopy(messages) for _ in range(number)]
+    started = time.perf_counter()
+    for _messages in passes:
+        for message in _messages:
+            await api.get_data(message)
+    return (time.perf_counter() - started) / (len(messages) * number) * 1e6
+
+
+async def _skip_data(self, message):
+    return None
+
+
+async def bench_routing(api, messages: list, number: int) -> float:
+    data = Serializer.data
+    Serializer.data = _skip_data
+    try:
+        return await bench_get_data(api, messages, number)
+    finally:
+        Serializer.data = data
+
+
+async def run(number: int):
+    print(f"{'exchange':<10}{'schema':<13}{'table':<12}{'messages':>9}{'get_data us':>13}{'route us':>10}")
+    for name, api_class, schema, storage, frames in wss_apis():
+        for table in MARKET_TABLES:
+            if not frames.get(table):
+                continue
+            api = make_api(api_class, name, schema, storage, table)
+            messages = routed_messages(api, frames[table])
+            if not messages:
+                continue
+            us = await bench_get_data(api, messages, number)
+            route_us = await bench_routing(api, messages, number)
+            print(f"{name:<10}{schema:<13}{table:<12}{len(messages):>9}{us:>13.2f}{route_us:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--number', type=int, default=2000, help="passes over the fixtures")
+    args = parser.parse_args()
+    asyncio.run(run(args.number))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""
+Offline throughput of the recorded exchange frames through StockWssApi.process_message
+and of the REST converters: bitmex on the recorded items (bitmex REST and websocket
+share the object format), binance on REST items built from the recorded messages.
+
+Per table: messages per second, p50/p99 per message, bytes (tracemalloc peak) and
+memory blocks (tracemalloc snapshot diff) allocated per message in a separate pass,
+and memory blocks still held per message after all passes and a garbage collection. `--json` prints the results for a CI job, `--compare` exits
+with status 1 if a table got slower than the saved results by more than `--tolerance`,
+with `--normalize` relative to the median slowdown of all tables. `tox -e benchmark`
+compares with tests/benchmark/baseline.json, the second command below records it.
+
+    python -m tests.benchmark.throughput [-n NUMBER] [--table TABLE] [--json] [--compare FILE] [--normalize]
+    python -m tests.benchmark.throughput -n 1000 --json > tests/benchmark/baseline.json
+"""
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from array import array
+from functools import partial
+from mst_gateway.connector.api.stocks.binance import utils as binance_utils
+from mst_gateway.connector.api.stocks.bitmex import utils as bitmex_utils
+from mst_gateway.connector.api.types import OrderSchema
+from .fixtures import binance_rest_items
+from .router import make_api, wss_apis
+
+BITMEX_REST_CONVERTERS = {
+    'order': lambda item, state_data: bitmex_utils.load_order_data(OrderSchema.margin, item, state_data),
+    'order_book': bitmex_utils.load_order_book_data,
+    'quote_bin': lambda item, state_data: bitmex_utils.load_quote_bin_data(item, state_data, binsize='1m'),
+    'symbol': bitmex_utils.load_symbol_data,
+    'trade': bitmex_utils.load_trade_data,
+}
+
+# converters of the binance REST api methods, called with the schema first
+BINANCE_REST_CONVERTERS = {
+    'order': binance_utils.load_order_data,
+    'order_book': lambda schema, item, state_data: binance_utils.load_order_book_data(
+        item, state_data.get('symbol'), None, False, None, None, state_data),
+    'quote_bin': lambda schema, item, state_data: binance_utils.load_quote_bin_data(item, state_data),
+    'symbol': lambda schema, item, state_data: (
+        binance_utils.load_symbol_data if schema == OrderSchema.exchange else binance_utils.load_futures_symbol_data
+    )(schema, item, state_data),
+    'trade': lambda schema, item, state_data: binance_utils.load_trade_data(item, state_data),
+}
+
+
+def _discard(data):
+    pass
+
+
+def summary(durations: list, allocated: float, allocated_blocks: float, retained: float) -> dict:
+    durations = sorted(durations)
+    count = len(durations)
+    total = sum(durations)
+    return {
+        'messages': count,
+        'msgs_s': count / total if total else None,
+        'p50_us': durations[count // 2] * 1e6,
+        'p99_us': durations[min(int(count * 0.99), count - 1)] * 1e6,
+        'alloc_b': allocated,
+        'alloc_blocks': allocated_blocks,
+        'retained_blocks': retained,
+    }
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+
+async def measure_allocations(call, inputs: list) -> tuple:
+    """
+    Peak bytes and memory blocks allocated per call, the blocks are the new
+    traces of a snapshot taken after the call, before any garbage is collected
+    """
+    tracemalloc.start()
+    allocated = 0
+    blocks = 0
+    for args in inputs:
+        gc.collect()
+        before = _snapshot()
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        if inspect.isawaitable(result := call(*args)):
+            await result
+        allocated += tracemalloc.get_traced_memory()[1] - current
+        blocks += sum(stat.count_diff for stat in _snapshot().compare_to(before, 'lineno') if stat.count_diff > 0)
+    tracemalloc.stop()
+    return allocated / len(inputs), blocks / len(inputs)
+
+
+async def bench_process(api, frames: list, number: int) -> dict:
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    # raw doubles, a list of floats would count as a held block per message
+    durations = array('d')
+    for _ in range(number):
+        for frame in frames:
+            started = time.perf_counter()
+            await api.process_message(frame, _discard)
+            durations.append(time.perf_counter() - started)
+    gc.collect()
+    retained = (sys.getallocatedblocks() - blocks) / len(durations)
+    allocated = await measure_allocations(api.process_message, [(frame, _discard) for frame in frames])
+    return summary(durations, *allocated, retained)
+
+
+async def bench_converter(converter, items: list, number: int) -> dict:
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    durations = array('d')
+    for _ in range(number):
+        for item, state_data in items:
+            started = time.perf_counter()
+            converter(item, state_data)
+            durations.append(time.perf_counter() - started)
+    gc.collect()
+    retained = (sys.getallocatedblocks() - blocks) / len(durations)
+    allocated = await measure_allocations(converter, items)
+    return summary(durations, *allocated, retained)
+
+
+async def run_wss(number: int, tables: list) -> dict:
+    results = {}
+    for name, api_class, schema, storage, frames in wss_apis():
+        for table, table_frames in frames.items():
+            if not table_frames or (tables and table not in tables):
+                continue
+            api = make_api(api_class, name, schema, storage, table)
+            results[f"wss.{name}.{schema}.{table}"] = await bench_process(api, table_frames, number)
+    return results
+
+
+async def run_rest(number: int, tables: list) -> dict:
+    results = {}
+    for name, api_class, schema, storage, frames in wss_apis():
+        api = make_api(api_class, name, schema, storage, 'symbol')
+        if name == 'bitmex':
+            converters = BITMEX_REST_CONVERTERS
+            table_items = {
+                table: [(item.get('symbol'), item) for frame in table_frames for item in json.loads(frame).get('data', [])]
+                for table, table_frames in frames.items()
+            }
+        else:
+            converters = {table: partial(converter, schema) for table, converter in BINANCE_REST_CONVERTERS.items()}
+            table_items = binance_rest_items(schema)
+        for table, items in table_items.items():
+            if (converter := converters.get(table)) is None or (tables and table not in tables):
+                continue
+            items = [(item, api.get_state_data(symbol)) for symbol, item in items]
+            if items:
+                results[f"rest.{name}.{schema}.{table}"] = await bench_converter(converter, items, number)
+    return results
+
+
+def regressions(results: dict, baseline: dict, tolerance: float, normalize: bool = False) -> list:
+    """
+    Benchmarks whose p50 grew by more than `tolerance` against `baseline`, with
+    `normalize` relative to the median change of all of them, so that a machine
+    slower or faster than the one of the baseline does not count
+    """
+    ratios = {name: result['p50_us'] / baseline[name]['p50_us'] for name, result in results.items() if name in baseline}
+    scale = statistics.median(ratios.values()) if normalize and ratios else 1.0
+    return [name for name, ratio in ratios.items() if ratio > scale * (1 + tolerance)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--number', type=int, default=500, help="passes over the fixtures")
+    parser.add_argument('--table', action='append', default=[], help="only these tables")
+    parser.add_argument('--json', action='store_true', help="print results as json")
+    parser.add_argument('--compare', help="json results of a previous run to compare p50 with")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed p50 slowdown against --compare")
+    parser.add_argument('--normalize', action='store_true',
+                        help="compare p50 relative to the median change of all benchmarks, e.g. on another machine")
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+    results = asyncio.run(run_wss(args.number, args.table))
+    results.update(asyncio.run(run_rest(args.number, args.table)))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'benchmark':<40}{'msgs':>7}{'msgs/s':>11}{'p50 us':>9}{'p99 us':>9}{'alloc B':>9}"
+              f"{'alloc blk':>10}{'held blk':>9}")
+        for name, result in results.items():
+            print(f"{name:<40}{result['messages']:>7}{result['msgs_s']:>11.0f}{result['p50_us']:>9.2f}"
+                  f"{result['p99_us']:>9.2f}{result['alloc_b']:>9.0f}{result['alloc_blocks']:>10.1f}"
+                  f"{result['retained_blocks']:>9.2f}")
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            if slower := regressions(results, json.load(baseline_file), args.tolerance, args.normalize):
+                print(f"slower than {args.compare}: {', '.join(slower)}", file=sys.stderr)
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
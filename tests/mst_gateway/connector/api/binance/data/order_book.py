@@ -241,28 +241,13 @@ DEFAULT_ORDER_BOOK_SPLIT_MESSAGE_RESULT = {
             'action': 'delete',
             'data': [
                 {
-                    'b': ['50238.41000000', '0.00000000'],
-                    'e': 'depthUpdate',
-                    'E': 1638958726119,
-                    's': 'BTCUSDT',
-                    'U': 3288887,
-                    'u': 3288893,
-                },
-                {
-                    'a': ['50249.10000000', '0.00000000'],
-                    'e': 'depthUpdate',
-                    'E': 1638958726119,
-                    's': 'BTCUSDT',
-                    'U': 3288887,
-                    'u': 3288893,
-                },
-                {
-                    'a': ['50266.42000000', '0.00000000'],
                     'e': 'depthUpdate',
                     'E': 1638958726119,
                     's': 'BTCUSDT',
                     'U': 3288887,
                     'u': 3288893,
+                    'b': [['50238.41000000', '0.00000000']],
+                    'a': [['50249.10000000', '0.00000000'], ['50266.42000000', '0.00000000']],
                 },
             ],
         },
@@ -271,36 +256,13 @@ DEFAULT_ORDER_BOOK_SPLIT_MESSAGE_RESULT = {
             'action': 'update',
             'data': [
                 {
-                    'b': ['50235.76000000', '0.00995400'],
-                    'e': 'depthUpdate',
-                    'E': 1638958726119,
-                    's': 'BTCUSDT',
-                    'U': 3288887,
-                    'u': 3288893,
-                },
-                {
-                    'b': ['50230.59000000', '0.00995500'],
-                    'e': 'depthUpdate',
-                    'E': 1638958726119,
-                    's': 'BTCUSDT',
-                    'U': 3288887,
-                    'u': 3288893,
-                },
-                {
-                    'a': ['50245.03000000', '0.00995200'],
-                    'e': 'depthUpdate',
-                    'E': 1638958726119,
-                    's': 'BTCUSDT',
-                    'U': 3288887,
-                    'u': 3288893,
-                },
-                {
-                    'a': ['50252.50000000', '0.00995000'],
                     'e': 'depthUpdate',
                     'E': 1638958726119,
                     's': 'BTCUSDT',
                     'U': 3288887,
                     'u': 3288893,
+                    'b': [['50235.76000000', '0.00995400'], ['50230.59000000', '0.00995500']],
+                    'a': [['50245.03000000', '0.00995200'], ['50252.50000000', '0.00995000']],
                 },
             ],
         },
@@ -311,17 +273,6 @@ DEFAULT_ORDER_BOOK_SPLIT_MESSAGE_RESULT = {
             'action': 'delete',
             'data': [
                 {
-                    'b': ['48982.80', '0.000'],
-                    'e': 'depthUpdate',
-                    'E': 1638963965447,
-                    'T': 1638963965439,
-                    's': 'BTCUSDT',
-                    'U': 23138568456,
-                    'u': 23138568515,
-                    'pu': 23138568440,
-                },
-                {
-                    'b': ['49033.90', '0.000'],
                     'e': 'depthUpdate',
                     'E': 1638963965447,
                     'T': 1638963965439,
@@ -329,6 +280,8 @@ DEFAULT_ORDER_BOOK_SPLIT_MESSAGE_RESULT = {
                     'U': 23138568456,
                     'u': 23138568515,
                     'pu': 23138568440,
+                    'b': [['48982.80', '0.000'], ['49033.90', '0.000']],
+                    'a': [],
                 },
             ],
         },
@@ -337,37 +290,6 @@ DEFAULT_ORDER_BOOK_SPLIT_MESSAGE_RESULT = {
             'action': 'update',
             'data': [
                 {
-                    'b': ['49058.78', '0.020'],
-                    'e': 'depthUpdate',
-                    'E': 1638963965447,
-                    'T': 1638963965439,
-                    's': 'BTCUSDT',
-                    'U': 23138568456,
-                    'u': 23138568515,
-                    'pu': 23138568440,
-                },
-                {
-                    'b': ['49087.77', '0.010'],
-                    'e': 'depthUpdate',
-                    'E': 1638963965447,
-                    'T': 1638963965439,
-                    's': 'BTCUSDT',
-                    'U': 23138568456,
-                    'u': 23138568515,
-                    'pu': 23138568440,
-                },
-                {
-                    'a': ['49329.52', '0.010'],
-                    'e': 'depthUpdate',
-                    'E': 1638963965447,
-                    'T': 1638963965439,
-                    's': 'BTCUSDT',
-                    'U': 23138568456,
-                    'u': 23138568515,
-                    'pu': 23138568440,
-                },
-                {
-                    'a': ['49353.42', '0.040'],
                     'e': 'depthUpdate',
                     'E': 1638963965447,
                     'T': 1638963965439,
@@ -375,6 +297,8 @@ DEFAULT_ORDER_BOOK_SPLIT_MESSAGE_RESULT = {
                     'U': 23138568456,
                     'u': 23138568515,
                     'pu': 23138568440,
+                    'b': [['49058.78', '0.020'], ['49087.77', '0.010']],
+                    'a': [['49329.52', '0.010'], ['49353.42', '0.040']],
                 },
             ],
         },
@@ -385,18 +309,6 @@ DEFAULT_ORDER_BOOK_SPLIT_MESSAGE_RESULT = {
             'action': 'delete',
             'data': [
                 {
-                    'a': ['49242.9', '0'],
-                    'e': 'depthUpdate',
-                    'E': 1638963974916,
-                    'T': 1638963974726,
-                    's': 'BTCUSD_PERP',
-                    'ps': 'BTCUSD',
-                    'U': 2091967181,
-                    'u': 2091967184,
-                    'pu': 2091967180,
-                },
-                {
-                    'a': ['49244.9', '0'],
                     'e': 'depthUpdate',
                     'E': 1638963974916,
                     'T': 1638963974726,
@@ -405,6 +317,8 @@ DEFAULT_ORDER_BOOK_SPLIT_MESSAGE_RESULT = {
                     'U': 2091967181,
                     'u': 2091967184,
                     'pu': 2091967180,
+                    'b': [],
+                    'a': [['49242.9', '0'], ['49244.9', '0']],
                 },
             ],
         },
@@ -413,18 +327,6 @@ DEFAULT_ORDER_BOOK_SPLIT_MESSAGE_RESULT = {
             'action': 'update',
             'data': [
                 {
-                    'b': ['49219.7', '0.020'],
-                    'e': 'depthUpdate',
-                    'E': 1638963974916,
-                    'T': 1638963974726,
-                    's': 'BTCUSD_PERP',
-                    'ps': 'BTCUSD',
-                    'U': 2091967181,
-                    'u': 2091967184,
-                    'pu': 2091967180,
-                },
-                {
-                    'a': ['49245.9', '0.010'],
                     'e': 'depthUpdate',
                     'E': 1638963974916,
                     'T': 1638963974726,
@@ -433,6 +335,8 @@ DEFAULT_ORDER_BOOK_SPLIT_MESSAGE_RESULT = {
                     'U': 2091967181,
                     'u': 2091967184,
                     'pu': 2091967180,
+                    'b': [['49219.7', '0.020']],
+                    'a': [['49245.9', '0.010']],
                 },
             ],
         },
@@ -0,0 +1,119 @@
+import asyncio
+import pytest
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi, BinanceMarginWssApi
+from mst_gateway.connector.api.stocks.binance.wss.order_book import BinanceOrderBook
+from mst_gateway.connector.api.types import OrderSchema, BUY, SELL
+
+SNAPSHOT = {
+    'lastUpdateId': 100,
+    'bids': [['9.0', '1.0'], ['8.0', '2.0'], ['7.0', '3.0']],
+    'asks': [['10.0', '1.0'], ['11.0', '0.5'], ['12.0', '4.0']],
+}
+
+
+def depth_event(first: int, last: int, bids=(), asks=(), prev: int = None) -> dict:
+    event = {'e': 'depthUpdate', 's': 'BTCUSDT', 'U': first, 'u': last, 'b': list(bids), 'a': list(asks)}
+    if prev is not None:
+        event['pu'] = prev
+    return event
+
+
+def depth_message(*events) -> dict:
+    return {'table': 'depthUpdate', 'action': 'update', 'data': list(events)}
+
+
+class TestBinanceOrderBook:
+
+    def test_snapshot_replay(self):
+        book = BinanceOrderBook('btcusdt')
+        assert not book.apply(depth_event(95, 99, bids=[['9.0', '0']]))
+        assert not book.apply(depth_event(100, 102, bids=[['9.5', '1.5']], asks=[['10.0', '0']]))
+        assert book.load_snapshot(SNAPSHOT)
+        assert book.last_update_id == 102
+        assert [level[0] for level in book.levels('bids')] == ['9.5', '9.0', '8.0', '7.0']
+        assert [level[0] for level in book.levels('asks')] == ['11.0', '12.0']
+        assert book.apply(depth_event(103, 103, bids=[['8.0', '0']]))
+        assert [level[0] for level in book.levels('bids')] == ['9.5', '9.0', '7.0']
+
+    def test_gap_resync(self):
+        book = BinanceOrderBook('btcusdt')
+        book.load_snapshot(SNAPSHOT)
+        assert book.apply(depth_event(99, 101))
+        assert not book.apply(depth_event(105, 106))
+        assert not book.synced and book.gaps == 1
+        assert not book.load_snapshot(SNAPSHOT)
+        assert book.load_snapshot(dict(SNAPSHOT, lastUpdateId=104))
+        assert book.last_update_id == 106
+
+    def test_futures_sequence(self):
+        book = BinanceOrderBook('btcusdt')
+        book.load_snapshot(SNAPSHOT)
+        assert book.apply(depth_event(90, 100, prev=89))
+        assert book.apply(depth_event(101, 110, prev=100))
+        assert not book.apply(depth_event(115, 120, prev=111))
+
+    def test_get(self):
+        book = BinanceOrderBook('btcusdt')
+        book.load_snapshot(SNAPSHOT)
+        data = book.get('BTCUSDT', depth=2, offset=1, min_volume_sell=1.0)
+        assert [(item['price'], item['side']) for item in data] == [(12.0, SELL), (8.0, BUY), (7.0, BUY)]
+        data = book.get('BTCUSDT', depth=1, side=BUY, split=True)
+        assert list(data) == [BUY] and data[BUY][0]['price'] == 9.0
+
+
+class TestBinanceLocalOrderBooks:
+
+    @staticmethod
+    def make_api(api_class, schema: str, snapshots: list):
+        api = api_class(name='tbinance', schema=schema, options={'local_order_book': True},
+                        register_state=False)
+        api.order_books.resync_delay = 0
+        api.order_books._fetch_snapshot = lambda symbol: snapshots.pop(0)
+        return api
+
+    @pytest.mark.asyncio
+    async def test_sync(self):
+        api = self.make_api(BinanceWssApi, OrderSchema.exchange, [SNAPSHOT])
+        api._split_message(depth_message(depth_event(100, 101, bids=[['9.0', '5.0']])))
+        assert api.get_order_book('BTCUSDT') is None
+        await asyncio.sleep(0.05)
+        assert api.order_books.stats()['btcusdt']['synced']
+        api._split_message(depth_message(depth_event(102, 102, asks=[['10.0', '0']])))
+        data = api.get_order_book('BTCUSDT', depth=1, split=True)
+        assert data[BUY][0]['volume'] == 5.0
+        assert data[SELL][0]['price'] == 11.0
+
+    @pytest.mark.asyncio
+    async def test_grouped(self):
+        api = self.make_api(BinanceWssApi, OrderSchema.exchange, [SNAPSHOT])
+        api._set_state_data({'btcusdt': {'tick': 0.5}})
+        api.options['order_book_groups'] = [1, 4]
+        api._split_message(depth_message(depth_event(101, 101, bids=[['8.5', '1.0']])))
+        await asyncio.sleep(0.05)
+        assert api.get_order_book_grouped('BTCUSDT', 4, side=BUY) == [
+            {'price': 8.0, 'volume': 4.0, 'side': BUY},
+            {'price': 6.0, 'volume': 3.0, 'side': BUY},
+        ]
+        api.get_order_book_group_changes('BTCUSDT', 4)
+        api._split_message(depth_message(depth_event(102, 102, asks=[['10.0', '0']])))
+        assert api.get_order_book_group_changes('BTCUSDT', 4) == [{'price': 10.0, 'volume': 0.0, 'side': SELL}]
+        assert api.get_order_book_grouped('BTCUSDT', 10) is None
+
+    @pytest.mark.asyncio
+    async def test_resync_on_gap(self):
+        api = self.make_api(BinanceMarginWssApi, OrderSchema.margin,
+                            [SNAPSHOT, dict(SNAPSHOT, lastUpdateId=110), dict(SNAPSHOT, lastUpdateId=130)])
+        api._split_message(depth_message(depth_event(95, 105, prev=94)))
+        await asyncio.sleep(0.05)
+        assert api.get_order_book('BTCUSDT') is not None
+        api._split_message(depth_message(depth_event(120, 125, prev=118)))
+        assert api.get_order_book('BTCUSDT') is None
+        await asyncio.sleep(0.05)
+        assert api.order_books.stats()['btcusdt'] == {
+            'synced': True, 'last_update_id': 130, 'levels': 6, 'gaps': 2
+        }
+        api._split_message(depth_message(depth_event(126, 131, prev=125)))
+        await asyncio.sleep(0.05)
+        assert api.order_books.stats()['btcusdt']['last_update_id'] == 131
+        api.order_books.discard('BTCUSDT')
+        assert api.order_books.stats() == {}
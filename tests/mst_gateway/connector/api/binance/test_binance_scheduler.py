@@ -0,0 +1,29 @@
+import pytest
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from ..utils import FakeConnection
+
+
+class TestBinanceCommandScheduler:
+
+    @pytest.mark.asyncio
+    async def test_coalesce_commands(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange)
+        api._handler = FakeConnection()
+        scheduler = api.command_scheduler
+        symbols = [f"s{i}usdt" for i in range(450)]
+        assert scheduler.subscribe('trade', symbols)
+        assert scheduler.unsubscribe('trade', symbols[:50])
+        assert api.command_queue_depth == 450
+        await scheduler.wait()
+        assert api.command_queue_depth == 0
+        assert [(cmd['method'], len(cmd['params'])) for cmd in api.handler.sent] == [
+            ('SUBSCRIBE', 200), ('SUBSCRIBE', 200), ('UNSUBSCRIBE', 50)
+        ]
+        assert api.handler.sent[2]['params'][0] == 's0usdt@trade'
+
+    @pytest.mark.asyncio
+    async def test_closed_connection(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange)
+        assert not api.command_scheduler.subscribe('!ticker@arr')
+        assert api.command_queue_depth == 0
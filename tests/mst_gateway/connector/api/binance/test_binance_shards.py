@@ -0,0 +1,142 @@
+import asyncio
+import json
+import pytest
+from copy import deepcopy
+from types import SimpleNamespace
+from websockets.datastructures import Headers
+from websockets.exceptions import ConnectionClosed, InvalidStatusCode
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.stocks.binance.wss.subscribers import BinanceSubscriber
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.wss.reconnect import ReconnectBackoff
+from mst_gateway.connector.api.wss.throttle import ThrottleWss
+from .data import storage as state_data
+from .data import trade as trade_message
+from ..utils import FakeConnection
+
+
+def shard_api(**options) -> BinanceWssApi:
+    api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange, options={'sharding': True, **options},
+                        state_storage=deepcopy(state_data.STORAGE_DATA))
+    api.connections = []
+    # connection rate history of its own, not shared with other tests
+    api.throttle = ThrottleWss()
+
+    async def _connect(**kwargs):
+        api.connections.append(FakeConnection())
+        return api.connections[-1]
+
+    api._connect = _connect
+    return api
+
+
+class TestBinanceShardPool:
+
+    @pytest.mark.asyncio
+    async def test_subscribe_shards(self):
+        api = shard_api(shard_streams=2)
+        symbols = ['btcusdt', 'ethusdt', 'bnbusdt', 'xrpusdt', 'adausdt']
+        assert await api.shard_pool.subscribe('trade', symbols)
+        assert len(api.shard_pool.shards) == 3
+        assert api.shard_pool.symbols('trade') == set(symbols)
+        assert all(len(shard) <= 2 for shard in api.shard_pool.shards)
+        await api.shard_pool.wait()
+        params = sum([c.sent[0]['params'] for c in api.connections], [])
+        assert sorted(params) == sorted(f"{s}@trade" for s in symbols)
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_rebalance(self):
+        api = shard_api(shard_streams=2, max_shards=2)
+        await api.shard_pool.subscribe('trade', ['btcusdt', 'ethusdt', 'bnbusdt'])
+        assert await api.shard_pool.rebalance('trade', ['btcusdt', 'xrpusdt', 'adausdt', 'dogeusdt', 'solusdt'])
+        assert len(api.shard_pool.symbols('trade')) == 4
+        assert 'btcusdt' in api.shard_pool.symbols('trade')
+        assert not api.shard_pool.symbols('trade').intersection({'ethusdt', 'bnbusdt'})
+        await api.shard_pool.wait()
+        commands = [cmd['method'] for c in api.connections for cmd in c.sent]
+        assert commands.count('UNSUBSCRIBE') == 2
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_merge_frames(self):
+        api = shard_api(shard_streams=1)
+        api.register_state = False
+        api._subscriptions = {'trade': {'*': {'1'}}}
+        messages = []
+        api._StockWssApi__recv_callback = messages.append
+        await api.shard_pool.subscribe('trade', ['btcusdt', 'ethusdt'])
+        for connection in api.connections:
+            connection.frames.put_nowait(json.dumps(trade_message.DEFAULT_TRADE_MESSAGE[OrderSchema.exchange]))
+        await asyncio.sleep(0.01)
+        assert len(messages) == 2
+        assert all(message['trade']['tb'] == 'trade' for message in messages)
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_connect_throttle(self):
+        api = shard_api(shard_streams=1)
+        api.throttle = ThrottleWss(ws_limit=1)
+        assert not await api.shard_pool.subscribe('trade', ['btcusdt', 'ethusdt'])
+        assert len(api.connections) == 1
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_restore_retries(self):
+        api = shard_api(shard_streams=2)
+        await api.shard_pool.subscribe('trade', ['btcusdt'])
+        shard = api.shard_pool.shards[0]
+        shard.backoff = ReconnectBackoff(base=0.001, cap=0.001, jitter=0)
+        connect = api._connect
+        failures = []
+
+        async def _connect(**kwargs):
+            if len(failures) < 2:
+                failures.append(kwargs)
+                raise InvalidStatusCode(429, Headers())
+            return await connect(**kwargs)
+
+        async def recv():
+            raise ConnectionClosed(None, None)
+
+        api._connect = _connect
+        api.connections[0].recv = recv
+        # wake the pending receive, the next one fails
+        api.connections[0].frames.put_nowait('{}')
+        for _ in range(100):
+            if len(api.connections) > 1:
+                break
+            await asyncio.sleep(0.01)
+        assert len(failures) == 2 and shard.handler is api.connections[1]
+        await api.shard_pool.wait()
+        assert api.connections[1].sent[0]['params'] == ['btcusdt@trade']
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_error(self):
+        api = shard_api(shard_streams=1)
+        dispatched = []
+
+        async def dispatch_frame(message):
+            dispatched.append(message)
+            if len(dispatched) == 1:
+                raise ValueError(message)
+
+        api.dispatch_frame = dispatch_frame
+        await api.shard_pool.subscribe('trade', ['btcusdt'])
+        api.connections[0].frames.put_nowait('first')
+        api.connections[0].frames.put_nowait('second')
+        await asyncio.sleep(0.01)
+        assert dispatched == ['first', 'second']
+        await api.close()
+
+    def test_limit_symbols(self):
+        api = shard_api()
+        api.shard_pool = None
+        api.max_streams = 2
+        warnings = []
+        api._logger = SimpleNamespace(warning=warnings.append)
+        assert BinanceSubscriber._limit_symbols(api, ['btcusdt', 'ethusdt', 'bnbusdt', 'xrpusdt']) == [
+            'btcusdt', 'ethusdt'
+        ]
+        assert warnings == ["tbinance - more than 2 streams, not subscribed: bnbusdt, xrpusdt"]
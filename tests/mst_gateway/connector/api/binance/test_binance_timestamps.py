@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+import pytest
+from mst_gateway.connector.api import DATETIME_FORMAT
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.stocks.binance.utils import to_iso_datetime
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.utils import json_dumps, timestamp2iso
+
+
+def _trade(timestamp: int) -> str:
+    return json_dumps({'e': 'trade', 'E': timestamp, 's': 'BTCUSDT', 't': 1, 'p': '50200.0', 'q': '0.1',
+                       'T': timestamp, 'm': False})
+
+
+class TestTimestampFormat:
+
+    def test_timestamp2iso(self):
+        for timestamp in (0, 999, 1638958726119, 1638958726001, 1638958799999, 1638958800000, 4102444799999):
+            expected = datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).strftime(DATETIME_FORMAT)
+            assert timestamp2iso(timestamp) == expected
+        assert to_iso_datetime(1638958726119) == '2021-12-08T10:18:46.119000'
+
+    @pytest.mark.asyncio
+    async def test_epoch_ms(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange, options={'epoch_ms': True})
+        api._set_state_data({'btcusdt': {'symbol': 'btcusdt', 'system_symbol': 'btcusd'}})
+        api._subscriptions = {'trade': {'*': {'1'}}}
+        results = []
+        assert await api.process_messages([_trade(1638958726119)], results.append)
+        assert results[0][0]['trade']['d'][0]['tm'] == 1638958726119
+        api.epoch_ms = False
+        results = []
+        assert await api.process_messages([_trade(1638958726119)], results.append)
+        assert results[0][0]['trade']['d'][0]['tm'] == '2021-12-08T10:18:46.119000'
@@ -0,0 +1,86 @@
+import asyncio
+import json
+import pytest
+from copy import deepcopy
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.wss.workers import WssWorkerPool
+from mst_gateway.storage.var import StateStorageKey
+from .data import storage as state_data
+from .data import order_book as order_book_message
+from .data import trade as trade_message
+from ..utils import FakeConnection
+
+
+def worker_api(**options) -> BinanceWssApi:
+    api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange, state_storage=deepcopy(state_data.STORAGE_DATA),
+                        options=options)
+    api._set_state_data(api.storage.get(f"{StateStorageKey.symbol}.{api.name}.{api.schema}"))
+    api._subscriptions = {'trade': {'*': {'1'}}, 'order_book': {'*': {'1'}}}
+    return api
+
+
+class TestBinanceWorkers:
+
+    def test_stateless_tables(self):
+        api = worker_api()
+        assert api.router.is_stateless('trade')
+        assert not api.router.is_stateless('depthUpdate')
+        assert not api.router.is_stateless('kline')
+
+    @pytest.mark.asyncio
+    async def test_consume_workers(self):
+        frames = [
+            json.dumps(trade_message.DEFAULT_TRADE_MESSAGE[OrderSchema.exchange]),
+            json.dumps(order_book_message.DEFAULT_ORDER_BOOK_MESSAGE[OrderSchema.exchange]),
+        ] * 5
+        expected = await self._process(worker_api(), frames)
+        assert await self._consume(worker_api(), frames, len(expected)) == expected
+
+    @pytest.mark.asyncio
+    async def test_worker_options(self):
+        frames = [json.dumps(trade_message.DEFAULT_TRADE_MESSAGE[OrderSchema.exchange])] * 2
+        expected = await self._process(worker_api(epoch_ms=True), frames)
+        messages = await self._consume(worker_api(epoch_ms=True), frames, len(expected))
+        assert messages == expected
+        assert all(isinstance(message['trade']['d'][0]['tm'], int) for message in messages)
+
+    @pytest.mark.asyncio
+    async def test_state_refresh(self):
+        api = worker_api(sharding=True, local_order_book=True)
+        assert api.worker_options == {}
+        pool = WssWorkerPool(api, 2)
+        frames = [json.dumps(trade_message.DEFAULT_TRADE_MESSAGE[OrderSchema.exchange])]
+        try:
+            assert (await pool.submit(frames))[0][1]['trade']['d'][0]['ss'] == 'btcusdt'
+            executor = pool._executor
+            state_data = deepcopy(api.state_data)
+            state_data['btcusdt']['system_symbol'] = 'btcusd'
+            api._set_state_data(state_data)
+            results = await asyncio.gather(*(pool.submit(frames) for _ in range(4)))
+            assert pool._executor is executor
+            assert [items[0][1]['trade']['d'][0]['ss'] for items in results] == ['btcusd'] * 4
+        finally:
+            pool.shutdown()
+
+    @staticmethod
+    async def _process(api: BinanceWssApi, frames: list) -> list:
+        expected = []
+        for frame in frames:
+            await api.process_message(frame, expected.append)
+        return expected
+
+    @staticmethod
+    async def _consume(api: BinanceWssApi, frames: list, count: int) -> list:
+        api._handler = FakeConnection()
+        for frame in frames:
+            api.handler.frames.put_nowait(frame)
+        messages = []
+        task = asyncio.create_task(api.consume(messages.append, workers=2))
+        for _ in range(100):
+            if len(messages) >= count:
+                break
+            await asyncio.sleep(0.05)
+        task.cancel()
+        await api.close()
+        return messages
@@ -62,9 +62,9 @@ DEFAULT_ORDER_BOOK_DATA = {
                     "act": "update",
                     "d": [
                         {
-                            "id": 0,
+                            "id": 93318,
                             "s": "XBTUSD",
-                            "p": 0.0,
+                            "p": 46659.0,
                             "vl": 94300,
                             "sd": 0,
                             "ss": "btcusd"
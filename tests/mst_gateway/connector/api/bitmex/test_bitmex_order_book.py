@@ -0,0 +1,74 @@
+import json
+import pytest
+from copy import deepcopy
+from mst_gateway.connector.api.stocks.bitmex import BitmexWssApi
+from mst_gateway.connector.api.stocks.bitmex.wss.order_book import BitmexOrderBook
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.storage.var import StateStorageKey
+from ..utils import FakeConnection
+from .data import order_book as order_book_data
+from .data import storage as state_data
+
+BASE = 156 * 100000000
+
+
+def level(price: float, side: str, size: int = None, tick: float = 0.01) -> dict:
+    item = {'symbol': 'XBTUSD', 'id': BASE - round(price / tick), 'side': side, 'price': price}
+    if size is not None:
+        item['size'] = size
+    return item
+
+
+class TestBitmexOrderBook:
+
+    def test_prices_from_ids(self):
+        book = BitmexOrderBook('XBTUSD', tick=0.5)
+        assert book.apply('partial', level(49197.5, 'Sell', 100)) == 49197.5
+        assert (book.base, book.tick) == (BASE, 0.01)
+        update = {'symbol': 'XBTUSD', 'id': BASE - 4643500, 'side': 'Buy', 'size': 300}
+        assert book.apply('update', update) == 46435.0
+        assert book.price(BASE - 1) == 0.01
+
+    def test_sorted_levels(self):
+        book = BitmexOrderBook('XBTUSD')
+        for price, side in ((100.0, 'Buy'), (99.5, 'Buy'), (101.0, 'Sell'), (100.5, 'Sell'), (102.0, 'Sell')):
+            book.apply('partial', level(price, side, 10))
+        book.apply('insert', level(100.25, 'Buy', 5))
+        book.apply('delete', {'symbol': 'XBTUSD', 'id': level(100.5, 'Sell')['id'], 'side': 'Sell'})
+        book.apply('delete', {'symbol': 'XBTUSD', 'id': 1, 'side': 'Sell'})
+        assert book.levels('Buy') == [(100.25, 5), (100.0, 10), (99.5, 10)]
+        assert book.levels('Sell', depth=1) == [(101.0, 10)]
+        # best prices last, so levels at the touch are inserted and removed without moving the rest
+        assert book._keys['Buy'][-1] == -level(100.25, 'Buy')['id']
+        assert book._keys['Sell'][-1] == level(101.0, 'Sell')['id']
+        assert len(book) == 5
+        book.clear()
+        assert len(book) == 0
+
+    def test_unencoded_prices(self):
+        book = BitmexOrderBook('XBTUSD')
+        book.apply('partial', level(100.0, 'Buy', 10))
+        book.apply('insert', {'symbol': 'XBTUSD', 'id': 15595348050, 'side': 'Buy', 'size': 5, 'price': 46435})
+        assert sorted(book.levels('Buy')) == [(100.0, 10), (46435.0, 5)]
+        assert book.apply('delete', {'symbol': 'XBTUSD', 'id': 15595348050, 'side': 'Buy'}) == 46435.0
+        assert book.levels('Buy') == [(100.0, 10)]
+
+
+class TestBitmexFullOrderBook:
+
+    @pytest.mark.asyncio
+    async def test_subscribe_full_table(self):
+        api = BitmexWssApi(name='tbitmex', schema=OrderSchema.margin, options={'full_order_book': True},
+                           state_storage=deepcopy(state_data.STORAGE_DATA))
+        api._set_state_data(api.storage.get(f"{StateStorageKey.symbol}.{api.name}.{api.schema}"))
+        api._handler = FakeConnection()
+        assert await api.subscribe('1', 'order_book', 'XBTUSD')
+        assert api.handler.sent == [{'op': 'subscribe', 'args': 'orderBookL2:XBTUSD'}]
+        for case in order_book_data.DEFAULT_ORDER_BOOK_DATA[OrderSchema.margin]:
+            message = json.loads(case['message'])
+            message['table'] = 'orderBookL2'
+            results = []
+            await api.process_message(json.dumps(message), results.append)
+            assert results == [case['expect']]
+        assert await api.unsubscribe('1', 'order_book', 'XBTUSD')
+        assert api.handler.sent[-1] == {'op': 'unsubscribe', 'args': 'orderBookL2:XBTUSD'}
@@ -0,0 +1,47 @@
+from datetime import datetime
+import pytest
+from mst_gateway.connector.api.stocks.bitmex import BitmexWssApi
+from mst_gateway.connector.api.stocks.bitmex.utils import to_date, to_iso_datetime
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.utils import parse_iso_datetime, time2minute
+
+
+def _trade(timestamp: str, price: float) -> dict:
+    return {'timestamp': timestamp, 'symbol': 'XBTUSD', 'side': 'Buy', 'size': 100, 'price': price}
+
+
+class TestIsoDatetime:
+
+    def test_parse(self):
+        assert parse_iso_datetime('2021-12-16T08:24:16.415Z') == datetime(2021, 12, 16, 8, 24, 16, 415000)
+        assert parse_iso_datetime('2021-12-16T08:24:16.41') == datetime(2021, 12, 16, 8, 24, 16, 410000)
+        with pytest.raises(ValueError):
+            parse_iso_datetime('2021-12-16 08:24:16.415')
+        assert to_date('2021-12-16T08:24:16') is None
+        assert to_iso_datetime('2021-12-16T08:24:16.415Z') == '2021-12-16T08:24:16.415000'
+        assert time2minute(datetime(1970, 1, 2, 0, 1, 59)) == 1441
+
+
+class TestBitmexQuoteBin:
+
+    @pytest.mark.asyncio
+    async def test_hour_rollover(self):
+        api = BitmexWssApi(name='tbitmex', schema=OrderSchema.margin, register_state=False)
+        api._subscriptions = {'quote_bin': {'*': {'1'}}}
+        bins = []
+        for message in (
+            {'table': 'tradeBin1m', 'action': 'partial', 'data': [
+                {'timestamp': '2021-12-16T08:59:00.000Z', 'symbol': 'XBTUSD', 'open': 10.0, 'close': 10.0,
+                 'high': 10.0, 'low': 10.0, 'volume': 100}]},
+            {'table': 'trade', 'action': 'insert', 'data': [_trade('2021-12-16T08:59:30.000Z', 11.0)]},
+            {'table': 'trade', 'action': 'insert', 'data': [_trade('2021-12-16T09:00:01.000Z', 12.0)]},
+            {'table': 'trade', 'action': 'insert', 'data': [_trade('2021-12-16T08:59:59.000Z', 9.0)]},
+        ):
+            if data := (await api.get_data(message)).get('quote_bin'):
+                bins.extend(data['d'])
+        assert [(item['tm'], item['opp'], item['clp']) for item in bins] == [
+            ('2021-12-16T08:58:59.999999', 10.0, 10.0),
+            ('2021-12-16T08:59:00.000000', 10.0, 10.0),
+            ('2021-12-16T08:59:30.000000', 11.0, 11.0),
+            ('2021-12-16T09:00:01.000000', 11.0, 12.0),
+        ]
@@ -0,0 +1,55 @@
+import os
+import pytest
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.utils import json_dumps
+from mst_gateway.connector.api.wss.capture import (
+    FRAME_KIND_OFFSET, FrameCapture, FrameReplay, capture_segments, read_frames
+)
+
+
+def _trade(i: int) -> str:
+    return json_dumps({'e': 'trade', 'E': 1638958726119 + i, 's': 'BTCUSDT', 'p': str(50200.0 + i), 'q': '0.1',
+                       'm': True})
+
+
+class TestFrameCapture:
+
+    def test_segments(self, tmp_path):
+        capture = FrameCapture(str(tmp_path), segment_size=256)
+        frames = [_trade(i) for i in range(5)] + [b'\x00\x01', '']
+        for i, frame in enumerate(frames):
+            capture.append(frame, received=100.0 + i)
+        capture.close()
+        assert capture.stats()['frames'] == 7 and len(capture_segments(str(tmp_path))) == 3
+        assert sum(os.path.getsize(segment) for segment in capture_segments(str(tmp_path))) == capture.bytes
+        capture = FrameCapture(str(tmp_path), segment_size=256)
+        capture.extend(['{"e": "last"}'])
+        # frames of the open segment are readable before close, e.g. after a crash
+        assert [frame for _, frame in read_frames(str(tmp_path))][-2:] == ['', '{"e": "last"}']
+        capture.close()
+        assert [frame for _, frame in read_frames(str(tmp_path))] == frames + ['{"e": "last"}']
+
+    def test_torn_frame(self, tmp_path):
+        capture = FrameCapture(str(tmp_path))
+        capture.append(_trade(0))
+        offset = capture._offset
+        capture.append(_trade(1))
+        # a crash before the kind of the last frame is written leaves it unreadable
+        capture._mmap[offset + FRAME_KIND_OFFSET] = 0
+        assert [frame for _, frame in read_frames(str(tmp_path))] == [_trade(0)]
+        capture.close()
+
+    @pytest.mark.asyncio
+    async def test_replay(self, tmp_path):
+        capture = FrameCapture(str(tmp_path))
+        for i in range(3):
+            capture.append(_trade(i), received=1000.0 + i * 0.01)
+        capture.close()
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange)
+        api._set_state_data({'btcusdt': {'symbol': 'btcusdt', 'system_symbol': 'btcusd'}})
+        api._subscriptions = {'trade': {'*': {'1'}}}
+        results = []
+        assert await FrameReplay(api, str(tmp_path), speed=10).run(results.append) == 3
+        assert await FrameReplay(api, str(tmp_path), speed=None).run(results.append) == 3
+        assert [data['trade']['d'][0]['p'] for data in results] == [50200.0, 50201.0, 50202.0] * 2
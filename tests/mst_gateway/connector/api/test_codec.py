@@ -0,0 +1,53 @@
+import json
+import pytest
+from mst_gateway.connector.api.utils import parse_message, dump_message
+from mst_gateway.connector.api.utils.codec import JSON_CODECS, JsonCodec, load_json_codec
+from tests.benchmark.fixtures import binance_frames, bitmex_frames
+
+
+def codec_names():
+    names = []
+    for name, codec_class in JSON_CODECS.items():
+        try:
+            codec_class()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+class TestJsonCodec:
+
+    @pytest.mark.parametrize('name', codec_names())
+    def test_codec_compatibility(self, name):
+        codec = load_json_codec(name)
+        assert codec.name == name
+        frames = [*sum(binance_frames().values(), []), *sum(bitmex_frames().values(), [])]
+        for frame in frames:
+            data = codec.loads(frame)
+            assert data == json.loads(frame)
+            assert json.loads(codec.dumps(data)) == data
+            assert codec.loads(frame.encode()) == data
+        with pytest.raises(codec.decode_errors):
+            codec.loads('{result: None, id: 1}')
+        with pytest.raises(TypeError):
+            codec.loads({'result': None, 'id': 1})
+
+    def test_load_json_codec_fallback(self):
+        assert isinstance(load_json_codec('not_exists'), JsonCodec)
+        assert load_json_codec('json').name == JsonCodec.name
+
+    def test_parse_message(self):
+        assert parse_message(json.dumps({'result': None, 'id': 1})) == {'result': None, 'id': 1}
+        assert parse_message('{result: None, id: 1}') == {'raw': '{result: None, id: 1}'}
+        assert parse_message({'result': None, 'id': 1}) is None
+
+    def test_dump_message(self):
+        assert json.loads(dump_message({'result': None, 'id': 1})) == {'result': None, 'id': 1}
+        assert isinstance(dump_message({'id': object()}), str)
+
+    def test_exports(self):
+        exported = {}
+        exec('from mst_gateway.connector.api.utils.codec import *', exported)
+        assert {'load_json_codec', 'json_loads', 'json_dumps', 'MsgpackCodec'} <= set(exported)
+        assert not {'json', 'getenv', 'import_module'} & set(exported)
@@ -0,0 +1,97 @@
+import pytest
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.utils import json_dumps
+from mst_gateway.connector.api.wss.columnar import ColumnarBatcher
+from .utils import wss_result
+
+
+class TestColumnarBatcher:
+
+    def test_merge_runs(self):
+        batcher = ColumnarBatcher()
+        batch = batcher.convert([
+            wss_result('trade', [{'s': 'btcusdt', 'p': 1.0, 'vl': 2.0}], 'insert'),
+            wss_result('trade', [{'s': 'ethusdt', 'p': 3.0, 'vl': 4.0, 'ss': 'ethusd'}], 'insert'),
+            wss_result('symbol', [{'s': 'btcusdt', 'p': 1.5}]),
+            wss_result('trade', [{'s': 'btcusdt', 'p': 5.0, 'vl': 6.0}], 'insert'),
+            wss_result('order_book', [{'s': 'btcusdt', 'p': 1.0}], 'partial'),
+            wss_result('order_book', [{'s': 'btcusdt', 'p': 2.0}], 'update'),
+        ])
+        assert [next(iter(data)) for data in batch] == ['trade', 'symbol', 'trade', 'order_book', 'order_book']
+        assert batch[0]['trade'] == {
+            'acc': 'tbinance', 'tb': 'trade', 'sch': 'exchange', 'act': 'insert', 'n': 2,
+            'd': {'s': ['btcusdt', 'ethusdt'], 'p': [1.0, 3.0], 'vl': [2.0, 4.0], 'ss': [None, 'ethusd']},
+        }
+        assert batch[1]['symbol']['d'] == {'s': ['btcusdt'], 'p': [1.5]}
+        assert batch[2]['trade']['d'] == {'s': ['btcusdt'], 'p': [5.0], 'vl': [6.0]}
+        assert [data['order_book']['act'] for data in batch[3:]] == ['partial', 'update']
+        assert batcher.stats() == {'records': 6, 'payloads': 5}
+
+    def test_merge_multi_subscription_results(self):
+        batch = ColumnarBatcher().convert([
+            {**wss_result('symbol', [{'s': 'btcusdt'}]), **wss_result('position', [{'s': 'btcusdt'}])},
+            {**wss_result('symbol', [{'s': 'ethusdt'}]), **wss_result('position', [{'s': 'ethusdt'}])},
+        ])
+        assert len(batch) == 1
+        assert batch[0]['symbol']['n'] == 2 and batch[0]['position']['d'] == {'s': ['btcusdt', 'ethusdt']}
+
+    def test_numpy_arrays(self):
+        np = pytest.importorskip('numpy')
+        batch = ColumnarBatcher(arrays=True).convert([
+            wss_result('trade', [{'s': 'btcusdt', 'p': 1.0, 'sd': 0}, {'s': 'btcusdt', 'p': 2.0, 'sd': None}]),
+        ])
+        columns = batch[0]['trade']['d']
+        assert isinstance(columns['p'], np.ndarray) and columns['p'].tolist() == [1.0, 2.0]
+        assert columns['s'] == ['btcusdt', 'btcusdt'] and columns['sd'] == [0, None]
+
+    def test_merge_column_blocks(self):
+        batch = ColumnarBatcher().convert([
+            wss_result('trade', {'s': ['btcusdt'], 'p': [1.0]}, 'insert'),
+            wss_result('trade', {'s': ['ethusdt', 'btcusdt'], 'p': [2.0, 3.0]}, 'insert'),
+            wss_result('trade', {'s': ['btcusdt'], 'p': [4.0], 'ss': ['btcusd']}, 'insert'),
+        ])
+        assert [data['trade']['n'] for data in batch] == [3, 1]
+        assert batch[0]['trade']['d'] == {'s': ['btcusdt', 'ethusdt', 'btcusdt'], 'p': [1.0, 2.0, 3.0]}
+
+
+class TestColumnarOutput:
+
+    @pytest.mark.asyncio
+    async def test_trades(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange)
+        api._set_state_data({'btcusdt': {'symbol': 'btcusdt', 'system_symbol': 'btcusd'}})
+        api._subscriptions = {'trade': {'*': {'1'}}}
+        api._start_columnar(True)
+        frames = [
+            json_dumps({'e': 'trade', 'E': 1638958726119 + i, 's': 'BTCUSDT', 'p': str(50200.0 + i), 'q': '0.1',
+                        'm': bool(i % 2)})
+            for i in range(3)
+        ]
+        results = []
+        assert await api.process_messages(frames, results.append)
+        trade = results[0][0]['trade']
+        assert trade['n'] == 3 and list(trade['d']) == ['tm', 'p', 'vl', 'sd', 's', 'ss']
+        assert trade['d']['p'] == [50200.0, 50201.0, 50202.0]
+        assert api.columnar_stats == {'records': 3, 'payloads': 1}
+
+    @pytest.mark.asyncio
+    async def test_order_book_loader(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange, register_state=False)
+        api._subscriptions = {'order_book': {'*': {'1'}}}
+        api._start_columnar(True)
+        message = api._parse_table_message(json_dumps({
+            'e': 'depthUpdate', 'E': 1594200464954, 's': 'BTCUSDT', 'U': 1, 'u': 2,
+            'b': [['9270.04', '0.5']], 'a': [['9270.01', '1.2'], ['9270.02', '0']],
+        }))
+        results = await api._get_table_message_data(message)
+        columns = [data['order_book']['d'] for data in results]
+        assert all(isinstance(d, dict) for d in columns)
+        assert sorted(p for d in columns for p in d['p']) == [9270.01, 9270.02, 9270.04]
+        api._start_order_book_deltas(None, True, None)
+        assert not api.columnar_loader('order_book') and api.columnar_loader('trade')
+
+    @pytest.mark.asyncio
+    async def test_require_batch_size(self):
+        with pytest.raises(ValueError):
+            await BinanceWssApi(name='tbinance', schema=OrderSchema.exchange).consume(print, columnar=True)
@@ -0,0 +1,22 @@
+from mst_gateway.connector.api.wss.conflation import SymbolConflator
+from .utils import wss_data
+
+
+class TestSymbolConflator:
+
+    def test_latest_item_per_symbol(self):
+        conflator = SymbolConflator('symbol', 0.5)
+        conflator.add(wss_data('symbol', [{'s': 'btcusdt', 'p': 1}, {'s': 'ethusdt', 'p': 1}]))
+        conflator.add(wss_data('symbol', [{'s': 'btcusdt', 'p': 2}]))
+        assert conflator.flush() == {
+            'symbol': wss_data('symbol', [{'s': 'btcusdt', 'p': 2}, {'s': 'ethusdt', 'p': 1}])
+        }
+        assert conflator.stats() == {'interval': 0.5, 'pending': 0, 'received': 3, 'emitted': 2}
+
+    def test_flush_only_changed(self):
+        conflator = SymbolConflator('symbol', 0.5)
+        assert conflator.flush() is None
+        conflator.add(wss_data('symbol', [{'s': 'btcusdt', 'p': 1}]))
+        conflator.flush()
+        conflator.add(wss_data('symbol', [{'s': 'ethusdt', 'p': 3}]))
+        assert conflator.flush()['symbol']['d'] == [{'s': 'ethusdt', 'p': 3}]
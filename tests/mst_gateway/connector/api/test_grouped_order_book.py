@@ -0,0 +1,66 @@
+from mst_gateway.connector.api.types import BUY, SELL
+from mst_gateway.connector.api.utils import GroupedOrderBook
+
+
+class TestGroupedOrderBook:
+
+    def test_incremental_buckets(self):
+        book = GroupedOrderBook(0.5, (1, 10))
+        book.load([
+            {'price': 100.5, 'volume': 1.0, 'side': SELL},
+            {'price': 101.0, 'volume': 2.0, 'side': SELL},
+            {'price': 100.0, 'volume': 3.0, 'side': BUY},
+            {'price': 99.5, 'volume': 4.0, 'side': BUY},
+            {'price': 94.5, 'volume': 5.0, 'side': BUY},
+        ])
+        assert book.get(10) == [
+            {'price': 105.0, 'volume': 3.0, 'side': SELL},
+            {'price': 100.0, 'volume': 3.0, 'side': BUY},
+            {'price': 95.0, 'volume': 4.0, 'side': BUY},
+            {'price': 90.0, 'volume': 5.0, 'side': BUY},
+        ]
+        book.changes(10)
+        book.apply([{'p': 99.5, 'vl': 1.5, 'sd': BUY}, {'p': 101.0, 'vl': 0.0, 'sd': SELL}])
+        assert book.changes(10) == [
+            {'price': 105.0, 'volume': 1.0, 'side': SELL},
+            {'price': 95.0, 'volume': 1.5, 'side': BUY},
+        ]
+        assert book.changes(10) == []
+        assert book.get(1, side=BUY, depth=2) == [
+            {'price': 100.0, 'volume': 3.0, 'side': BUY},
+            {'price': 99.5, 'volume': 1.5, 'side': BUY},
+        ]
+
+    def test_delete_empties_bucket(self):
+        book = GroupedOrderBook(0.1, (10,))
+        book.apply([{'p': 10.3, 'vl': 0.3, 'sd': SELL}])
+        book.changes(10)
+        book.apply([{'p': 10.3, 'vl': None, 'sd': SELL}], action='delete')
+        assert book.changes(10) == [{'price': 11.0, 'volume': 0.0, 'side': SELL}]
+        assert book.get(10) == []
+
+    def test_load_reports_removed_buckets(self):
+        book = GroupedOrderBook(0.5, (10,))
+        book.load([{'price': 100.5, 'volume': 1.0, 'side': SELL}, {'price': 94.5, 'volume': 5.0, 'side': BUY}])
+        book.changes(10)
+        book.load([{'price': 100.5, 'volume': 2.0, 'side': SELL}])
+        assert book.changes(10) == [
+            {'price': 105.0, 'volume': 2.0, 'side': SELL},
+            {'price': 90.0, 'volume': 0.0, 'side': BUY},
+        ]
+
+    def test_consumer_cursors(self):
+        book = GroupedOrderBook(0.5, (10,))
+        assert book.changes(10, 'a') == book.changes(10, 'b') == []
+        book.apply([{'p': 100.5, 'vl': 1.0, 'sd': SELL}])
+        assert book.changes(10, 'a') == book.changes(10, 'b') == [{'price': 105.0, 'volume': 1.0, 'side': SELL}]
+        book.apply([{'p': 99.5, 'vl': 1.0, 'sd': BUY}])
+        assert book.changes(10, 'a') == [{'price': 95.0, 'volume': 1.0, 'side': BUY}]
+        book.apply([{'p': 100.5, 'vl': 0.0, 'sd': SELL}])
+        assert book.changes(10, 'a') == [{'price': 105.0, 'volume': 0.0, 'side': SELL}]
+        assert book.changes(10, 'b') == [
+            {'price': 105.0, 'volume': 0.0, 'side': SELL},
+            {'price': 95.0, 'volume': 1.0, 'side': BUY},
+        ]
+        assert book.changes(10, 'a') == book.changes(10, 'b') == []
+        assert book._changed[10] == {BUY: {}, SELL: {}}
@@ -0,0 +1,74 @@
+import asyncio
+import pytest
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.wss.ingest import IngestQueue, OverflowPolicy
+
+
+def _message(table, data, action='update'):
+    return {'table': table, 'action': action, 'data': data}
+
+
+class TestIngestQueue:
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self):
+        queue = IngestQueue(2)
+        for i in range(3):
+            await queue.put(_message('trade', [i]), OverflowPolicy.drop_oldest)
+        assert queue.stats()['dropped'] == 1
+        assert queue.stats()['table_dropped'] == {'trade': 1}
+        assert [queue.get_nowait()['data'] for _ in range(2)] == [[1], [2]]
+        assert queue.get_nowait() is None
+
+    @pytest.mark.asyncio
+    async def test_conflate(self):
+        queue = IngestQueue(2, symbol_key='s')
+        for i in range(3):
+            await queue.put(_message('symbol', [{'s': 'BTCUSDT', 'p': i}, {'s': 'ETHUSDT', 'p': i}]),
+                            OverflowPolicy.conflate)
+        assert queue.depth == 1
+        assert queue.stats()['conflated'] == 4
+        message = await queue.get()
+        assert message['data'] == [{'s': 'BTCUSDT', 'p': 2}, {'s': 'ETHUSDT', 'p': 2}]
+
+    @pytest.mark.asyncio
+    async def test_conflate_order(self):
+        queue = IngestQueue(10, symbol_key='s')
+        for table, action, price in (('order_book', 'update', 1), ('order_book', 'partial', 2),
+                                     ('trade', 'insert', 3), ('order_book', 'update', 4),
+                                     ('order_book', 'update', 5)):
+            await queue.put(_message(table, [{'s': 'BTCUSDT', 'p': price}], action), OverflowPolicy.conflate)
+        assert [(message['action'], message['data']) for message in (queue.get_nowait() for _ in range(4))] == [
+            ('update', [{'s': 'BTCUSDT', 'p': 1}]),
+            ('partial', [{'s': 'BTCUSDT', 'p': 2}]),
+            ('insert', [{'s': 'BTCUSDT', 'p': 3}]),
+            ('update', [{'s': 'BTCUSDT', 'p': 5}]),
+        ]
+        await queue.put(_message('order_book', [{'s': 'BTCUSDT', 'p': 6}]), OverflowPolicy.conflate)
+        assert queue.depth == 1 and queue.stats()['conflated'] == 1
+
+    def test_policy_after_unsubscribe(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange)
+        overflow = {'trade': OverflowPolicy.conflate, '*': OverflowPolicy.block}
+        api.register('1', 'trade')
+        assert api._overflow_policy('trade', overflow) == OverflowPolicy.conflate
+        api.unregister('1', 'trade')
+        assert api._overflow_policy('trade', overflow) == OverflowPolicy.block
+
+    @pytest.mark.asyncio
+    async def test_block(self):
+        queue = IngestQueue(1)
+        await queue.put(_message('trade', [1]))
+        task = asyncio.ensure_future(queue.put(_message('trade', [2])))
+        await asyncio.sleep(0)
+        assert not task.done()
+        assert (await queue.get())['data'] == [1]
+        await asyncio.sleep(0)
+        assert task.done()
+        assert (await queue.get())['data'] == [2]
+
+    def test_strictest_policy(self):
+        assert OverflowPolicy.strictest({OverflowPolicy.conflate, OverflowPolicy.drop_oldest}) \
+            == OverflowPolicy.drop_oldest
+        assert OverflowPolicy.strictest(set()) == OverflowPolicy.block
@@ -0,0 +1,49 @@
+import time
+import pytest
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.stocks.bitmex import BitmexWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.utils import json_dumps
+from mst_gateway.connector.api.wss.latency import LatencyHistogram
+
+
+class TestLatencyHistogram:
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        assert histogram.snapshot()['p50_us'] is None
+        for us in [3] * 98 + [100, 5000]:
+            histogram.add(us / 1e6)
+        snapshot = histogram.snapshot()
+        assert snapshot['count'] == 100 and snapshot['p50_us'] == 4.0 and snapshot['p99_us'] == 128.0
+        assert snapshot['max_us'] == pytest.approx(5000)
+        histogram.add(-0.5)
+        assert histogram.snapshot()['min_us'] == -500000.0
+
+
+class TestPipelineLatency:
+
+    @pytest.mark.asyncio
+    async def test_binance_stages(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange)
+        api._set_state_data({'btcusdt': {'symbol': 'btcusdt', 'system_symbol': 'btcusd'}})
+        api._subscriptions = {'trade': {'*': {'1'}}}
+        assert api.latency_snapshot() is None
+        api._start_latency(True)
+        event_time = int(time.time() * 1000) - 250
+        frame = json_dumps({'e': 'trade', 'E': event_time, 's': 'BTCUSDT', 'p': '50200.0', 'q': '0.1', 'm': True})
+        assert await api.process_message(frame, lambda data: None)
+        stages = api.latency_snapshot(reset=True)['trade']
+        assert set(stages) == {'parse', 'lag', 'split', 'route', 'serialize.trade', 'callback'}
+        assert all(stage['count'] == 1 for stage in stages.values())
+        assert 250000 <= stages['lag']['min_us'] < 10000000
+        assert api.latency_snapshot() == {}
+
+    def test_bitmex_event_time(self):
+        api = BitmexWssApi(name='tbitmex', schema=OrderSchema.margin)
+        message = {'table': 'trade', 'action': 'insert', 'data': [{'timestamp': '2021-12-16T08:24:16.415Z'}]}
+        assert api._event_time(message) == pytest.approx(1639643056.415)
+        assert api._event_time({'table': 'trade', 'action': 'insert', 'data': [{}]}) is None
+        assert api._event_time(dict(message, action='partial')) is None
+        assert api._event_time(dict(message, table='orderBookL2', action='update')) is None
+        assert api._event_time(dict(message, table='instrument', action='insert')) is None
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import logging
+import pytest
+from types import SimpleNamespace
+from mst_gateway.connector.api.wss.listener import StateListener
+from mst_gateway.storage import AsyncStateStorage, StateStorage
+
+
+class FakePubSub:
+
+    def __init__(self):
+        self.channels = set()
+        self.messages = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def publish(self, channel, data):
+        if channel in self.channels:
+            self.messages.put_nowait({'type': 'message', 'channel': channel.encode(), 'data': json.dumps(data)})
+
+
+def fake_storage():
+    pubsub = FakePubSub()
+
+    async def get_client(write=False):
+        return SimpleNamespace(pubsub=lambda: pubsub)
+
+    return AsyncStateStorage(SimpleNamespace(client=SimpleNamespace(get_client=get_client))), pubsub
+
+
+async def _first(iterator):
+    return await iterator.__anext__()
+
+
+class TestStateListener:
+
+    def test_dict_storage(self):
+        assert StateListener.shared(StateStorage()) is None
+
+    @pytest.mark.asyncio
+    async def test_shared_listen(self):
+        storage, pubsub = fake_storage()
+        listener = StateListener.shared(storage)
+        assert StateListener.shared(storage) is listener
+        first = listener.listen('symbol.tbinance.exchange')
+        second = listener.listen('symbol.tbinance.exchange')
+        tasks = [asyncio.create_task(_first(first)), asyncio.create_task(_first(second))]
+        await asyncio.sleep(0.01)
+        assert pubsub.channels == {'symbol.tbinance.exchange'}
+        assert listener.channels == {'symbol.tbinance.exchange': 2}
+        pubsub.publish('symbol.tbinance.exchange', {'btcusdt': {'symbol': 'BTCUSDT'}})
+        assert await asyncio.wait_for(asyncio.gather(*tasks), 1) == [{'btcusdt': {'symbol': 'BTCUSDT'}}] * 2
+        await first.aclose()
+        await second.aclose()
+        assert listener.channels == {}
+        listener._task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_log_failures_once(self, caplog):
+        storage, pubsub = fake_storage()
+        failures = []
+
+        async def get_client(write=False):
+            if len(failures) < 3:
+                failures.append(write)
+                raise ConnectionError("connection refused")
+            return SimpleNamespace(pubsub=lambda: pubsub)
+
+        storage.storage.client.get_client = get_client
+        caplog.set_level(logging.WARNING, logger='mst_gateway.connector.api.wss.listener')
+        listener = StateListener(storage)
+        listener.read_timeout = 0.001
+        iterator = listener.listen('symbol.tbinance.exchange')
+        task = asyncio.create_task(_first(iterator))
+        for _ in range(100):
+            if pubsub.channels:
+                break
+            await asyncio.sleep(0.01)
+        pubsub.publish('symbol.tbinance.exchange', {'btcusdt': {}})
+        assert await asyncio.wait_for(task, 1) == {'btcusdt': {}}
+        assert len(failures) == 3
+        assert [record.getMessage() for record in caplog.records] == [
+            "StateListener - ConnectionError: connection refused"
+        ]
+        await iterator.aclose()
+        listener._task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener._task
+
+    def test_async_pool_kwargs(self):
+        class SSLConnection:
+            pass
+
+        aioredis = SimpleNamespace(connection=SimpleNamespace(SSLConnection=SSLConnection))
+        pool = SimpleNamespace(connection_class=type('SSLConnection', (), {}),
+                               connection_kwargs={'host': 'redis', 'ssl_ca_certs': 'ca.pem'})
+        assert StateListener._async_pool_kwargs(aioredis, pool) == {
+            'host': 'redis', 'ssl_ca_certs': 'ca.pem', 'connection_class': SSLConnection
+        }
+        pool.connection_class = type('CustomConnection', (), {})
+        with pytest.raises(TypeError):
+            StateListener._async_pool_kwargs(aioredis, pool)
@@ -0,0 +1,78 @@
+import pytest
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.types import OrderSchema, BUY, SELL
+from mst_gateway.connector.api.utils import json_dumps
+from mst_gateway.connector.api.wss.deltas import OrderBookDeltas
+from .utils import wss_data
+
+
+def _level(price, volume, side, symbol='XBTUSD'):
+    return {'id': int(price), 's': symbol, 'p': price, 'vl': volume, 'sd': side, 'ss': 'btcusd'}
+
+
+class TestOrderBookDeltas:
+
+    def test_one_delta_per_symbol(self):
+        deltas = OrderBookDeltas()
+        assert deltas.flush() is None
+        deltas.add(wss_data('order_book', [_level(100.0, 5, BUY), _level(101.0, 5, SELL), _level(102.0, 1, SELL)], 'partial'))
+        deltas.add(wss_data('order_book', [_level(100.0, 7, BUY), _level(100.5, 1, BUY, 'ETHUSD')], 'update'))
+        deltas.add(wss_data('order_book', [_level(101.0, None, SELL)], 'delete'))
+        delta = deltas.flush()['order_book']
+        assert delta['act'] == 'delta'
+        assert delta['d'] == [
+            {
+                's': 'XBTUSD', 'ss': 'btcusd', 'seq': 1, 'bb': 100.0, 'ba': 102.0, 'rs': True,
+                'u': [[100, 100.0, 7, BUY], [102, 102.0, 1, SELL]],
+                'r': [[101, 101.0, SELL]],
+            },
+            {
+                's': 'ETHUSD', 'ss': 'btcusd', 'seq': 1, 'bb': 100.5, 'ba': None,
+                'u': [[100, 100.5, 1, BUY]],
+                'r': [],
+            },
+        ]
+        deltas.add(wss_data('order_book', [_level(102.0, 0.0, SELL)], 'delete'))
+        assert deltas.flush()['order_book']['d'] == [
+            {'s': 'XBTUSD', 'ss': 'btcusd', 'seq': 2, 'bb': 100.0, 'ba': None, 'u': [], 'r': [[102, 102.0, SELL]]}
+        ]
+        assert deltas.stats() == {'symbols': 2, 'pending': 0, 'received': 7, 'emitted': 3}
+
+    def test_snapshot(self):
+        deltas = OrderBookDeltas(30)
+        assert deltas.snapshot() is None
+        deltas.add(wss_data('order_book', [_level(99.0, 1, BUY), _level(100.0, 2, BUY), _level(102.0, 3, SELL), _level(101.0, 4, SELL)]))
+        deltas.flush()
+        assert deltas.snapshot()['order_book']['d'] == [
+            {
+                's': 'XBTUSD', 'ss': 'btcusd', 'seq': 1, 'bb': 100.0, 'ba': 101.0,
+                'b': [[100, 100.0, 2], [99, 99.0, 1]],
+                'a': [[101, 101.0, 4], [102, 102.0, 3]],
+            }
+        ]
+
+
+class TestOrderBookDeltaOutput:
+
+    @pytest.mark.asyncio
+    async def test_batch_delta(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange, register_state=False)
+        api._subscriptions = {'order_book': {'*': {'1'}}}
+        api._start_order_book_deltas(None, True, None)
+        frames = [
+            json_dumps({'e': 'depthUpdate', 's': 'BTCUSDT', 'U': 1, 'u': 2,
+                        'b': [['100.0', '1.0'], ['99.0', '0']], 'a': [['101.0', '2.0']]}),
+            json_dumps({'e': 'depthUpdate', 's': 'BTCUSDT', 'U': 3, 'u': 3, 'b': [['100.0', '3.0']], 'a': []}),
+        ]
+        results = []
+        assert await api.process_messages(frames, results.append)
+        assert len(results) == 1 and len(results[0]) == 1
+        delta = results[0][0]['order_book']
+        assert delta['d'] == [
+            {
+                's': 'btcusdt', 'ss': None, 'seq': 1, 'bb': 100.0, 'ba': 101.0,
+                'u': [[None, 100.0, 3.0, BUY], [None, 101.0, 2.0, SELL]],
+                'r': [[None, 99.0, BUY]],
+            }
+        ]
+        assert api.order_book_delta_stats['emitted'] == 1
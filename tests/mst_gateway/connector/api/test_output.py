@@ -0,0 +1,71 @@
+import json
+import pytest
+from datetime import datetime
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.utils import json_dumps
+from mst_gateway.connector.api.utils.codec import MsgpackCodec
+from mst_gateway.connector.api.wss.output import MsgpackOutput
+
+pytest.importorskip('msgpack')
+
+
+def _trade(i: int) -> dict:
+    return {'tm': 1638958726119 + i, 'p': 50200.0 + i, 'vl': 0.1, 'sd': i % 2, 's': 'btcusdt', 'ss': 'btcusd'}
+
+
+class TestMsgpackOutput:
+
+    def test_field_table(self):
+        output = MsgpackOutput()
+        data = {'trade': {'acc': 'tbinance', 'tb': 'trade', 'sch': 'exchange', 'act': 'insert',
+                          'd': [_trade(0), {'tm': 1638958726120, 'p': 1.0, 's': 'ethusdt'}]}}
+        assert output.decode(output.encode(data)) == {'trade': {
+            'acc': 'tbinance', 'tb': 'trade', 'sch': 'exchange', 'act': 'insert',
+            'f': ['tm', 'p', 'vl', 'sd', 's', 'ss'],
+            'd': [[1638958726119, 50200.0, 0.1, 0, 'btcusdt', 'btcusd'],
+                  [1638958726120, 1.0, None, None, 'ethusdt', None]],
+        }}
+
+    def test_fields_sent_once(self):
+        output = MsgpackOutput()
+        data = {'trade': {'acc': 'tbinance', 'tb': 'trade', 'sch': 'exchange', 'act': 'insert', 'd': [_trade(0)]}}
+        first, second = output.encode(data), output.encode(data)
+        assert 'f' in MsgpackCodec().loads(first)['trade'] and 'f' not in MsgpackCodec().loads(second)['trade']
+        assert len(second) < len(first)
+        decoder = MsgpackOutput()
+        assert decoder.decode(first) == decoder.decode(second)
+        data['trade']['d'] = [{**_trade(1), 'x': 1}]
+        assert MsgpackCodec().loads(output.encode(data))['trade']['f'] == ['tm', 'p', 'vl', 'sd', 's', 'ss', 'x']
+
+    def test_codec_types(self):
+        codec = MsgpackCodec()
+        assert codec.loads(codec.dumps({'tm': datetime(2021, 12, 8, 10, 18, 46, 119000)})) == {
+            'tm': '2021-12-08T10:18:46.119000'}
+        with pytest.raises(TypeError):
+            codec.dumps({'v': object()})
+
+    def test_size(self):
+        data = [{'trade': {'acc': 'tbinance', 'tb': 'trade', 'sch': 'exchange', 'act': 'insert',
+                           'd': [_trade(i) for i in range(100)]}}]
+        assert len(json.dumps(data)) > 2 * len(MsgpackOutput().encode(data))
+
+    @pytest.mark.asyncio
+    async def test_consume_output(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange)
+        api._set_state_data({'btcusdt': {'symbol': 'btcusdt', 'system_symbol': 'btcusd'}})
+        api._subscriptions = {'trade': {'*': {'1'}}}
+        results = []
+        on_message = api._start_output(results.append, 'msgpack')
+        frame = json_dumps({'e': 'trade', 'E': 1638958726119, 's': 'BTCUSDT', 'p': '50200.0', 'q': '0.1', 'm': True})
+        assert await api.process_messages([frame], on_message)
+        assert isinstance(results[0], bytes)
+        assert await api.process_messages([frame], on_message)
+        decoder = MsgpackOutput()
+        trade = decoder.decode(results[0])[0]['trade']
+        assert trade['f'] == ['tm', 'p', 'vl', 'sd', 's', 'ss']
+        assert trade['d'] == [['2021-12-08T10:18:46.119000', 50200.0, 0.1, 0, 'BTCUSDT', 'btcusd']]
+        assert decoder.decode(results[1])[0]['trade'] == trade
+        assert api.output_stats == {'payloads': 2, 'bytes': len(results[0]) + len(results[1])}
+        with pytest.raises(ValueError):
+            api._start_output(results.append, 'protobuf')
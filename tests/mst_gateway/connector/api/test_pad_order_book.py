@@ -0,0 +1,43 @@
+import pytest
+from mst_gateway.connector.api.types import BUY, SELL
+from mst_gateway.connector.api.utils import generate_order_book_id, pad_order_book, pad_order_book_levels
+
+np = pytest.importorskip('numpy')
+
+
+def _item(price, volume, side):
+    return {'id': int(price / 0.5), 'symbol': 'XBTUSD', 'price': price, 'volume': volume, 'side': side}
+
+
+class TestPadOrderBook:
+
+    def test_pad_thinner_bids(self):
+        data = [_item(103.0, 1, SELL), _item(101.5, 2, SELL), _item(100.5, 3, SELL),
+                _item(100.0, 4, BUY), _item(99.0, 5, BUY)]
+        padded = pad_order_book(data, 0.5, lambda price: generate_order_book_id(price, {'tick': 0.5}))
+        assert padded[:3] == data[:3]
+        assert [(item['price'], item['volume']) for item in padded[3:]] == [
+            (100.0, 4), (99.5, 0.0), (99.0, 5), (98.5, 0.0), (98.0, 0.0), (97.5, 0.0)
+        ]
+        assert padded[4] == {'id': 199, 'symbol': 'XBTUSD', 'price': 99.5, 'volume': 0.0, 'side': BUY}
+
+    def test_pad_thinner_asks(self):
+        data = [_item(101.0, 1, SELL), _item(100.5, 2, SELL), _item(100.0, 3, BUY), _item(98.5, 4, BUY)]
+        padded = pad_order_book(data, 0.5)
+        assert [(item['price'], item['volume']) for item in padded[:4]] == [
+            (102.0, 0.0), (101.5, 0.0), (101.0, 1), (100.5, 2)
+        ]
+        assert padded[1] == {**data[0], 'id': None, 'price': 101.5, 'volume': 0.0}
+        assert padded[4:] == data[2:]
+
+    def test_single_side(self):
+        data = [_item(100.0, 4, BUY), _item(99.0, 5, BUY)]
+        assert pad_order_book(data, 0.5) is data
+        assert pad_order_book([], 0.5) == []
+
+    def test_levels(self):
+        prices, volumes = pad_order_book_levels(
+            np.array([0.3, 0.1]), np.array([1.0, 2.0]), 0.1, SELL, span=0.3
+        )
+        assert prices.tolist() == [0.4, 0.3, 0.2, 0.1]
+        assert volumes.tolist() == [0.0, 1.0, 0.0, 2.0]
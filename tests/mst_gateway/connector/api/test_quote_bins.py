@@ -0,0 +1,72 @@
+import pytest
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.utils import json_dumps
+from mst_gateway.connector.api.wss.quote_bins import QuoteBinAggregator
+from .utils import wss_data
+
+
+def _bin(tm, opp, clp, hip, lop, vl, symbol='btcusdt'):
+    return {'tm': tm, 's': symbol, 'opp': opp, 'clp': clp, 'hip': hip, 'lop': lop, 'vl': vl, 'ss': 'btcusd'}
+
+
+class TestQuoteBinAggregator:
+
+    def test_roll_up(self):
+        aggregator = QuoteBinAggregator(['1m', '5m', '1h'])
+        assert aggregator.bin_sizes == {'5m': 5, '1h': 60}
+        data = wss_data('quote_bin', [_bin('2021-12-08T10:03:00.000000', 10.0, 11.0, 12.0, 9.0, 1.0)])
+        aggregator.extend(data)
+        assert [(item['bs'], item['tm']) for item in data['d']] == [
+            ('1m', '2021-12-08T10:03:00.000000'),
+            ('5m', '2021-12-08T10:00:00.000000'),
+            ('1h', '2021-12-08T10:00:00.000000'),
+        ]
+        data = wss_data('quote_bin', [_bin('2021-12-08T10:03:00.000000', 10.0, 13.0, 14.0, 9.0, 2.0)])
+        aggregator.extend(data)
+        data = wss_data('quote_bin', [_bin('2021-12-08T10:04:00.000000', 13.0, 12.0, 13.5, 8.0, 3.0)])
+        aggregator.extend(data)
+        assert data['d'][1] == {
+            'tm': '2021-12-08T10:00:00.000000', 's': 'btcusdt', 'opp': 10.0, 'clp': 12.0, 'hip': 14.0,
+            'lop': 8.0, 'vl': 5.0, 'bs': '5m', 'ss': 'btcusd'
+        }
+        data = wss_data('quote_bin', [_bin('2021-12-08T10:05:00.000000', 12.0, 15.0, 15.0, 11.0, 1.0)])
+        aggregator.extend(data)
+        five, hour = data['d'][1:]
+        assert (five['tm'], five['opp'], five['hip'], five['vl']) == ('2021-12-08T10:05:00.000000', 12.0, 15.0, 1.0)
+        assert (hour['tm'], hour['opp'], hour['lop'], hour['vl']) == ('2021-12-08T10:00:00.000000', 10.0, 8.0, 6.0)
+
+    def test_stale_minute(self):
+        aggregator = QuoteBinAggregator(['5m'])
+        aggregator.extend(wss_data('quote_bin', [_bin('2021-12-08T10:04:00.000000', 1.0, 1.0, 1.0, 1.0, 1.0)]))
+        data = wss_data('quote_bin', [_bin('2021-12-08T10:03:00.000000', 1.0, 1.0, 1.0, 1.0, 1.0)])
+        aggregator.extend(data)
+        assert [item['bs'] for item in data['d']] == ['1m']
+
+
+class TestQuoteBinOutput:
+
+    @pytest.mark.asyncio
+    async def test_binance_kline(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange)
+        api._set_state_data({'btcusdt': {'symbol': 'btcusdt', 'system_symbol': 'btcusd'}})
+        api._subscriptions = {'quote_bin': {'*': {'1'}}}
+        api._start_quote_bin_aggregation(['5m', '1d'])
+        frame = json_dumps({'e': 'kline', 'E': 1638958726119, 's': 'BTCUSDT', 'k': {
+            't': 1638958680000, 'T': 1638958739999, 's': 'BTCUSDT', 'i': '1m',
+            'o': '50200.0', 'c': '50210.0', 'h': '50220.0', 'l': '50190.0', 'v': '2.5', 'x': False
+        }})
+        results = []
+        assert await api.process_messages([frame], results.append)
+        items = results[0][0]['quote_bin']['d']
+        assert [(item['bs'], item['tm'], item['vl']) for item in items] == [
+            ('1m', '2021-12-08T10:18:00.000000', 2.5),
+            ('5m', '2021-12-08T10:15:00.000000', 2.5),
+            ('1d', '2021-12-08T00:00:00.000000', 2.5),
+        ]
+
+    def test_epoch_ms(self):
+        aggregator = QuoteBinAggregator(['5m'])
+        data = wss_data('quote_bin', [_bin(1638958980000, 10.0, 11.0, 12.0, 9.0, 1.0)])
+        aggregator.extend(data)
+        assert [(item['bs'], item['tm']) for item in data['d']] == [('1m', 1638958980000), ('5m', 1638958800000)]
@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+from copy import deepcopy
+from websockets.datastructures import Headers
+from websockets.exceptions import InvalidStatusCode
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.types import OrderSchema
+from mst_gateway.connector.api.wss.reconnect import ReconnectBackoff
+from .binance.data import storage as state_data
+from .utils import FakeConnection
+
+
+def reconnect_api(errors: list = ()) -> BinanceWssApi:
+    api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange,
+                        state_storage=deepcopy(state_data.STORAGE_DATA))
+    api.connections = []
+    errors = list(errors)
+
+    async def _connect(**kwargs):
+        if errors:
+            api.connections.append(None)
+            raise errors.pop(0)
+        api.connections.append(FakeConnection())
+        return api.connections[-1]
+
+    api._connect = _connect
+    return api
+
+
+class TestReconnectBackoff:
+
+    def test_delays(self):
+        backoff = ReconnectBackoff(base=0.5, cap=4, jitter=0)
+        assert [backoff.delay() for _ in range(6)] == [0.5, 1, 2, 4, 4, 4]
+        backoff.reset()
+        assert backoff.delay() == 0.5
+        backoff = ReconnectBackoff(base=1, cap=1, jitter=0.5)
+        assert all(0.5 <= backoff.delay() <= 1 for _ in range(100))
+
+    @pytest.mark.asyncio
+    async def test_open_retries(self):
+        api = reconnect_api([ConnectionRefusedError(), InvalidStatusCode(429, Headers()), asyncio.TimeoutError()])
+        api._start_reconnect(delay=0.001, max_delay=0.004, jitter=0)
+        attempts = 1
+        while not await api._ensure_handler():
+            attempts += 1
+        assert attempts == 4 and api.handler is api.connections[-1]
+        assert api.reconnect_stats['failures'] == 3 and api.reconnect_stats['attempt'] == 0
+        api.handler.closed = True
+        assert await api._ensure_handler()
+        assert api.reconnect_stats['reconnects'] == 1 and api.reconnect_stats['waited'] == pytest.approx(0.008)
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_restore_retries(self):
+        api = reconnect_api()
+        api._start_reconnect(delay=0.001, jitter=0)
+        assert await api._ensure_handler()
+        api.handler.closed = True
+        errors = [InvalidStatusCode(503, Headers())]
+        connect = api._connect
+
+        async def _connect(**kwargs):
+            if errors:
+                raise errors.pop()
+            return await connect(**kwargs)
+
+        api._connect = _connect
+        assert not await api._ensure_handler()
+        assert await api._ensure_handler()
+        assert api.handler is api.connections[-1] and api.reconnect_stats['reconnects'] == 1
+        await api.close()
+
+    @pytest.mark.asyncio
+    async def test_exclusive_modes(self):
+        with pytest.raises(ValueError):
+            await reconnect_api().consume(print, queue_size=10, workers=2)
+
+    @pytest.mark.asyncio
+    async def test_standby_failover(self):
+        api = reconnect_api()
+        api._start_reconnect(delay=10, standby=True)
+        assert await api._ensure_handler()
+        primary = api.handler
+        await asyncio.sleep(0)
+        assert api.reconnect_stats['standby']
+        api.register('1', 'trade', 'btcusdt')
+        primary.closed = True
+        assert await asyncio.wait_for(api._ensure_handler(), 1)
+        assert api.handler is api.connections[1] and api.reconnect_stats['failovers'] == 1
+        await api.command_scheduler.wait()
+        assert api.handler.sent[0]['method'] == 'SUBSCRIBE' and api.handler.sent[0]['params'] == ['btcusdt@trade']
+        await asyncio.sleep(0)
+        assert api.reconnect_stats['standby'] and api.connections[2] is not api.handler
+        await api.close()
+        assert api.connections[2].closed
+
+    @pytest.mark.asyncio
+    async def test_no_standby_for_user_data(self):
+        api = reconnect_api()
+        api.auth_connect = True
+
+        async def _generate_auth_url():
+            pass
+
+        api._generate_auth_url = _generate_auth_url
+        api._start_reconnect(delay=0.001, standby=True)
+        assert await api._ensure_handler()
+        await asyncio.sleep(0)
+        assert len(api.connections) == 1 and not api.reconnect_stats['standby']
+        api.handler.closed = True
+        assert await api._ensure_handler()
+        await asyncio.sleep(0)
+        assert api.handler is api.connections[1] and len(api.connections) == 2
+        assert api.reconnect_stats['reconnects'] == 1 and api.reconnect_stats['failovers'] == 0
+        await api.close()
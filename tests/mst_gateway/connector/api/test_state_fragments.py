@@ -0,0 +1,28 @@
+import pytest
+from mst_gateway.connector.api.stocks.binance import BinanceWssApi
+from mst_gateway.connector.api.types import OrderSchema
+
+
+def _state(system_symbol: str) -> dict:
+    return {'btcusdt': {
+        'symbol': 'btcusdt', 'system_symbol': system_symbol, 'tick': 0.01, 'volume_tick': 0.00001,
+        'pair': ['BTC', 'USDT'], 'created': '2021-12-08T10:18:46.119000', 'extra': {'face_price_data': {}},
+    }}
+
+
+class TestStateFragments:
+
+    def test_compiled_on_load(self):
+        api = BinanceWssApi(name='tbinance', schema=OrderSchema.exchange)
+        api._set_state_data(_state('btcusd'))
+        assert api.get_state_data('BTCUSDT') is api.get_state_data('btcusdt') is api.get_state_data('BtcUsdt')
+        assert api.get_state_data('ethusdt') is None
+        face_price_data, fields = api.get_state_fragment('BTCUSDT')
+        assert face_price_data == {}
+        assert fields['ss'] == 'btcusd' and fields['crt'] == '2021-12-08T10:18:46.119000'
+        with pytest.raises(TypeError):
+            fields['ss'] = 'ethusd'
+        api._set_state_data(_state('xbtusd'))
+        assert api.get_state_fragment('btcusdt')[1]['ss'] == 'xbtusd'
+        api._set_state_data({})
+        assert api.get_state_fragment('BTCUSDT') is None
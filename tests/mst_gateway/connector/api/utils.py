@@ -1,7 +1,37 @@
+import asyncio
+import json
 from mst_gateway.connector.api import BUY, OrderType
 from mst_gateway.connector.api.rest import StockRestApi
 
 
+class FakeConnection:
+    """
+    Websocket connection stand-in, keeps the sent commands and returns the frames put into `frames`
+    """
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+        self.frames = asyncio.Queue()
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+    async def recv(self):
+        return await self.frames.get()
+
+    async def close(self):
+        self.closed = True
+
+
+def wss_data(table: str, items, action: str = 'update') -> dict:
+    return {'acc': 'tbinance', 'tb': table, 'sch': 'exchange', 'act': action, 'd': items}
+
+
+def wss_result(table: str, items, action: str = 'update') -> dict:
+    return {table: wss_data(table, items, action)}
+
+
 def get_order_price(rest: StockRestApi, schema: str, symbol: str, side: int):
     symbol = rest.get_symbol(schema=schema, symbol=symbol)
     if side == BUY: